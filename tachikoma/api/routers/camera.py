@@ -39,6 +39,28 @@ async def rotate_camera(request: CameraRotateRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Multipart part header, prefixed by the CRLF that closes the previous part.
+# Sending it separately from the JPEG avoids concatenating every frame.
+_PART_HEADER = b"\r\n--frame\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n"
+_no_signal_frame: bytes = b""
+
+
+def _get_no_signal_frame() -> bytes:
+    """Small red "No Signal" JPEG, rendered once per process."""
+    global _no_signal_frame
+    if not _no_signal_frame:
+        import cv2
+        import numpy as np
+        no_signal = np.zeros((240, 320, 3), dtype=np.uint8)
+        no_signal[:, :] = [50, 50, 150] # Dark Red
+        cv2.putText(
+            no_signal, "NO SIGNAL", (80, 130), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2
+        )
+        _, buffer = cv2.imencode('.jpg', no_signal)
+        _no_signal_frame = buffer.tobytes()
+    return _no_signal_frame
+
+
 async def gen_frames():
     """Generator for camera frames."""
     robot = get_robot_controller()
@@ -51,36 +73,36 @@ async def gen_frames():
     factory = get_hardware_factory()
     camera_driver = await factory.get_camera()
     
-    # Create a small red "No Signal" JPEG as fallback
-    import cv2
-    import numpy as np
-    no_signal = np.zeros((240, 320, 3), dtype=np.uint8)
-    no_signal[:, :] = [50, 50, 150] # Dark Red
-    cv2.putText(no_signal, "NO SIGNAL", (80, 130), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
-    _, buffer = cv2.imencode('.jpg', no_signal)
-    NO_SIGNAL_FRAME = buffer.tobytes()
+    # Small red "No Signal" JPEG as fallback
+    NO_SIGNAL_FRAME = _get_no_signal_frame()
 
+    # One frame queue per client for the whole stream (Picamera2 fan-out);
+    # the OpenCV path reads the device directly and ignores it.
+    queue = camera_driver.subscribe()
     empty_count = 0
-    while True:
-        try:
-            frame = await camera_driver.get_frame()
-            if frame:
-                empty_count = 0
-                yield (b'--frame\r\n'
-                       b'Content-Type: image/jpeg\r\n\r\n' + frame + b'\r\n')
-            else:
-                empty_count += 1
-                if empty_count > 300: # Approx 3 seconds
-                    # Yield a NO SIGNAL frame periodically to keep connection alive
-                    yield (b'--frame\r\n'
-                           b'Content-Type: image/jpeg\r\n\r\n' + NO_SIGNAL_FRAME + b'\r\n')
-                    
-                    if empty_count % 500 == 0:
-                        logger.warning("camera.stream_stalled", msg="No frames received for 5s")
-            await asyncio.sleep(0.01) # Yield to other tasks
-        except Exception as e:
-            logger.error("camera.feed_error", error=str(e))
-            break
+    try:
+        while True:
+            try:
+                frame = await camera_driver.get_frame(queue)
+                if frame:
+                    empty_count = 0
+                    yield _PART_HEADER % len(frame)
+                    yield frame
+                else:
+                    empty_count += 1
+                    if empty_count > 300: # Approx 3 seconds
+                        # Yield a NO SIGNAL frame periodically to keep connection alive
+                        yield _PART_HEADER % len(NO_SIGNAL_FRAME)
+                        yield NO_SIGNAL_FRAME
+                        
+                        if empty_count % 500 == 0:
+                            logger.warning("camera.stream_stalled", msg="No frames received for 5s")
+                await asyncio.sleep(0.01) # Yield to other tasks
+            except Exception as e:
+                logger.error("camera.feed_error", error=str(e))
+                break
+    finally:
+        camera_driver.unsubscribe(queue)
 
 
 @router.get("/video_feed")
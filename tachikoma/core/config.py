@@ -51,6 +51,9 @@ class Settings(BaseSettings):
         default="INFO", description="Logging level"
     )
     log_file: Path = Field(default=Path("logs/robot.log"), description="Log file path")
+    debug_servo: bool = Field(
+        default=False, description="Enable debug logging in the servo hot path"
+    )
     
     # Redis (optional)
     redis_host: str = Field(default="localhost", description="Redis host")
@@ -73,6 +76,14 @@ class Settings(BaseSettings):
     camera_fps: int = Field(default=30, ge=1, le=60, description="Camera FPS")
     camera_resolution: str = Field(default="640x480", description="Camera resolution")
     
+    # I2C
+    i2c_frequency: int = Field(
+        default=400_000,
+        ge=100_000,
+        le=1_000_000,
+        description="Expected I2C bus clock in Hz (set with dtparam=i2c_arm_baudrate)",
+    )
+    
     # Sensors
     imu_enabled: bool = Field(default=True, description="Enable IMU sensor")
     ultrasonic_enabled: bool = Field(default=True, description="Enable ultrasonic sensor")
@@ -113,3 +124,6 @@ def get_settings() -> Settings:
 
 # Convenience access
 settings = get_settings()
+
+# Read once at import: servo drivers guard hot-path debug logs with it
+DEBUG_SERVO = settings.debug_servo
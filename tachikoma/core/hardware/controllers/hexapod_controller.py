@@ -5,6 +5,32 @@ from tachikoma.core.hardware.interfaces.base import IHardwareComponent, Hardware
 from tachikoma.core.hardware.devices.servo import ServoController
 
 
+_GROUP_1 = ("front_right", "middle_left", "rear_right")
+_GROUP_2 = ("front_left", "middle_right", "rear_left")
+
+
+def _gait_phases(
+    legs: Dict[str, Dict[str, int]],
+    phases: Tuple[Tuple[Tuple[Tuple[str, ...], str, int], ...], ...],
+) -> Tuple[Dict[int, int], ...]:
+    """Résout une fois pour toutes (pattes, articulation, angle) en {servo_id: angle} par phase."""
+    return tuple(
+        {legs[leg][joint]: angle for group, joint, angle in moves for leg in group}
+        for moves in phases
+    )
+
+
+def _wave_moves(
+    leg_order: Tuple[str, ...], hip_angle: int
+) -> Tuple[Tuple[Tuple[Tuple[str, ...], str, int], ...], ...]:
+    """Vague : lever, pivoter puis poser une patte à la fois."""
+    return tuple(
+        (((leg,), joint, angle),)
+        for leg in leg_order
+        for joint, angle in (("knee", 60), ("hip", hip_angle), ("knee", 90))
+    )
+
+
 class HexapodController(IHardwareComponent):
     """Contrôleur principal pour la locomotion de l'hexapode"""
     
@@ -25,6 +51,38 @@ class HexapodController(IHardwareComponent):
         "ankle": 90
     }
     
+    # Marche tripode
+    # Groupe 1: front_right, middle_left, rear_right
+    # Groupe 2: front_left, middle_right, rear_left
+    _TRIPOD_FORWARD = _gait_phases(LEGS, (
+        ((_GROUP_1, "knee", 60),),                       # Lever groupe 1
+        ((_GROUP_1, "hip", 110),),                       # Avancer groupe 1
+        ((_GROUP_1, "knee", 90),),                       # Poser groupe 1
+        ((_GROUP_2, "knee", 60),),                       # Lever groupe 2
+        ((_GROUP_2, "hip", 70), (_GROUP_1, "hip", 90)),  # Avancer 2, reculer 1
+        ((_GROUP_2, "knee", 90),),                       # Poser groupe 2
+    ))
+    # Même logique mais angles inversés
+    _TRIPOD_BACKWARD = _gait_phases(LEGS, (
+        ((_GROUP_1, "knee", 60),),
+        ((_GROUP_1, "hip", 70),),
+        ((_GROUP_1, "knee", 90),),
+        ((_GROUP_2, "knee", 60),),
+        ((_GROUP_2, "hip", 110), (_GROUP_1, "hip", 90)),
+        ((_GROUP_2, "knee", 90),),
+    ))
+    
+    _WAVE_FORWARD = _gait_phases(LEGS, _wave_moves(
+        ("front_right", "middle_right", "rear_right", "rear_left", "middle_left", "front_left"), 110
+    ))
+    _WAVE_BACKWARD = _gait_phases(LEGS, _wave_moves(
+        ("front_left", "middle_left", "rear_left", "rear_right", "middle_right", "front_right"), 70
+    ))
+    
+    # Rotation sur place : les six hanches au même angle
+    _ROTATE_LEFT = _gait_phases(LEGS, (((_GROUP_1 + _GROUP_2, "hip", 110),),))[0]
+    _ROTATE_RIGHT = _gait_phases(LEGS, (((_GROUP_1 + _GROUP_2, "hip", 70),),))[0]
+    
     def __init__(self, servo_controller: Optional[ServoController] = None):
         self.servo = servo_controller
         self.logger = logging.getLogger(__name__)
@@ -65,16 +123,27 @@ class HexapodController(IHardwareComponent):
             self.logger.error(f"Error during cleanup: {e}")
     
     async def reset_position(self) -> bool:
-        if not self.is_available():
+        servo = self.servo
+        if servo is None or not self.is_available():
             return False
         
         try:
-            for leg_name, joints in self.LEGS.items():
-                for joint_name, servo_id in joints.items():
-                    angle = self.NEUTRAL_POSITIONS[joint_name]
-                    self.servo.set_angle(servo_id, angle)
+            # Une écriture bloc par patte, 10ms d'écart entre pattes : limite
+            # le pic de courant quand les 18 servos quittent une position
+            # inconnue. set_angles saute les servos déjà au neutre.
+            ok = True
+            for index, joints in enumerate(self.LEGS.values()):
+                if index:
                     await asyncio.sleep(0.01)
+                ok = servo.set_angles({
+                    servo_id: self.NEUTRAL_POSITIONS[joint_name]
+                    for joint_name, servo_id in joints.items()
+                }) and ok
             
+            if not ok:
+                # Écriture partielle (canal hors plage) : les autres servos
+                # sont au neutre, on signale sans échouer
+                self.logger.warning("Reset position: some servos were skipped")
             self.logger.info("Reset to neutral position")
             return True
         except Exception as e:
@@ -89,12 +158,13 @@ class HexapodController(IHardwareComponent):
         delay = (11 - speed) * 0.05
         
         try:
-            for _ in range(steps):
-                if self._current_gait == "tripod":
-                    await self._tripod_gait_forward(delay)
-                else:
-                    await self._wave_gait_forward(delay)
-            return True
+            if self._current_gait == "tripod":
+                phases = self._TRIPOD_FORWARD
+            else:
+                phases = self._WAVE_FORWARD
+            # Trajectoire entière connue d'avance : une seule échelle
+            # d'échéances sur tous les pas, sans recalage entre deux cycles
+            return await self._play_phases(phases * steps, delay)
         except Exception as e:
             self.logger.error(f"Failed to move forward: {e}")
             return False
@@ -107,12 +177,13 @@ class HexapodController(IHardwareComponent):
         delay = (11 - speed) * 0.05
         
         try:
-            for _ in range(steps):
-                if self._current_gait == "tripod":
-                    await self._tripod_gait_backward(delay)
-                else:
-                    await self._wave_gait_backward(delay)
-            return True
+            if self._current_gait == "tripod":
+                phases = self._TRIPOD_BACKWARD
+            else:
+                phases = self._WAVE_BACKWARD
+            # Trajectoire entière connue d'avance : une seule échelle
+            # d'échéances sur tous les pas, sans recalage entre deux cycles
+            return await self._play_phases(phases * steps, delay)
         except Exception as e:
             self.logger.error(f"Failed to move backward: {e}")
             return False
@@ -124,9 +195,13 @@ class HexapodController(IHardwareComponent):
         try:
             # Rotation sur place
             steps = int(angle / 15)
+            delay = (11 - (speed or self._speed)) * 0.05
+            deadline = asyncio.get_running_loop().time()
             for _ in range(steps):
-                await self._rotate_left_step()
-                await asyncio.sleep((11 - (speed or self._speed)) * 0.05)
+                if not await self._rotate_left_step():
+                    self.logger.warning("Rotate step partially written")
+                deadline += delay
+                await self._sleep_until(deadline)
             return True
         except Exception as e:
             self.logger.error(f"Failed to turn left: {e}")
@@ -138,115 +213,50 @@ class HexapodController(IHardwareComponent):
         
         try:
             steps = int(angle / 15)
+            delay = (11 - (speed or self._speed)) * 0.05
+            deadline = asyncio.get_running_loop().time()
             for _ in range(steps):
-                await self._rotate_right_step()
-                await asyncio.sleep((11 - (speed or self._speed)) * 0.05)
+                if not await self._rotate_right_step():
+                    self.logger.warning("Rotate step partially written")
+                deadline += delay
+                await self._sleep_until(deadline)
             return True
         except Exception as e:
             self.logger.error(f"Failed to turn right: {e}")
             return False
     
-    async def _tripod_gait_forward(self, delay: float) -> None:
-        # Groupe 1: front_right, middle_left, rear_right
-        # Groupe 2: front_left, middle_right, rear_left
+    async def _play_phases(self, phases: Tuple[Dict[int, int], ...], delay: float) -> bool:
+        """Envoie chaque phase précalculée en une passe, puis attend delay.
         
-        # Lever groupe 1
-        for leg in ["front_right", "middle_left", "rear_right"]:
-            self.servo.set_angle(self.LEGS[leg]["knee"], 60)
-        await asyncio.sleep(delay)
-        
-        # Avancer groupe 1
-        for leg in ["front_right", "middle_left", "rear_right"]:
-            self.servo.set_angle(self.LEGS[leg]["hip"], 110)
-        await asyncio.sleep(delay)
-        
-        # Poser groupe 1
-        for leg in ["front_right", "middle_left", "rear_right"]:
-            self.servo.set_angle(self.LEGS[leg]["knee"], 90)
-        await asyncio.sleep(delay)
-        
-        # Lever groupe 2
-        for leg in ["front_left", "middle_right", "rear_left"]:
-            self.servo.set_angle(self.LEGS[leg]["knee"], 60)
-        await asyncio.sleep(delay)
-        
-        # Avancer groupe 2 et reculer groupe 1
-        for leg in ["front_left", "middle_right", "rear_left"]:
-            self.servo.set_angle(self.LEGS[leg]["hip"], 70)
-        for leg in ["front_right", "middle_left", "rear_right"]:
-            self.servo.set_angle(self.LEGS[leg]["hip"], 90)
-        await asyncio.sleep(delay)
-        
-        # Poser groupe 2
-        for leg in ["front_left", "middle_right", "rear_left"]:
-            self.servo.set_angle(self.LEGS[leg]["knee"], 90)
-        await asyncio.sleep(delay)
-    
-    async def _tripod_gait_backward(self, delay: float) -> None:
-        # Même logique mais angles inversés
-        for leg in ["front_right", "middle_left", "rear_right"]:
-            self.servo.set_angle(self.LEGS[leg]["knee"], 60)
-        await asyncio.sleep(delay)
-        
-        for leg in ["front_right", "middle_left", "rear_right"]:
-            self.servo.set_angle(self.LEGS[leg]["hip"], 70)
-        await asyncio.sleep(delay)
-        
-        for leg in ["front_right", "middle_left", "rear_right"]:
-            self.servo.set_angle(self.LEGS[leg]["knee"], 90)
-        await asyncio.sleep(delay)
-        
-        for leg in ["front_left", "middle_right", "rear_left"]:
-            self.servo.set_angle(self.LEGS[leg]["knee"], 60)
-        await asyncio.sleep(delay)
-        
-        for leg in ["front_left", "middle_right", "rear_left"]:
-            self.servo.set_angle(self.LEGS[leg]["hip"], 110)
-        for leg in ["front_right", "middle_left", "rear_right"]:
-            self.servo.set_angle(self.LEGS[leg]["hip"], 90)
-        await asyncio.sleep(delay)
-        
-        for leg in ["front_left", "middle_right", "rear_left"]:
-            self.servo.set_angle(self.LEGS[leg]["knee"], 90)
-        await asyncio.sleep(delay)
-    
-    async def _wave_gait_forward(self, delay: float) -> None:
-        # Vague : une patte à la fois
-        leg_order = ["front_right", "middle_right", "rear_right", 
-                     "rear_left", "middle_left", "front_left"]
-        
-        for leg in leg_order:
-            self.servo.set_angle(self.LEGS[leg]["knee"], 60)
-            await asyncio.sleep(delay)
-            self.servo.set_angle(self.LEGS[leg]["hip"], 110)
-            await asyncio.sleep(delay)
-            self.servo.set_angle(self.LEGS[leg]["knee"], 90)
-            await asyncio.sleep(delay)
+        Une phase partiellement écrite (canal hors plage) est signalée et
+        la marche continue ; seule une erreur de bus l'interrompt, via
+        l'exception propagée à l'appelant.
+        """
+        if self.servo is None:
+            return False
+        set_angles = self.servo.set_angles
+        deadline = asyncio.get_running_loop().time()
+        for phase in phases:
+            if not set_angles(phase):
+                self.logger.warning("Gait phase partially written")
+            deadline += delay
+            await self._sleep_until(deadline)
+        return True
     
-    async def _wave_gait_backward(self, delay: float) -> None:
-        leg_order = ["front_left", "middle_left", "rear_left",
-                     "rear_right", "middle_right", "front_right"]
+    @staticmethod
+    async def _sleep_until(deadline: float) -> None:
+        """Attend une échéance absolue de l'horloge monotone de la boucle.
         
-        for leg in leg_order:
-            self.servo.set_angle(self.LEGS[leg]["knee"], 60)
-            await asyncio.sleep(delay)
-            self.servo.set_angle(self.LEGS[leg]["hip"], 70)
-            await asyncio.sleep(delay)
-            self.servo.set_angle(self.LEGS[leg]["knee"], 90)
-            await asyncio.sleep(delay)
+        La durée des écritures I2C et le retard du réveil précédent sont
+        absorbés par la phase suivante au lieu de s'accumuler.
+        """
+        await asyncio.sleep(max(0.0, deadline - asyncio.get_running_loop().time()))
     
-    async def _rotate_left_step(self) -> None:
-        # Rotation sur place vers la gauche
-        for leg in ["front_right", "middle_right", "rear_right"]:
-            self.servo.set_angle(self.LEGS[leg]["hip"], 110)
-        for leg in ["front_left", "middle_left", "rear_left"]:
-            self.servo.set_angle(self.LEGS[leg]["hip"], 110)
+    async def _rotate_left_step(self) -> bool:
+        return self.servo is not None and self.servo.set_angles(self._ROTATE_LEFT)
     
-    async def _rotate_right_step(self) -> None:
-        for leg in ["front_right", "middle_right", "rear_right"]:
-            self.servo.set_angle(self.LEGS[leg]["hip"], 70)
-        for leg in ["front_left", "middle_left", "rear_left"]:
-            self.servo.set_angle(self.LEGS[leg]["hip"], 70)
+    async def _rotate_right_step(self) -> bool:
+        return self.servo is not None and self.servo.set_angles(self._ROTATE_RIGHT)
     
     def set_gait(self, gait: str) -> bool:
         if gait in ["tripod", "wave"]:
@@ -1,8 +1,13 @@
-from tachikoma.core.hardware.devices.servo import ServoController
-from tachikoma.core.hardware.devices.ultrasonic import UltrasonicSensor
-from tachikoma.core.hardware.devices.led import LEDStrip
-from tachikoma.core.hardware.devices.buzzer import Buzzer
-from tachikoma.core.hardware.devices.camera import Camera
+from importlib import import_module
+
+# Devices importés à la demande (voir drivers/__init__.py)
+_DEVICES = {
+    "ServoController": ".servo",
+    "UltrasonicSensor": ".ultrasonic",
+    "LEDStrip": ".led",
+    "Buzzer": ".buzzer",
+    "Camera": ".camera",
+}
 
 __all__ = [
     "ServoController",
@@ -11,3 +16,11 @@ __all__ = [
     "Buzzer",
     "Camera"
 ]
+
+
+def __getattr__(name: str):
+    if name not in _DEVICES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_DEVICES[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -2,6 +2,11 @@ import logging
 from typing import Optional, Dict, Any
 import numpy as np
 from tachikoma.core.hardware.interfaces.base import IHardwareComponent, HardwareStatus
+from tachikoma.core.hardware.drivers.camera import (
+    acquire_shared_camera,
+    release_shared_camera,
+    start_shared_picamera,
+)
 
 try:
     from picamera2 import Picamera2
@@ -28,18 +33,20 @@ class Camera(IHardwareComponent):
         self._status = HardwareStatus.UNINITIALIZED
         self._using_picamera = False
     
+    @property
+    def _opencv_key(self) -> str:
+        return f"opencv:{self.camera_index}"
+    
     async def initialize(self) -> bool:
         self._status = HardwareStatus.INITIALIZING
         
         # Try Picamera2 first
         if PICAMERA_AVAILABLE:
             try:
-                self._camera = Picamera2()
-                config = self._camera.create_preview_configuration(
-                    main={"size": (self.width, self.height)}
+                self._camera = acquire_shared_camera("picamera2", Picamera2)
+                start_shared_picamera(
+                    self._camera, (self.width, self.height), (self.width // 2, self.height // 2)
                 )
-                self._camera.configure(config)
-                self._camera.start()
                 
                 self._using_picamera = True
                 self._status = HardwareStatus.READY
@@ -48,11 +55,16 @@ class Camera(IHardwareComponent):
                 
             except Exception as e:
                 self.logger.warning(f"Failed to initialize Picamera2: {e}")
+                if self._camera is not None:
+                    release_shared_camera("picamera2", lambda cam: cam.close())
+                    self._camera = None
         
         # Fallback to OpenCV
         if CV2_AVAILABLE:
             try:
-                self._camera = cv2.VideoCapture(self.camera_index)
+                self._camera = acquire_shared_camera(
+                    self._opencv_key, lambda: cv2.VideoCapture(self.camera_index)
+                )
                 self._camera.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
                 self._camera.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
                 
@@ -66,6 +78,9 @@ class Camera(IHardwareComponent):
                 
             except Exception as e:
                 self.logger.error(f"Failed to initialize OpenCV camera: {e}")
+                if self._camera is not None:
+                    release_shared_camera(self._opencv_key, lambda cap: cap.release())
+                    self._camera = None
         
         self._status = HardwareStatus.ERROR
         self.logger.error("No camera available")
@@ -75,9 +90,9 @@ class Camera(IHardwareComponent):
         try:
             if self._camera:
                 if self._using_picamera:
-                    self._camera.stop()
+                    release_shared_camera("picamera2", lambda cam: cam.close())
                 else:
-                    self._camera.release()
+                    release_shared_camera(self._opencv_key, lambda cap: cap.release())
             
             self._camera = None
             self._status = HardwareStatus.DISCONNECTED
@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Mapping
 from tachikoma.core.hardware.interfaces.base import IHardwareComponent, HardwareStatus
 from tachikoma.core.hardware.drivers.pca9685 import PCA9685
 
@@ -18,6 +18,9 @@ class ServoController(IHardwareComponent):
         
         # Positions actuelles des servos
         self._positions: Dict[int, float] = {}
+        
+        # Compteur PWM par angle entier, construit à initialize()
+        self._count_lut: List[int] = []
     
     async def initialize(self) -> bool:
         try:
@@ -30,9 +33,11 @@ class ServoController(IHardwareComponent):
             if not self.pwm.is_available():
                 raise Exception("PWM driver not available")
             
-            # Initialiser tous les servos à position neutre
-            for i in range(16):
-                self.set_angle(i, 90)
+            # servo_min/servo_max sont figés à partir d'ici
+            self._count_lut = [self._angle_to_count(a) for a in range(181)]
+            
+            # Initialiser tous les servos à position neutre (une écriture ALL_LED)
+            self._home_all()
             
             self._status = HardwareStatus.READY
             self.logger.info("Servo controller initialized")
@@ -45,9 +50,9 @@ class ServoController(IHardwareComponent):
     
     async def cleanup(self) -> None:
         try:
-            # Retour position neutre
-            for i in range(16):
-                self.set_angle(i, 90)
+            # Retour position neutre (une écriture ALL_LED)
+            if self.pwm:
+                self._home_all()
             
             if self.pwm:
                 await self.pwm.cleanup()
@@ -56,15 +61,35 @@ class ServoController(IHardwareComponent):
         except Exception as e:
             self.logger.error(f"Error during cleanup: {e}")
     
+    def _pulse_to_count(self, pulse: int) -> int:
+        """Convertit une impulsion (µs) en compteur 12 bits à 50Hz (cf. set_servo_pulse)."""
+        return int(pulse * (4096 / 20000.0))
+    
+    def _angle_to_count(self, angle: float) -> int:
+        pulse = self.servo_min + (angle / 180.0) * (self.servo_max - self.servo_min)
+        return self._pulse_to_count(int(pulse))
+    
+    def _home_all(self) -> None:
+        """Place les 16 servos à 90° en une seule écriture sur les registres ALL_LED."""
+        count = self._count_lut[90] if self._count_lut else self._angle_to_count(90)
+        self.pwm.set_all_pwm_sync(0, count)
+        self._positions = dict.fromkeys(range(16), 90)
+    
     def set_angle(self, channel: int, angle: float) -> bool:
         try:
             # Limiter l'angle
             angle = max(0, min(180, angle))
             
-            # Convertir angle en pulse (500-2500µs)
-            pulse = self.servo_min + (angle / 180.0) * (self.servo_max - self.servo_min)
+            # Angle déjà commandé : aucune écriture I2C
+            if self._positions.get(channel) == angle:
+                return True
             
-            self.pwm.set_servo_pulse(channel, int(pulse))
+            # Angle -> compteur : table pour les angles entiers
+            if type(angle) is int and self._count_lut:
+                count = self._count_lut[angle]
+            else:
+                count = self._angle_to_count(angle)
+            self.pwm.set_pwm_sync(channel, 0, count)
             self._positions[channel] = angle
             
             return True
@@ -72,9 +97,40 @@ class ServoController(IHardwareComponent):
             self.logger.error(f"Failed to set servo {channel} angle: {e}")
             return False
     
+    def set_angles(self, angles: Mapping[int, float]) -> bool:
+        """Positionne plusieurs servos en écritures bloc (canaux contigus groupés).
+        
+        Les canaux hors 0-15 sont ignorés et signalés ; les autres sont
+        tout de même écrits. Retourne False si au moins un canal a été
+        ignoré. Une erreur de bus est propagée à l'appelant.
+        """
+        ok = True
+        values = []
+        updates = {}
+        lut = self._count_lut
+        for channel, angle in angles.items():
+            if not 0 <= channel < 16:
+                self.logger.error(f"Failed to set servo {channel} angle: channel must be 0-15")
+                ok = False
+                continue
+            angle = max(0, min(180, angle))
+            if self._positions.get(channel) == angle:
+                continue
+            count = lut[angle] if type(angle) is int and lut else self._angle_to_count(angle)
+            values.append((channel, 0, count))
+            updates[channel] = angle
+        
+        if not values:
+            return ok
+        self.pwm.set_pwm_bulk_sync(values)
+        self._positions.update(updates)
+        return ok
+    
     def set_pulse(self, channel: int, pulse: int) -> bool:
         try:
-            self.pwm.set_servo_pulse(channel, pulse)
+            self.pwm.set_pwm_sync(channel, 0, self._pulse_to_count(pulse))
+            # L'angle mémorisé ne correspond plus : le prochain set_angle écrit
+            self._positions.pop(channel, None)
             return True
         except Exception as e:
             self.logger.error(f"Failed to set servo {channel} pulse: {e}")
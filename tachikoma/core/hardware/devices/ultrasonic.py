@@ -1,4 +1,16 @@
+"""Capteur de distance ultrasonique HC-SR04 (RPi.GPIO ou pigpio).
+
+Une seule classe pilote les deux backends : pigpio quand pigpiod répond
+(impulsion trigger et fronts d'écho horodatés par le démon), sinon RPi.GPIO
+(impulsion en attente active, fronts horodatés dans un callback BOTH).
+
+À ne pas confondre avec drivers.ultrasonic.UltrasonicSensor (gpiozero),
+utilisé par HardwareFactory : son get_distance() est une coroutine qui
+renvoie 0.0 en cas d'échec. Ici get_distance() est synchrone et renvoie
+None quand il n'y a pas d'écho, ce qui le distingue d'une mesure réelle.
+"""
 import logging
+import threading
 import time
 from typing import Optional, Dict, Any
 from tachikoma.core.config import settings
@@ -10,22 +22,88 @@ if not settings.MOCK_HARDWARE:
         GPIO_AVAILABLE = True
     except ImportError:
         GPIO_AVAILABLE = False
+    try:
+        import pigpio
+    except ImportError:
+        pigpio = None
 else:
     GPIO = None
     GPIO_AVAILABLE = False
+    pigpio = None
 
 
 class UltrasonicSensor(IHardwareComponent):
     """Capteur de distance ultrasonique HC-SR04"""
     
-    def __init__(self, trigger_pin: int = 27, echo_pin: int = 22):
+    def __init__(self, trigger_pin: int = 27, echo_pin: int = 22, use_pigpio: bool = True):
         self.trigger_pin = trigger_pin
         self.echo_pin = echo_pin
+        self.use_pigpio = use_pigpio
         self.logger = logging.getLogger(__name__)
         self._status = HardwareStatus.UNINITIALIZED
         self._last_distance: Optional[float] = None
+        
+        # Backend pigpio : fronts horodatés par le démon (résolution 1µs)
+        self._pi = None
+        self._edge_cb = None
+        self._rise_tick: Optional[int] = None
+        self._fall_tick: Optional[int] = None
+        self._echo_done = threading.Event()
+        
+        # Backend RPi.GPIO : fronts horodatés (monotonic_ns) dans le callback
+        self._edge_detect = False
+        self._rise_ns: Optional[int] = None
+        self._fall_ns: Optional[int] = None
+    
+    def _init_pigpio(self) -> bool:
+        """Connecte pigpiod et enregistre le callback d'écho ; False si indisponible"""
+        pi = pigpio.pi()
+        if not pi.connected:
+            return False
+        
+        pi.set_mode(self.trigger_pin, pigpio.OUTPUT)
+        pi.set_mode(self.echo_pin, pigpio.INPUT)
+        pi.write(self.trigger_pin, 0)
+        self._edge_cb = pi.callback(self.echo_pin, pigpio.EITHER_EDGE, self._on_echo_edge)
+        self._pi = pi
+        return True
+    
+    def _on_echo_edge(self, gpio: int, level: int, tick: int) -> None:
+        """Callback pigpio (thread du démon) : mémorise les ticks de l'écho"""
+        if level == 1:
+            self._rise_tick = tick
+        elif level == 0 and self._rise_tick is not None:
+            self._fall_tick = tick
+            self._echo_done.set()
+    
+    def _on_gpio_edge(self, channel: int) -> None:
+        """Callback RPi.GPIO (thread d'événements) : horodate chaque front.
+        
+        Le niveau n'est pas relu (il a pu déjà changer pour un écho court) :
+        après l'impulsion trigger, le premier front est la montée, le
+        second la descente.
+        """
+        now = time.monotonic_ns()
+        if self._rise_ns is None:
+            self._rise_ns = now
+        elif self._fall_ns is None:
+            self._fall_ns = now
+            self._echo_done.set()
     
     async def initialize(self) -> bool:
+        if pigpio is not None and self.use_pigpio:
+            try:
+                if self._init_pigpio():
+                    self._status = HardwareStatus.READY
+                    self.logger.info(
+                        f"Ultrasonic sensor initialized with pigpio "
+                        f"(trigger={self.trigger_pin}, echo={self.echo_pin})"
+                    )
+                    return True
+                self.logger.warning("pigpiod not reachable, falling back to RPi.GPIO")
+            except Exception as e:
+                self.logger.warning(f"pigpio init failed, falling back to RPi.GPIO: {e}")
+        
         if not GPIO_AVAILABLE:
             self.logger.error("RPi.GPIO not available")
             self._status = HardwareStatus.ERROR
@@ -44,6 +122,11 @@ class UltrasonicSensor(IHardwareComponent):
             GPIO.output(self.trigger_pin, GPIO.LOW)
             time.sleep(0.1)
             
+            # Un seul détecteur pour les deux fronts : rien à réarmer entre
+            # la montée et la descente, un écho court n'est pas manqué
+            GPIO.add_event_detect(self.echo_pin, GPIO.BOTH, callback=self._on_gpio_edge)
+            self._edge_detect = True
+            
             self._status = HardwareStatus.READY
             self.logger.info(f"Ultrasonic sensor initialized (trigger={self.trigger_pin}, echo={self.echo_pin})")
             return True
@@ -54,7 +137,22 @@ class UltrasonicSensor(IHardwareComponent):
             return False
     
     async def cleanup(self) -> None:
+        if self._pi is not None:
+            try:
+                self._edge_cb.cancel()
+                self._pi.write(self.trigger_pin, 0)
+                self._pi.stop()
+            except Exception as e:
+                self.logger.error(f"Error during cleanup: {e}")
+            self._pi = None
+            self._edge_cb = None
+            self._status = HardwareStatus.DISCONNECTED
+            return
+        
         try:
+            if self._edge_detect:
+                GPIO.remove_event_detect(self.echo_pin)
+                self._edge_detect = False
             GPIO.output(self.trigger_pin, GPIO.LOW)
             GPIO.cleanup([self.trigger_pin, self.echo_pin])
             self._status = HardwareStatus.DISCONNECTED
@@ -65,52 +163,74 @@ class UltrasonicSensor(IHardwareComponent):
         if not self.is_available():
             return None
         
+        if self._pi is not None:
+            return self._get_distance_pigpio(timeout)
+        
         try:
-            # Send trigger pulse
+            self._rise_ns = None
+            self._fall_ns = None
+            self._echo_done.clear()
+            
+            # Send trigger pulse : attente active de 10µs, time.sleep()
+            # rend la main à l'ordonnanceur et peut durer plusieurs ms
+            pulse_end_ns = time.monotonic_ns() + 10_000
             GPIO.output(self.trigger_pin, GPIO.HIGH)
-            time.sleep(0.00001)  # 10µs pulse
+            while time.monotonic_ns() < pulse_end_ns:
+                pass
             GPIO.output(self.trigger_pin, GPIO.LOW)
             
-            # Wait for echo
-            start_time = time.time()
-            pulse_start = start_time
-            pulse_end = start_time
+            # Les deux fronts sont horodatés par _on_gpio_edge ; seule la
+            # fin de mesure est attendue ici
+            if not self._echo_done.wait(timeout):
+                return None
             
-            # Wait for echo start
-            while GPIO.input(self.echo_pin) == GPIO.LOW:
-                pulse_start = time.time()
-                if pulse_start - start_time > timeout:
-                    return None
+            # Calculate distance (aller-retour à 34300 cm/s)
+            distance = (self._fall_ns - self._rise_ns) * 34300 / 2 / 1e9  # cm
             
-            # Wait for echo end
-            while GPIO.input(self.echo_pin) == GPIO.HIGH:
-                pulse_end = time.time()
-                if pulse_end - start_time > timeout:
-                    return None
+            return self._accept(distance)
             
-            # Calculate distance
-            pulse_duration = pulse_end - pulse_start
-            distance = (pulse_duration * 34300) / 2  # cm
+        except Exception as e:
+            self.logger.error(f"Failed to read distance: {e}")
+            return None
+    
+    def _get_distance_pigpio(self, timeout: float) -> Optional[float]:
+        """Mesure via pigpio : impulsion trigger matérielle et ticks du démon"""
+        try:
+            self._rise_tick = None
+            self._fall_tick = None
+            self._echo_done.clear()
             
-            # Filter invalid readings
-            if 2 <= distance <= 400:
-                self._last_distance = distance
-                return distance
+            # Impulsion de 10µs générée par pigpiod
+            self._pi.gpio_trigger(self.trigger_pin, 10, 1)
+            if not self._echo_done.wait(timeout):
+                return None
             
-            return None
+            pulse_us = pigpio.tickDiff(self._rise_tick, self._fall_tick)
+            return self._accept(pulse_us * 34300 / 2 / 1e6)  # cm
             
         except Exception as e:
             self.logger.error(f"Failed to read distance: {e}")
             return None
     
+    def _accept(self, distance: float) -> Optional[float]:
+        """Filtre les mesures hors plage HC-SR04 (2-400 cm)"""
+        if 2 <= distance <= 400:
+            self._last_distance = distance
+            return distance
+        return None
+    
     def is_available(self) -> bool:
-        return GPIO_AVAILABLE and self._status == HardwareStatus.READY
+        return (
+            (self._pi is not None or GPIO_AVAILABLE)
+            and self._status == HardwareStatus.READY
+        )
     
     def get_status(self) -> Dict[str, Any]:
         return {
             "type": "ultrasonic",
             "trigger_pin": self.trigger_pin,
             "echo_pin": self.echo_pin,
+            "backend": "pigpio" if self._pi is not None else "RPi.GPIO",
             "status": self._status.value,
             "available": self.is_available(),
             "last_distance": self._last_distance
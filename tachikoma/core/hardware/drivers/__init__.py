@@ -1,15 +1,21 @@
-"""Package des drivers matériels modernes pour le robot hexapode."""
+"""Package des drivers matériels modernes pour le robot hexapode.
 
-# Drivers de base
-from .adc import ADC
-from .imu import MPU6050
-from .ultrasonic import UltrasonicSensor
-from .camera import CameraDriver
+Les drivers sont importés à la demande : importer un driver ne charge pas
+les dépendances des autres (picamera2/OpenCV, numpy, gpiozero...).
+"""
+from importlib import import_module
 
-# Drivers servo
-from .pca9685 import PCA9685
-from .pca9685_servo import PCA9685ServoController
-from .mock_servo import MockServoController
+_DRIVERS = {
+    # Drivers de base
+    "ADC": ".adc",
+    "MPU6050": ".imu",
+    "UltrasonicSensor": ".ultrasonic",
+    "CameraDriver": ".camera",
+    # Drivers servo
+    "PCA9685": ".pca9685",
+    "PCA9685ServoController": ".pca9685_servo",
+    "MockServoController": ".mock_servo",
+}
 
 __all__ = [
     # Drivers de base
@@ -23,3 +29,11 @@ __all__ = [
     "UltrasonicSensor",
     "CameraDriver",
 ]
+
+
+def __getattr__(name: str):
+    if name not in _DRIVERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_DRIVERS[name], __name__), name)
+    globals()[name] = value
+    return value
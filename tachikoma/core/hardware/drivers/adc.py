@@ -23,10 +23,16 @@ class ADC(IHardwareComponent):
         """
         self._i2c = i2c
         self._address = address
+        self._address_hex = f"0x{address:02x}"  # status/logs, formaté une fois
         self.logger = logging.getLogger(__name__)
         self._status = HardwareStatus.UNINITIALIZED
         self._voltage_coefficient = 3.0  # Ratio du diviseur de tension sur le PCB
         self._ref_voltage = 5.0          # Tension de référence
+        # Tension batterie pour chacune des 256 valeurs brutes 8 bits
+        self._voltage_lut: Tuple[float, ...] = tuple(
+            (raw / 255.0) * self._ref_voltage * self._voltage_coefficient
+            for raw in range(256)
+        )
     
     async def initialize(self) -> bool:
         """Initialise le driver ADC."""
@@ -38,7 +44,7 @@ class ADC(IHardwareComponent):
             result = self._i2c.read_byte_data(self._address, 0x00)
             
             self._status = HardwareStatus.READY
-            self.logger.info(f"ADS7830 initialized at 0x{self._address:02x}")
+            self.logger.info(f"ADS7830 initialized at {self._address_hex}")
             return True
             
         except Exception as e:
@@ -68,13 +74,12 @@ class ADC(IHardwareComponent):
             # Calcul de la commande pour le canal spécifié (Logique legacy ADS7830)
             command_set = self.ADS7830_COMMAND | ((((channel << 2) | (channel >> 1)) & 0x07) << 4)
             
-            # Ecrire la commande
-            self._i2c.write_byte(self._address, command_set)
-            
-            # Lecture stable (deux lectures consécutives identiques pour filtrer le bruit)
-            # Sur I2C, la lecture brute renvoie la valeur convertie
-            val1 = self._i2c.read_byte(self._address)
-            val2 = self._i2c.read_byte(self._address)
+            # Lecture stable (deux conversions consécutives pour filtrer le bruit).
+            # read_byte_data envoie la commande puis relit la conversion après
+            # un repeated start : une transaction par conversion au lieu
+            # d'une écriture et deux lectures séparées
+            val1 = self._i2c.read_byte_data(self._address, command_set)
+            val2 = self._i2c.read_byte_data(self._address, command_set)
             
             return val2 if val1 == val2 else val1
             
@@ -92,8 +97,8 @@ class ADC(IHardwareComponent):
         v1_raw = await self.read_channel(0)
         v2_raw = await self.read_channel(4)
         
-        v1 = (v1_raw / 255.0) * self._ref_voltage * self._voltage_coefficient if v1_raw is not None else 0.0
-        v2 = (v2_raw / 255.0) * self._ref_voltage * self._voltage_coefficient if v2_raw is not None else 0.0
+        v1 = self._voltage_lut[v1_raw] if v1_raw is not None else 0.0
+        v2 = self._voltage_lut[v2_raw] if v2_raw is not None else 0.0
         
         return v1, v2
     
@@ -105,7 +110,7 @@ class ADC(IHardwareComponent):
         """Retourne le statut de l'ADC."""
         return {
             "type": "ads7830",
-            "address": f"0x{self._address:02x}",
+            "address": self._address_hex,
             "status": self._status.value,
             "available": self.is_available()
         }
@@ -1,13 +1,18 @@
 """Camera driver using Picamera2."""
 import asyncio
 import io
+import shutil
+import subprocess
 import time
 import structlog
-from typing import Optional, Dict, Any, Tuple
-from threading import Condition
+from typing import Optional, Dict, Any, Set, Tuple, Callable
+from threading import Event, Lock, Thread
+
+import numpy as np
 
 try:
     from picamera2 import Picamera2, Preview
+    from picamera2 import MappedArray
     from picamera2.encoders import JpegEncoder
     from libcamera import Transform
     HAS_PICAMERA = True
@@ -24,18 +29,175 @@ from tachikoma.core.hardware.interfaces.base import IHardwareComponent, Hardware
 
 logger = structlog.get_logger()
 
+# One camera handle per device for the whole process: a second Picamera2()
+# on the same sensor fails (or reallocates every DMA buffer), so all camera
+# classes go through acquire/release below. Keys are "picamera2" or
+# "opencv:<index>".
+_shared_lock = Lock()
+_shared_cameras: Dict[str, Any] = {}
+_shared_refcounts: Dict[str, int] = {}
+# Picamera2 handles already configured by start_shared_picamera()
+_shared_configured: Set[str] = set()
+# Encoders running on a shared camera, one per backend: start_recording()
+# can only run once per handle, so every streaming user attaches to it.
+_shared_recordings: Dict[str, "_RecordingFanout"] = {}
+
+
+def acquire_shared_camera(backend: str, opener: Callable[[], Any]) -> Any:
+    """Return the process-wide camera for `backend`, opening it on first use."""
+    with _shared_lock:
+        camera = _shared_cameras.get(backend)
+        if camera is None:
+            camera = opener()
+            _shared_cameras[backend] = camera
+            _shared_refcounts[backend] = 0
+        _shared_refcounts[backend] += 1
+        return camera
+
+
+def release_shared_camera(backend: str, closer: Callable[[Any], None]) -> None:
+    """Drop one reference to the shared camera, closing it with the last one."""
+    with _shared_lock:
+        camera = _shared_cameras.get(backend)
+        if camera is None:
+            return
+        _shared_refcounts[backend] -= 1
+        if _shared_refcounts[backend] > 0:
+            return
+        del _shared_cameras[backend]
+        del _shared_refcounts[backend]
+        _shared_configured.discard(backend)
+        _shared_recordings.pop(backend, None)
+    closer(camera)
+
+
+def start_shared_picamera(
+    camera: Any,
+    resolution: Tuple[int, int],
+    lores_size: Tuple[int, int],
+    transform: Any = None
+) -> bool:
+    """Configure the shared Picamera2 on first use, then make sure it runs.
+
+    This is the only place the shared camera gets configured, so every
+    user sees the same streams: main at the first caller's resolution and
+    the YUV420 lores stream capture_gray() reads. Returns True when this
+    call did the configuration.
+    """
+    with _shared_lock:
+        configured = False
+        if "picamera2" not in _shared_configured:
+            camera.configure(camera.create_preview_configuration(
+                main={"size": resolution},
+                lores={"size": lores_size, "format": "YUV420"},
+                transform=transform,
+                # Preview default, pinned: the JPEG encoder, a capture_gray()
+                # request and the next frame need 3 buffers in flight
+                buffer_count=4
+            ))
+            _shared_configured.add("picamera2")
+            configured = True
+        if not camera.started:
+            camera.start()
+        return configured
+
+
+def stop_shared_camera(backend: str, stopper: Callable[[Any], None]) -> bool:
+    """Stop the shared camera unless another user still holds a reference."""
+    with _shared_lock:
+        camera = _shared_cameras.get(backend)
+        if camera is None or _shared_refcounts[backend] > 1:
+            return False
+        stopper(camera)
+        return True
+
+
+class _RecordingFanout(io.BufferedIOBase):
+    """Encoder output shared by every streaming user of one camera.
+
+    The encoder thread is the only writer; attach/detach swap in a new
+    tuple, so write() iterates without taking the lock.
+    """
+    def __init__(self):
+        self.outputs: Tuple[io.BufferedIOBase, ...] = ()
+
+    def write(self, buf: bytes) -> int:
+        for output in self.outputs:
+            output.write(buf)
+        return len(buf)
+
+
+def start_shared_recording(
+    backend: str,
+    output: io.BufferedIOBase,
+    starter: Callable[[io.BufferedIOBase], None]
+) -> bool:
+    """Attach `output` to the camera's encoder, starting it for the first user.
+
+    `starter` receives the fan-out the encoder must write to. Returns True
+    when this call started the encoder.
+    """
+    with _shared_lock:
+        fanout = _shared_recordings.get(backend)
+        started = fanout is None
+        if started:
+            fanout = _RecordingFanout()
+            starter(fanout)
+            _shared_recordings[backend] = fanout
+        if output not in fanout.outputs:
+            fanout.outputs += (output,)
+        return started
+
+
+def stop_shared_recording(
+    backend: str,
+    output: io.BufferedIOBase,
+    stopper: Callable[[], None]
+) -> bool:
+    """Detach `output`, stopping the encoder when the last streaming user leaves."""
+    with _shared_lock:
+        fanout = _shared_recordings.get(backend)
+        if fanout is None:
+            return False
+        fanout.outputs = tuple(o for o in fanout.outputs if o is not output)
+        if fanout.outputs:
+            return False
+        del _shared_recordings[backend]
+        stopper()
+        return True
+
+
 class StreamingOutput(io.BufferedIOBase):
-    """Buffered output for camera streaming."""
+    """Buffered output for camera streaming.
+
+    Single writer (the encoder thread), lock-free publish: the reference
+    store to `frame` is atomic under the GIL, so write() only has to flag
+    the new frame.
+    """
     def __init__(self):
         self.frame = b""
-        self.condition = Condition()
+        self._new_frame = Event()
 
     def write(self, buf: bytes) -> int:
-        with self.condition:
-            self.frame = buf
-            self.condition.notify_all()
+        self.frame = buf
+        self._new_frame.set()
         return len(buf)
 
+    def wait_for_frame(self, timeout: float) -> Optional[bytes]:
+        """Block until a frame newer than the last one consumed is written."""
+        if not self._new_frame.wait(timeout):
+            return None
+        self._new_frame.clear()
+        return self.frame
+
+
+def _offer_latest(queue: "asyncio.Queue[bytes]", frame: bytes) -> None:
+    """Put `frame` in a maxsize=1 queue, dropping the frame a slow client didn't read."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(frame)
+
+
 class CameraDriver(IHardwareComponent):
     """Modern driver for Raspberry Pi Camera using Picamera2."""
     
@@ -44,17 +206,34 @@ class CameraDriver(IHardwareComponent):
         resolution: Tuple[int, int] = (640, 480),
         framerate: int = 30,
         hflip: bool = False,
-        vflip: bool = False
+        vflip: bool = False,
+        lores_size: Tuple[int, int] = (320, 240)
     ):
         self._resolution = resolution
+        self._lores_size = lores_size
         self._framerate = framerate
         self._hflip = hflip
         self._vflip = vflip
+        # Flips still to be done in software by the OpenCV path (cleared once V4L2 does them)
+        self._cv2_hflip = hflip
+        self._cv2_vflip = vflip
+        # Built once and reused on every (re)initialisation of the Picamera2 path
+        self._transform = (
+            Transform(hflip=1 if hflip else 0, vflip=1 if vflip else 0) if HAS_PICAMERA else None
+        )
         
         self._camera: Optional[Any] = None
         self._status = HardwareStatus.UNINITIALIZED
         self._streaming_output = StreamingOutput()
         self._streaming = False
+        # Fan-out of encoded frames: the encoder thread only sets an Event, a
+        # single dispatcher thread hands the frame to each subscriber's loop.
+        self._subscribers: Dict["asyncio.Queue[bytes]", asyncio.AbstractEventLoop] = {}
+        self._dispatcher: Optional[Thread] = None
+        self._dispatch_stop = Event()
+        # monotonic timestamps of the last rate-limited failure logs
+        self._last_pi_fail = 0.0
+        self._last_fail_log = 0.0
 
     async def initialize(self) -> bool:
         """Initialize the camera."""
@@ -87,21 +266,43 @@ class CameraDriver(IHardwareComponent):
 
     def _init_camera_pi(self):
         """Internal camera init using Picamera2."""
-        self._camera = Picamera2()
-        transform = Transform(hflip=1 if self._hflip else 0, vflip=1 if self._vflip else 0)
-        
-        # Configure for preview/capture
-        config = self._camera.create_preview_configuration(
-            main={"size": self._resolution},
-            transform=transform
-        )
-        self._camera.configure(config)
-        self._camera.start()
+        self._camera = acquire_shared_camera("picamera2", Picamera2)
+        try:
+            if start_shared_picamera(
+                self._camera, self._resolution, self._lores_size, self._transform
+            ):
+                self._check_sensor_transform()
+        except Exception:
+            release_shared_camera("picamera2", lambda cam: cam.close())
+            self._camera = None
+            raise
+
+    def _check_sensor_transform(self):
+        """Make sure libcamera kept the requested flips.
+
+        libcamera applies hflip/vflip with the sensor's own readout flags, so
+        both the JPEG encoder and capture_gray() receive already-flipped
+        frames. If the pipeline cannot honour the transform, validation
+        silently adjusts it; report that instead of streaming mirrored video.
+        """
+        if not (self._hflip or self._vflip):
+            return
+        applied = self._camera.camera_configuration().get("transform")
+        if applied is None:
+            return
+        if bool(applied.hflip) != self._hflip or bool(applied.vflip) != self._vflip:
+            logger.warning(
+                "camera.transform_adjusted",
+                requested={"hflip": self._hflip, "vflip": self._vflip},
+                applied={"hflip": bool(applied.hflip), "vflip": bool(applied.vflip)},
+            )
 
     def _init_camera_cv2(self):
         """Internal camera init using OpenCV."""
         # Force V4L2 backend which is more reliable on Pi
-        self._camera = cv2.VideoCapture(0, cv2.CAP_V4L2)
+        self._camera = acquire_shared_camera(
+            "opencv:0", lambda: cv2.VideoCapture(0, cv2.CAP_V4L2)
+        )
         if self._camera.isOpened():
             self._camera.set(cv2.CAP_PROP_FRAME_WIDTH, self._resolution[0])
             self._camera.set(cv2.CAP_PROP_FRAME_HEIGHT, self._resolution[1])
@@ -113,9 +314,9 @@ class CameraDriver(IHardwareComponent):
             logger.info("camera.cv2_opened", requested=self._resolution, actual=(actual_w, actual_h))
             
             # Warm-up: discard frames until SUCCESS or timeout
-            start_time = time.time()
+            start_time = time.monotonic()
             warmup_success = False
-            while time.time() - start_time < 2.0:
+            while time.monotonic() - start_time < 2.0:
                 ret, _ = self._camera.read()
                 if ret:
                     warmup_success = True
@@ -124,9 +325,40 @@ class CameraDriver(IHardwareComponent):
                 
             if not warmup_success:
                 logger.warning("camera.cv2_warmup_failed", msg="Camera opened but no frames captured during warmup")
+
+            if self._hflip or self._vflip:
+                self._apply_v4l2_flip()
         else:
+            release_shared_camera("opencv:0", lambda cap: cap.release())
+            self._camera = None
             raise RuntimeError("Could not open OpenCV video capture on index 0")
 
+    def _apply_v4l2_flip(self, device: str = "/dev/video0"):
+        """Ask the sensor to flip frames so _get_frame_cv2 can skip cv2.flip."""
+        if shutil.which("v4l2-ctl") is None:
+            logger.info("camera.v4l2_flip_unavailable", reason="v4l2-ctl not found")
+            return
+
+        try:
+            subprocess.run(
+                [
+                    "v4l2-ctl", "-d", device,
+                    "-c", f"horizontal_flip={int(self._hflip)}",
+                    "-c", f"vertical_flip={int(self._vflip)}",
+                ],
+                check=True,
+                capture_output=True,
+                timeout=2.0,
+            )
+        except (subprocess.SubprocessError, OSError) as e:
+            # Sensor doesn't expose the controls: keep flipping in software
+            logger.info("camera.v4l2_flip_unavailable", reason=str(e))
+            return
+
+        self._cv2_hflip = False
+        self._cv2_vflip = False
+        logger.info("camera.v4l2_flip_applied", hflip=self._hflip, vflip=self._vflip)
+
     async def start_streaming(self):
         """Start JPEG streaming."""
         if not self._camera:  # Removed self._streaming check to ensure start() is called if needed
@@ -135,22 +367,68 @@ class CameraDriver(IHardwareComponent):
         try:
             loop = asyncio.get_running_loop()
             
-            # Ensure camera is started (idempotent in picamera2)
+            # Ensure camera is started (stop_streaming may have stopped it)
             if HAS_PICAMERA:
-                await loop.run_in_executor(None, self._camera.start)
+                await loop.run_in_executor(
+                    None, start_shared_picamera,
+                    self._camera, self._resolution, self._lores_size, self._transform
+                )
             
             if not self._streaming:
                 await loop.run_in_executor(None, self._start_recording)
+                self._start_dispatcher()
                 self._streaming = True
                 logger.info("camera.streaming_started")
         except Exception as e:
             logger.error("camera.streaming_failed", error=str(e))
 
     def _start_recording(self):
-        encoder = JpegEncoder()
         from picamera2.outputs import FileOutput
-        output = FileOutput(self._streaming_output)
-        self._camera.start_recording(encoder, output)
+        camera = self._camera
+        start_shared_recording(
+            "picamera2", self._streaming_output,
+            lambda fanout: camera.start_recording(JpegEncoder(), FileOutput(fanout))
+        )
+
+    def _stop_recording(self):
+        # Other CameraDriver instances may still stream from the same encoder
+        stop_shared_recording("picamera2", self._streaming_output, self._camera.stop_recording)
+
+    def _start_dispatcher(self):
+        if self._dispatcher is not None and self._dispatcher.is_alive():
+            return
+        self._dispatch_stop.clear()
+        self._dispatcher = Thread(target=self._fanout, name="camera-fanout", daemon=True)
+        self._dispatcher.start()
+
+    def _stop_dispatcher(self):
+        self._dispatch_stop.set()
+        if self._dispatcher is not None:
+            self._dispatcher.join(timeout=1.0)
+            self._dispatcher = None
+
+    def _fanout(self):
+        """Dispatcher thread: forward each new encoded frame to every subscriber."""
+        output = self._streaming_output
+        while not self._dispatch_stop.is_set():
+            frame = output.wait_for_frame(timeout=0.5)
+            if frame is None:
+                continue
+            for queue, loop in list(self._subscribers.items()):
+                try:
+                    loop.call_soon_threadsafe(_offer_latest, queue, frame)
+                except RuntimeError:
+                    # Subscriber's event loop is closed
+                    self._subscribers.pop(queue, None)
+
+    def subscribe(self) -> "asyncio.Queue[bytes]":
+        """Register a queue receiving the latest encoded frame (older ones are dropped)."""
+        queue: "asyncio.Queue[bytes]" = asyncio.Queue(maxsize=1)
+        self._subscribers[queue] = asyncio.get_running_loop()
+        return queue
+
+    def unsubscribe(self, queue: "asyncio.Queue[bytes]") -> None:
+        self._subscribers.pop(queue, None)
 
     async def stop_streaming(self):
         """Stop JPEG streaming."""
@@ -161,37 +439,49 @@ class CameraDriver(IHardwareComponent):
             loop = asyncio.get_running_loop()
             if HAS_PICAMERA:
                 if self._streaming:
-                    await loop.run_in_executor(None, self._camera.stop_recording)
-                # FULL STOP to turn off LED
-                await loop.run_in_executor(None, self._camera.stop)
+                    await loop.run_in_executor(None, self._stop_recording)
+                    await loop.run_in_executor(None, self._stop_dispatcher)
+                # FULL STOP to turn off LED, unless another user holds the camera
+                await loop.run_in_executor(
+                    None, stop_shared_camera, "picamera2", lambda cam: cam.stop()
+                )
                 
             self._streaming = False
             logger.info("camera.streaming_stopped")
         except Exception as e:
             logger.error("camera.stop_streaming_failed", error=str(e))
 
-    async def get_frame(self) -> bytes:
-        """Get the latest frame as bytes."""
+    async def get_frame(self, queue: Optional["asyncio.Queue[bytes]"] = None) -> bytes:
+        """Get the latest frame as bytes.
+
+        Long-lived consumers (MJPEG stream) pass the queue returned by
+        subscribe() so they keep one subscription instead of registering
+        a new one for every frame.
+        """
         if not self._streaming and HAS_PICAMERA:
             await self.start_streaming()
             
-        loop = asyncio.get_running_loop()
         if HAS_PICAMERA:
-            return await loop.run_in_executor(None, self._wait_for_frame_pi)
+            return await self._wait_for_frame_pi(queue)
         else:
+            loop = asyncio.get_running_loop()
             return await loop.run_in_executor(None, self._get_frame_cv2)
 
-    def _wait_for_frame_pi(self) -> bytes:
-        with self._streaming_output.condition:
-            if self._streaming_output.condition.wait(timeout=2.0):
-                return self._streaming_output.frame
-            
-            if not hasattr(self, "_last_pi_fail"):
-                self._last_pi_fail = 0
-            if time.time() - self._last_pi_fail > 5:
+    async def _wait_for_frame_pi(self, queue: Optional["asyncio.Queue[bytes]"] = None) -> bytes:
+        owned = queue is None
+        if owned:
+            queue = self.subscribe()
+        try:
+            return await asyncio.wait_for(queue.get(), timeout=2.0)
+        except asyncio.TimeoutError:
+            now = time.monotonic()
+            if now - self._last_pi_fail > 5:
                 logger.warning("camera.pi_wait_timeout")
-                self._last_pi_fail = time.time()
+                self._last_pi_fail = now
             return b""
+        finally:
+            if owned:
+                self.unsubscribe(queue)
 
     def _get_frame_cv2(self) -> bytes:
         if not self._camera:
@@ -200,20 +490,66 @@ class CameraDriver(IHardwareComponent):
         ret, frame = self._camera.read()
         if not ret:
             # Log failure occasionally to avoid spam
-            if not hasattr(self, "_last_fail_log"):
-                self._last_fail_log = 0
-            if time.time() - self._last_fail_log > 5:
+            now = time.monotonic()
+            if now - self._last_fail_log > 5:
                 logger.warning("camera.cv2_read_failed")
-                self._last_fail_log = time.time()
+                self._last_fail_log = now
             return b""
             
-        if self._hflip:
+        if self._cv2_hflip:
             frame = cv2.flip(frame, 1)
-        if self._vflip:
+        if self._cv2_vflip:
             frame = cv2.flip(frame, 0)
         ret, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
         return buffer.tobytes() if ret else b""
 
+    async def capture_gray(self) -> Optional[np.ndarray]:
+        """Capture a grayscale frame at lores_size for vision consumers.
+
+        On Picamera2 only the Y plane of the YUV420 lores stream is copied,
+        which is a quarter of the bytes of an RGBA capture of the same size.
+        Returns None when the camera is not running (e.g. after
+        stop_streaming()), where capture_request() would block forever.
+        """
+        camera = self._camera
+        if camera is None:
+            return None
+
+        loop = asyncio.get_running_loop()
+        if HAS_PICAMERA:
+            if not camera.started:
+                return None
+            return await loop.run_in_executor(None, self._capture_gray_pi, camera)
+        if not camera.isOpened():
+            return None
+        return await loop.run_in_executor(None, self._capture_gray_cv2, camera)
+
+    def _capture_gray_pi(self, camera: Any) -> Optional[np.ndarray]:
+        width, height = self._lores_size
+        request = camera.capture_request()
+        try:
+            # YUV420 is planar: the first `height` rows of the mapped buffer are
+            # luminance, rows may be padded up to the stride.
+            with MappedArray(request, "lores") as mapped:
+                return mapped.array[:height, :width].copy()
+        finally:
+            request.release()
+
+    def _capture_gray_cv2(self, camera: Any) -> Optional[np.ndarray]:
+        ret, frame = camera.read()
+        if not ret:
+            return None
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        if self._cv2_hflip or self._cv2_vflip:
+            if self._cv2_hflip and self._cv2_vflip:
+                flip_code = -1
+            else:
+                flip_code = 1 if self._cv2_hflip else 0
+            gray = cv2.flip(gray, flip_code)
+        if gray.shape[1] != self._lores_size[0] or gray.shape[0] != self._lores_size[1]:
+            gray = cv2.resize(gray, self._lores_size, interpolation=cv2.INTER_AREA)
+        return gray
+
     async def cleanup(self) -> None:
         """Release camera resources."""
         if self._camera:
@@ -222,9 +558,13 @@ class CameraDriver(IHardwareComponent):
             
             loop = asyncio.get_running_loop()
             if HAS_PICAMERA:
-                await loop.run_in_executor(None, self._camera.close)
+                await loop.run_in_executor(
+                    None, release_shared_camera, "picamera2", lambda cam: cam.close()
+                )
             else:
-                await loop.run_in_executor(None, self._camera.release)
+                await loop.run_in_executor(
+                    None, release_shared_camera, "opencv:0", lambda cap: cap.release()
+                )
             self._camera = None
             
         self._status = HardwareStatus.UNINITIALIZED
@@ -236,6 +576,7 @@ class CameraDriver(IHardwareComponent):
         return {
             "status": self._status.value,
             "resolution": self._resolution,
+            "lores_resolution": self._lores_size,
             "streaming": self._streaming,
             "has_picamera": HAS_PICAMERA,
             "has_opencv": HAS_OPENCV,
@@ -2,6 +2,9 @@
 import logging
 import asyncio
 from typing import Optional, Dict, Any, Tuple
+
+import numpy as np
+
 from tachikoma.core.hardware.interfaces.base import IHardwareComponent, HardwareStatus
 from tachikoma.core.hardware.interfaces.i2c import I2CInterface
 
@@ -16,11 +19,23 @@ class MPU6050(IHardwareComponent):
     GYRO_CONFIG = 0x1B
     ACCEL_CONFIG = 0x1C
     INT_ENABLE = 0x38
+    FIFO_EN = 0x23
+    USER_CTRL = 0x6A
+    FIFO_COUNT_H = 0x72
+    FIFO_R_W = 0x74
     
     ACCEL_XOUT_H = 0x3B
     GYRO_XOUT_H = 0x43
     TEMP_OUT_H = 0x41
     
+    # FIFO : paquets accel (6) + temp (2) + gyro (6), même ordre que 0x3B-0x48
+    FIFO_SIZE = 1024
+    FIFO_PACKET = 14
+    FIFO_SOURCES = 0xF8  # TEMP | XG | YG | ZG | ACCEL
+    USER_CTRL_FIFO_EN = 0x40
+    USER_CTRL_FIFO_RESET = 0x04
+    FIFO_READ_CHUNK = 28  # deux paquets, sous la limite SMBus de 32 octets
+    
     def __init__(self, i2c: I2CInterface, address: int = 0x68):
         """
         Initialise le driver IMU.
@@ -31,12 +46,26 @@ class MPU6050(IHardwareComponent):
         """
         self._i2c = i2c
         self._address = address
+        self._address_hex = f"0x{address:02x}"  # status/logs, formaté une fois
         self.logger = logging.getLogger(__name__)
         self._status = HardwareStatus.UNINITIALIZED
         
         # Facteurs d'échelle
         self.accel_scale = 16384.0  # pour ±2g
         self.gyro_scale = 131.0  # pour ±250°/s
+        # Inverses pré-calculés : une multiplication vectorisée par lecture
+        self._accel_scale_vec = np.float32(1.0 / self.accel_scale)
+        self._gyro_scale_vec = np.float32(1.0 / self.gyro_scale)
+        self._fifo_enabled = False
+        # Tampons réutilisés à chaque lecture : vues big-endian et sorties
+        # mises à l'échelle allouées une fois pour toutes
+        self._raw_axes = bytearray(6)
+        self._axes_words = np.frombuffer(self._raw_axes, dtype=">i2")
+        self._axes_out = np.empty(3, dtype=np.float32)
+        self._raw_motion = bytearray(14)
+        self._motion_words = np.frombuffer(self._raw_motion, dtype=">i2")
+        self._accel_out = np.empty(3, dtype=np.float32)
+        self._gyro_out = np.empty(3, dtype=np.float32)
     
     async def initialize(self) -> bool:
         """Initialise le driver IMU."""
@@ -54,7 +83,7 @@ class MPU6050(IHardwareComponent):
             self._i2c.write_byte_data(self._address, self.ACCEL_CONFIG, 0)
             
             self._status = HardwareStatus.READY
-            self.logger.info(f"MPU6050 initialized at 0x{self._address:02x}")
+            self.logger.info(f"MPU6050 initialized at {self._address_hex}")
             return True
             
         except Exception as e:
@@ -97,6 +126,21 @@ class MPU6050(IHardwareComponent):
             return -((65535 - value) + 1)
         return value
     
+    async def _read_axes(self, reg: int, scale: np.float32) -> Tuple[float, float, float]:
+        """
+        Lit les trois axes (6 octets big-endian signés) en une transaction.
+        
+        Args:
+            reg: Registre du premier octet (axe X, poids fort)
+            scale: Inverse du facteur d'échelle
+            
+        Returns:
+            Tuple (x, y, z) mis à l'échelle
+        """
+        self._raw_axes[:] = self._i2c.read_i2c_block_data(self._address, reg, 6)
+        x, y, z = np.multiply(self._axes_words, scale, out=self._axes_out).tolist()
+        return (x, y, z)
+    
     async def read_accel(self) -> Optional[Tuple[float, float, float]]:
         """
         Lit les données de l'accéléromètre.
@@ -108,10 +152,7 @@ class MPU6050(IHardwareComponent):
             return None
         
         try:
-            x = await self._read_word(self.ACCEL_XOUT_H) / self.accel_scale
-            y = await self._read_word(self.ACCEL_XOUT_H + 2) / self.accel_scale
-            z = await self._read_word(self.ACCEL_XOUT_H + 4) / self.accel_scale
-            return (x, y, z)
+            return await self._read_axes(self.ACCEL_XOUT_H, self._accel_scale_vec)
         except Exception as e:
             self.logger.error(f"Failed to read accelerometer: {e}")
             return None
@@ -127,10 +168,7 @@ class MPU6050(IHardwareComponent):
             return None
         
         try:
-            x = await self._read_word(self.GYRO_XOUT_H) / self.gyro_scale
-            y = await self._read_word(self.GYRO_XOUT_H + 2) / self.gyro_scale
-            z = await self._read_word(self.GYRO_XOUT_H + 4) / self.gyro_scale
-            return (x, y, z)
+            return await self._read_axes(self.GYRO_XOUT_H, self._gyro_scale_vec)
         except Exception as e:
             self.logger.error(f"Failed to read gyroscope: {e}")
             return None
@@ -153,6 +191,119 @@ class MPU6050(IHardwareComponent):
             self.logger.error(f"Failed to read temperature: {e}")
             return None
     
+    async def read_all(self) -> Optional[Dict[str, Any]]:
+        """
+        Lit accéléromètre, température et gyroscope en une transaction.
+        
+        Les registres ACCEL_XOUT_H..GYRO_ZOUT_L (0x3B-0x48) sont contigus :
+        un bloc de 14 octets remplace les trois lectures séparées.
+        
+        Returns:
+            Dict avec "accelerometer" (g), "gyroscope" (°/s) et
+            "temperature" (°C), ou None en cas d'erreur
+        """
+        if not self.is_available():
+            return None
+        
+        try:
+            self._raw_motion[:] = self._i2c.read_i2c_block_data(
+                self._address, self.ACCEL_XOUT_H, 14
+            )
+            words = self._motion_words
+            ax, ay, az = np.multiply(
+                words[0:3], self._accel_scale_vec, out=self._accel_out
+            ).tolist()
+            gx, gy, gz = np.multiply(
+                words[4:7], self._gyro_scale_vec, out=self._gyro_out
+            ).tolist()
+            return {
+                "accelerometer": (ax, ay, az),
+                "gyroscope": (gx, gy, gz),
+                "temperature": int(words[3]) / 340.0 + 36.53,
+            }
+        except Exception as e:
+            self.logger.error(f"Failed to read IMU: {e}")
+            return None
+    
+    async def enable_fifo(self, sample_rate_hz: int = 100) -> bool:
+        """
+        Active la FIFO interne à cadence fixe (accel + temp + gyro).
+        
+        Le filtre passe-bas (DLPF 188 Hz) ramène l'horloge gyro à 1 kHz,
+        SMPLRT_DIV en dérive la cadence : les échantillons sont datés par
+        le capteur et non par la boucle Python qui les lit.
+        
+        Args:
+            sample_rate_hz: Cadence d'échantillonnage (4-1000 Hz)
+            
+        Returns:
+            True si la FIFO est active
+        """
+        if not self.is_available():
+            return False
+        
+        divider = max(0, min(255, round(1000 / sample_rate_hz) - 1))
+        try:
+            self._i2c.write_byte_data(self._address, self.CONFIG, 1)
+            self._i2c.write_byte_data(self._address, self.SMPLRT_DIV, divider)
+            self._i2c.write_byte_data(self._address, self.USER_CTRL, self.USER_CTRL_FIFO_RESET)
+            self._i2c.write_byte_data(self._address, self.FIFO_EN, self.FIFO_SOURCES)
+            self._i2c.write_byte_data(self._address, self.USER_CTRL, self.USER_CTRL_FIFO_EN)
+            self._fifo_enabled = True
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to enable MPU6050 FIFO: {e}")
+            return False
+    
+    async def disable_fifo(self) -> None:
+        """Désactive la FIFO et restaure la configuration d'initialize()."""
+        self._fifo_enabled = False
+        try:
+            self._i2c.write_byte_data(self._address, self.FIFO_EN, 0)
+            self._i2c.write_byte_data(self._address, self.USER_CTRL, self.USER_CTRL_FIFO_RESET)
+            self._i2c.write_byte_data(self._address, self.SMPLRT_DIV, 7)
+            self._i2c.write_byte_data(self._address, self.CONFIG, 0)
+        except Exception as e:
+            self.logger.error(f"Failed to disable MPU6050 FIFO: {e}")
+    
+    async def read_fifo(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Vide la FIFO en lectures bloc.
+        
+        Returns:
+            Tuple (accel (n, 3) en g, gyro (n, 3) en °/s), du plus ancien au
+            plus récent (n peut valoir 0), ou None si la FIFO est inactive,
+            a débordé ou en cas d'erreur
+        """
+        if not self._fifo_enabled or not self.is_available():
+            return None
+        
+        try:
+            high, low = self._i2c.read_i2c_block_data(self._address, self.FIFO_COUNT_H, 2)
+            count = (high << 8) | low
+            if count >= self.FIFO_SIZE:
+                # Débordement : les paquets ne sont plus alignés, on repart à vide
+                self._i2c.write_byte_data(
+                    self._address, self.USER_CTRL,
+                    self.USER_CTRL_FIFO_EN | self.USER_CTRL_FIFO_RESET
+                )
+                self.logger.warning("MPU6050 FIFO overflow, reset")
+                return None
+            
+            n = count // self.FIFO_PACKET
+            raw = bytearray()
+            remaining = n * self.FIFO_PACKET
+            while remaining:
+                chunk = min(remaining, self.FIFO_READ_CHUNK)
+                raw += bytes(self._i2c.read_i2c_block_data(self._address, self.FIFO_R_W, chunk))
+                remaining -= chunk
+            
+            words = np.frombuffer(bytes(raw), dtype=">i2").reshape(n, 7)
+            return words[:, 0:3] * self._accel_scale_vec, words[:, 4:7] * self._gyro_scale_vec
+        except Exception as e:
+            self.logger.error(f"Failed to read MPU6050 FIFO: {e}")
+            return None
+    
     def is_available(self) -> bool:
         """Vérifie si l'IMU est disponible."""
         return self._status == HardwareStatus.READY
@@ -161,7 +312,7 @@ class MPU6050(IHardwareComponent):
         """Retourne le statut de l'IMU."""
         return {
             "type": "mpu6050",
-            "address": f"0x{self._address:02x}",
+            "address": self._address_hex,
             "status": self._status.value,
             "available": self.is_available()
         }
@@ -68,6 +68,12 @@ class LEDController:
         'BGR': 0x24,  # B=0, G=1, R=2
     }
     
+    # WS2812 8-bit SPI encoding of every byte value: MSB first, 0x78 for '1', 0x80 for '0'
+    _WS2812_8BIT_LUT = tuple(
+        bytes(0x78 if (val >> ibit) & 1 else 0x80 for ibit in range(7, -1, -1))
+        for val in range(256)
+    )
+    
     def __init__(
         self,
         led_count: int = 8,
@@ -182,9 +188,19 @@ class LEDController:
         """
         if self._mock_mode or not self._spi_initialized:
             return
-            
-        for i in range(self.led_count):
-            self.set_color(r, g, b, i)
+        
+        # Scale once and replicate the pixel across the whole buffer
+        pixel = [0, 0, 0]
+        pixel[self._red_offset] = round(r * self.brightness / 255)
+        pixel[self._green_offset] = round(g * self.brightness / 255)
+        pixel[self._blue_offset] = round(b * self.brightness / 255)
+        original = [0, 0, 0]
+        original[self._red_offset] = r
+        original[self._green_offset] = g
+        original[self._blue_offset] = b
+        
+        self._led_color = pixel * self.led_count
+        self._led_original_color = original * self.led_count
         self.show()
     
     def set_brightness(self, brightness: int) -> None:
@@ -217,17 +233,9 @@ class LEDController:
         if not np:
             return None
             
-        d = self._led_color
-        tx = [0] * (len(d) * 8)
-        
-        for i, val in enumerate(d):
-            for ibit in range(8):
-                if (val >> ibit) & 1:
-                    tx[i * 8 + (7 - ibit)] = 0x78
-                else:
-                    tx[i * 8 + (7 - ibit)] = 0x80
-        
-        return tx
+        lut = self._WS2812_8BIT_LUT
+        # & 0xFF: only the low byte is sent, as the per-bit encoder did
+        return list(b"".join([lut[val & 0xFF] for val in self._led_color]))
     
     def show(self, mode: int = 1) -> None:
         """Update the LED strip with current color data.
@@ -1,7 +1,11 @@
 """Mock servo controller for testing without hardware"""
-from typing import Dict, List, Optional
+import logging
+import time
+from collections import deque
+from typing import Deque, List, Optional
 import structlog
 
+from tachikoma.core.config import DEBUG_SERVO as _DEBUG
 from tachikoma.core.hardware.interfaces.servo_controller import IServoController
 from tachikoma.core.exceptions import HardwareNotAvailableError
 
@@ -19,7 +23,10 @@ class MockServoController(IServoController):
         self,
         channels: int = 16,
         simulate_errors: bool = False,
-        delay_ms: int = 0
+        delay_ms: int = 0,
+        history_limit: int = 100_000,
+        deduplicate: bool = False,
+        record_history: bool = True
     ):
         """Initialize mock servo controller
         
@@ -27,21 +34,34 @@ class MockServoController(IServoController):
             channels: Number of servo channels to simulate
             simulate_errors: If True, simulate hardware errors
             delay_ms: Simulated delay for servo operations
+            history_limit: Max commands kept in history (oldest dropped first)
+            deduplicate: If True, skip (and don't record) commands that
+                leave a servo at its current angle, like the real controller
+            record_history: If False, don't record commands at all (for tests
+                that never inspect the history)
         """
         self.channels = channels
         self.simulate_errors = simulate_errors
         self.delay_ms = delay_ms
+        self.deduplicate = deduplicate
+        self.record_history = record_history
         
-        # Track servo states
-        self._servo_angles: Dict[int, int] = {}
-        self._servo_history: List[tuple] = []  # (channel, angle, timestamp)
+        # Track servo states (one byte per channel, neutral until set)
+        self._servo_angles = bytearray([90] * channels)
+        # (channel, angle, monotonic timestamp in ns), bounded ring buffer
+        self._servo_history: Deque[tuple] = deque(maxlen=history_limit)
         self._initialized = False
         self._running = False
         
         # Error simulation
         self._error_on_channel: Optional[int] = None
         
-        logger.info(
+        # Context bound once instead of passed on every log call
+        self._log = logger.bind(component="mock_servo", controller_id=id(self))
+        # Checked once so set_angle/set_pwm don't build structlog events that get dropped
+        self._debug = logging.getLogger(__name__).isEnabledFor(logging.DEBUG)
+        
+        self._log.info(
             "mock_servo.initialized",
             channels=channels,
             simulate_errors=simulate_errors
@@ -56,10 +76,9 @@ class MockServoController(IServoController):
         self._running = True
         
         # Initialize all servos to neutral position
-        for i in range(self.channels):
-            self._servo_angles[i] = 90
+        self._servo_angles[:] = [90] * self.channels
         
-        logger.info("mock_servo.initialized")
+        self._log.info("mock_servo.initialized")
     
     def set_angle(self, channel: int, angle: int) -> None:
         """Set servo angle
@@ -84,16 +103,13 @@ class MockServoController(IServoController):
         if self._error_on_channel == channel:
             raise HardwareNotAvailableError(f"Mock error on channel {channel}")
         
+        if self.deduplicate and self._servo_angles[channel] == angle:
+            return
+        
         # Record the command
-        import time
-        self._servo_angles[channel] = angle
-        self._servo_history.append((channel, angle, time.time()))
-        
-        logger.debug(
-            "mock_servo.set_angle",
-            channel=channel,
-            angle=angle
-        )
+        self._servo_angles[channel] = int(angle)
+        if self.record_history:
+            self._servo_history.append((channel, angle, time.monotonic_ns()))
 
     async def set_angle_async(self, channel: int, angle: int) -> None:
         """Async wrapper for set_angle."""
@@ -108,7 +124,7 @@ class MockServoController(IServoController):
         Returns:
             Current angle in degrees
         """
-        if channel not in self._servo_angles:
+        if not 0 <= channel < self.channels:
             return 90  # Default neutral
         return self._servo_angles[channel]
     
@@ -116,30 +132,31 @@ class MockServoController(IServoController):
         """Set multiple servo angles at once"""
         for channel, angle in angles:
             self.set_angle(channel, angle)
+        if _DEBUG and self._debug:
+            self._log.debug("mock_servo.set_angles", count=len(angles))
 
     def set_pwm(self, channel: int, pulse_width: int) -> None:
         """Set raw PWM pulse width"""
         if not self._initialized:
             raise HardwareNotAvailableError("Mock servo not initialized")
-        logger.debug("mock_servo.set_pwm", channel=channel, pulse_width=pulse_width)
 
     def reset(self) -> None:
         """Reset all servos to neutral position"""
         for i in range(self.channels):
             self.set_angle(i, 90)
-        logger.info("mock_servo.reset")
+        self._log.info("mock_servo.reset")
 
     async def relax(self) -> None:
         """Relax all servos"""
-        self._servo_angles.clear()
-        logger.info("mock_servo.relax")
+        self._servo_angles[:] = [90] * self.channels
+        self._log.info("mock_servo.relax")
 
     async def cleanup(self) -> None:
         """Cleanup mock resources"""
         await self.relax()
         self._running = False
         self._initialized = False
-        logger.info(
+        self._log.info(
             "mock_servo.cleanup",
             commands_executed=len(self._servo_history)
         )
@@ -153,9 +170,10 @@ class MockServoController(IServoController):
         """Get history of all servo commands
         
         Returns:
-            List of (channel, angle, timestamp) tuples
+            List of (channel, angle, timestamp_ns) tuples, timestamps from
+            time.monotonic_ns()
         """
-        return self._servo_history.copy()
+        return list(self._servo_history)
     
     def get_command_count(self, channel: Optional[int] = None) -> int:
         """Get number of commands sent
@@ -1,10 +1,14 @@
 """Driver PCA9685 moderne utilisant le HAL."""
 import logging
 import asyncio
-from typing import Optional, Dict, Any
+import struct
+from typing import Optional, Dict, Any, List, Tuple
 from tachikoma.core.hardware.interfaces.base import IHardwareComponent, HardwareStatus
 from tachikoma.core.hardware.interfaces.i2c import I2CInterface
 
+# LEDn_ON_L, LEDn_ON_H, LEDn_OFF_L, LEDn_OFF_H (little-endian)
+_PWM_REGS = struct.Struct("<HH")
+
 
 class PCA9685(IHardwareComponent):
     """Driver pour le contrôleur PWM PCA9685 (16 canaux) via HAL."""
@@ -27,11 +31,18 @@ class PCA9685(IHardwareComponent):
     
     # Bits
     RESTART = 0x80
+    AI = 0x20
     SLEEP = 0x10
     ALLCALL = 0x01
     INVRT = 0x10
     OUTDRV = 0x04
     
+    # Délai de stabilisation de l'oscillateur après sortie de SLEEP (datasheet : 500 µs)
+    OSC_STARTUP_DELAY = 0.0005
+    
+    # Canaux par écriture bloc : SMBus limite un bloc à 32 octets (4 registres par canal)
+    MAX_BLOCK_CHANNELS = 8
+    
     def __init__(self, i2c: I2CInterface, address: int = 0x40, frequency: int = 50):
         """
         Initialise le driver PCA9685.
@@ -43,6 +54,7 @@ class PCA9685(IHardwareComponent):
         """
         self._i2c = i2c
         self._address = address
+        self._address_hex = f"0x{address:02x}"  # status/logs, formaté une fois
         self._frequency = frequency
         self.logger = logging.getLogger(__name__)
         self._status = HardwareStatus.UNINITIALIZED
@@ -52,14 +64,14 @@ class PCA9685(IHardwareComponent):
         try:
             self._status = HardwareStatus.INITIALIZING
             
-            # Reset
-            self._i2c.write_byte_data(self._address, self.MODE1, 0x00)
+            # Reset, auto-incrément activé pour les écritures bloc
+            self._i2c.write_byte_data(self._address, self.MODE1, self.AI)
             
             # Set frequency
             await self._set_pwm_freq(self._frequency)
             
             self._status = HardwareStatus.READY
-            self.logger.info(f"PCA9685 initialized at 0x{self._address:02x}, {self._frequency}Hz")
+            self.logger.info(f"PCA9685 initialized at {self._address_hex}, {self._frequency}Hz")
             return True
             
         except Exception as e:
@@ -95,17 +107,34 @@ class PCA9685(IHardwareComponent):
         if old_mode is None:
             raise RuntimeError("Failed to read MODE1 register")
         
-        new_mode = (old_mode & 0x7F) | self.SLEEP
-        self._i2c.write_byte_data(self._address, self.MODE1, new_mode)
+        sleep_mode = (old_mode & 0x7F) | self.SLEEP
+        restart_mode = old_mode | self.RESTART
+        
+        # PRESCALE n'est modifiable qu'en SLEEP, puis réveil et RESTART
+        self._i2c.write_byte_data(self._address, self.MODE1, sleep_mode)
         self._i2c.write_byte_data(self._address, self.PRESCALE, prescale)
         self._i2c.write_byte_data(self._address, self.MODE1, old_mode)
-        await asyncio.sleep(0.005)
-        self._i2c.write_byte_data(self._address, self.MODE1, old_mode | self.RESTART)
+        await asyncio.sleep(self.OSC_STARTUP_DELAY)
+        self._i2c.write_byte_data(self._address, self.MODE1, restart_mode)
     
     async def set_pwm(self, channel: int, on: int, off: int) -> None:
         """
         Configure un canal PWM.
         
+        Args:
+            channel: Numéro du canal (0-15)
+            on: Valeur ON (0-4095)
+            off: Valeur OFF (0-4095)
+        """
+        self.set_pwm_sync(channel, on, off)
+    
+    def set_pwm_sync(self, channel: int, on: int, off: int) -> None:
+        """
+        Configure un canal PWM sans passer par la boucle asyncio.
+        
+        Les écritures I2C du HAL sont bloquantes : cette variante les
+        appelle directement, pour les boucles de contrôle synchrones.
+        
         Args:
             channel: Numéro du canal (0-15)
             on: Valeur ON (0-4095)
@@ -114,10 +143,63 @@ class PCA9685(IHardwareComponent):
         if not (0 <= channel < 16):
             raise ValueError(f"Channel must be 0-15, got {channel}")
         
-        self._i2c.write_byte_data(self._address, self.LED0_ON_L + 4 * channel, on & 0xFF)
-        self._i2c.write_byte_data(self._address, self.LED0_ON_H + 4 * channel, on >> 8)
-        self._i2c.write_byte_data(self._address, self.LED0_OFF_L + 4 * channel, off & 0xFF)
-        self._i2c.write_byte_data(self._address, self.LED0_OFF_H + 4 * channel, off >> 8)
+        # LEDn_ON_L..LEDn_OFF_H en une transaction (auto-incrément)
+        self._i2c.write_i2c_block_data(
+            self._address, self.LED0_ON_L + 4 * channel, list(_PWM_REGS.pack(on, off))
+        )
+    
+    async def set_pwm_bulk(self, values: List[Tuple[int, int, int]]) -> None:
+        """
+        Configure plusieurs canaux PWM en regroupant les canaux contigus.
+        
+        Chaque suite de canaux consécutifs est envoyée en écritures bloc
+        d'au plus MAX_BLOCK_CHANNELS canaux.
+        
+        Args:
+            values: Liste de tuples (channel, on, off)
+        """
+        self.set_pwm_bulk_sync(values)
+    
+    def set_pwm_bulk_sync(self, values: List[Tuple[int, int, int]]) -> None:
+        """
+        Configure plusieurs canaux PWM sans passer par la boucle asyncio.
+        
+        Args:
+            values: Liste de tuples (channel, on, off)
+            
+        Raises:
+            ValueError: Si un canal est hors limites (rien n'est écrit)
+        """
+        # Un canal répété garde sa dernière valeur, comme des set_pwm successifs
+        latest = {channel: (on, off) for channel, on, off in values}
+        channels = sorted(latest)
+        # Tout le lot est validé avant la première écriture bloc : un canal
+        # invalide ne laisse pas une partie des servos déjà déplacés
+        if channels and not (0 <= channels[0] and channels[-1] < 16):
+            bad = channels[0] if channels[0] < 0 else channels[-1]
+            raise ValueError(f"Channel must be 0-15, got {bad}")
+        
+        pack = _PWM_REGS.pack
+        run_start = -1
+        run_data = bytearray()
+        for channel in channels:
+            on, off = latest[channel]
+            run_len = len(run_data) // 4
+            if run_data and (
+                channel != run_start + run_len or run_len == self.MAX_BLOCK_CHANNELS
+            ):
+                self._i2c.write_i2c_block_data(
+                    self._address, self.LED0_ON_L + 4 * run_start, list(run_data)
+                )
+                run_data = bytearray()
+            if not run_data:
+                run_start = channel
+            run_data += pack(on, off)
+        
+        if run_data:
+            self._i2c.write_i2c_block_data(
+                self._address, self.LED0_ON_L + 4 * run_start, list(run_data)
+            )
     
     async def set_servo_pulse(self, channel: int, pulse: int) -> None:
         """
@@ -130,6 +212,19 @@ class PCA9685(IHardwareComponent):
         pulse_value = int(pulse * (4096 / 20000.0))
         await self.set_pwm(channel, 0, pulse_value)
     
+    async def set_pwm_count(self, channel: int, count: int) -> None:
+        """
+        Configure directement le compteur OFF d'un servo (ON = 0).
+        
+        Chemin rapide pour un compteur déjà calculé (table précalculée),
+        sans la conversion flottante de set_servo_pulse.
+        
+        Args:
+            channel: Numéro du canal (0-15)
+            count: Valeur OFF (0-4095)
+        """
+        self.set_pwm_sync(channel, 0, count)
+    
     async def set_all_pwm(self, on: int, off: int) -> None:
         """
         Configure tous les canaux PWM.
@@ -138,10 +233,19 @@ class PCA9685(IHardwareComponent):
             on: Valeur ON (0-4095)
             off: Valeur OFF (0-4095)
         """
-        self._i2c.write_byte_data(self._address, self.ALL_LED_ON_L, on & 0xFF)
-        self._i2c.write_byte_data(self._address, self.ALL_LED_ON_H, on >> 8)
-        self._i2c.write_byte_data(self._address, self.ALL_LED_OFF_L, off & 0xFF)
-        self._i2c.write_byte_data(self._address, self.ALL_LED_OFF_H, off >> 8)
+        self.set_all_pwm_sync(on, off)
+    
+    def set_all_pwm_sync(self, on: int, off: int) -> None:
+        """
+        Configure tous les canaux PWM sans passer par la boucle asyncio.
+        
+        Args:
+            on: Valeur ON (0-4095)
+            off: Valeur OFF (0-4095)
+        """
+        self._i2c.write_i2c_block_data(
+            self._address, self.ALL_LED_ON_L, list(_PWM_REGS.pack(on, off))
+        )
     
     def is_available(self) -> bool:
         """Vérifie si le PCA9685 est disponible."""
@@ -151,7 +255,7 @@ class PCA9685(IHardwareComponent):
         """Retourne le statut du PCA9685."""
         return {
             "type": "pca9685",
-            "address": f"0x{self._address:02x}",
+            "address": self._address_hex,
             "frequency": self._frequency,
             "status": self._status.value,
             "available": self.is_available()
@@ -1,11 +1,45 @@
 """Contrôleur de servos PCA9685 utilisant le HAL."""
+import asyncio
 import logging
-from typing import Optional, List, Tuple, Dict, Any
+import threading
+from types import MappingProxyType
+from typing import Optional, List, Tuple, Dict, Any, Coroutine
 
+from tachikoma.core.config import DEBUG_SERVO as _DEBUG
 from tachikoma.core.hardware.interfaces.servo_controller import IServoController
 from tachikoma.core.hardware.drivers.pca9685 import PCA9685
 
 
+class _LoopRunner:
+    """Boucle asyncio persistante (thread daemon) pour les wrappers synchrones.
+    
+    Remplace un asyncio.run() par appel, qui crée et détruit une boucle,
+    un selector et un executor à chaque commande servo.
+    """
+    
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="pca9685-servo-loop", daemon=True
+                ).start()
+                self._loop = loop
+            return self._loop
+    
+    def run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Exécute la coroutine sur la boucle persistante et attend son résultat."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+
+_loop_runner = _LoopRunner()
+
+
 class PCA9685ServoController(IServoController):
     """Contrôleur de servos utilisant le driver PCA9685 avec HAL.
     
@@ -41,10 +75,38 @@ class PCA9685ServoController(IServoController):
         """
         self._pca_low = pca_low
         self._pca_high = pca_high
+        # (carte, canal local) par canal global, résolu une fois
+        self._routes: List[Tuple[PCA9685, int]] = (
+            [(pca_low, ch) for ch in range(16)] + [(pca_high, ch) for ch in range(16)]
+        )
         self._min_pulse = min_pulse
         self._max_pulse = max_pulse
-        self._current_angles: Dict[int, int] = {}
+        # Dernier angle commandé par canal (0-180 tient sur un octet) ;
+        # le bit n de _angle_set indique si le canal n a déjà été commandé
+        self._current_angles = bytearray(32)
+        self._angle_set = 0
+        # Dernière largeur d'impulsion brute écrite via set_pwm (µs)
+        self._current_pulses: Dict[int, int] = {}
+        # Écriture différée (queue_angle) : dernière cible par canal, fusionnées
+        # par la tâche d'écriture ; le bit n de _pending_set marque le canal n
+        self._pending = bytearray(32)
+        self._pending_set = 0
+        self._pending_event: Optional[asyncio.Event] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        # Table angle entier -> compteur PWM 12 bits (mêmes arrondis que
+        # _angle_to_pulse puis set_servo_pulse), indexée à chaque commande
+        self._angle_to_count: List[int] = [
+            self._pulse_to_count(self._angle_to_pulse(a)) for a in range(181)
+        ]
+        # Partie du statut qui ne change pas après construction
+        self._static_status = MappingProxyType({
+            "type": "pca9685_servo_controller_dual",
+            "min_pulse": min_pulse,
+            "max_pulse": max_pulse,
+        })
         self.logger = logging.getLogger(__name__)
+        # Évalué une fois : évite le formatage des logs debug à chaque commande servo
+        self._debug = self.logger.isEnabledFor(logging.DEBUG)
         
         self.logger.info(
             f"PCA9685ServoController créé avec pulse range {min_pulse}-{max_pulse}µs"
@@ -77,6 +139,24 @@ class PCA9685ServoController(IServoController):
         pulse = self._min_pulse + (angle / 180.0) * (self._max_pulse - self._min_pulse)
         return int(pulse)
     
+    @staticmethod
+    def _pulse_to_count(pulse: int) -> int:
+        """Convertit une largeur d'impulsion (µs) en compteur PWM 12 bits à 50Hz.
+        
+        Même conversion que PCA9685.set_servo_pulse.
+        """
+        return int(pulse * (4096 / 20000.0))
+    
+    def _angle_count(self, angle: int) -> int:
+        """Retourne le compteur PWM d'un angle déjà validé.
+        
+        Les angles entiers passent par la table précalculée ; les autres
+        (flottants) gardent le calcul complet.
+        """
+        if type(angle) is int:
+            return self._angle_to_count[angle]
+        return self._pulse_to_count(self._angle_to_pulse(angle))
+    
     def _pulse_to_angle(self, pulse: int) -> int:
         """Convertit une largeur d'impulsion (µs) en angle (0-180°).
         
@@ -89,43 +169,56 @@ class PCA9685ServoController(IServoController):
         angle = (pulse - self._min_pulse) / (self._max_pulse - self._min_pulse) * 180
         return int(max(0, min(180, angle)))
     
-    def set_angle(self, channel: int, angle: int) -> None:
+    def set_angle(self, channel: int, angle: int, force: bool = False) -> None:
         """Définit l'angle d'un servo (méthode synchrone wrapper).
         
         Args:
             channel: Numéro du canal (0-31)
             angle: Angle cible en degrés (0-180)
+            force: Écrit même si l'angle est inchangé (calibration)
             
         Raises:
             ValueError: Si channel ou angle hors limites
             RuntimeError: Si PCA9685 non disponible
         """
-        import asyncio
-        
         try:
-            # Utiliser asyncio.run uniquement si pas dans une boucle existante
-            try:
-                loop = asyncio.get_running_loop()
-                # Si on est déjà dans une loop, créer une tâche
-                self.logger.warning(
-                    "set_angle appelé depuis code async, utiliser set_angle_async à la place"
-                )
-                asyncio.create_task(self.set_angle_async(channel, angle))
-            except RuntimeError:
-                # Pas de loop en cours, on peut utiliser asyncio.run
-                asyncio.run(self.set_angle_async(channel, angle))
+            self._run_sync("set_angle", self.set_angle_async(channel, angle, force))
         except Exception as e:
             self.logger.error(f"Erreur set_angle channel {channel}: {e}")
             raise
     
-    async def set_angle_async(self, channel: int, angle: int) -> None:
+    def _run_sync(self, name: str, coro: Coroutine[Any, Any, None]) -> None:
+        """Exécute une méthode async depuis un wrapper synchrone.
+        
+        La coroutine tourne sur la boucle persistante du module et l'appel
+        attend sa fin : les erreurs remontent à l'appelant, y compris quand
+        le wrapper est (à tort) appelé depuis du code async.
+        """
+        # Variante sans exception de get_running_loop() : None hors boucle,
+        # ce qui évite de lever un RuntimeError à chaque commande servo
+        running = asyncio.events._get_running_loop()
+        if running is not None:
+            if running is _loop_runner.loop:
+                coro.close()
+                raise RuntimeError(f"{name} appelé depuis la boucle servo, utiliser {name}_async")
+            self.logger.warning(
+                "%s appelé depuis code async, utiliser %s_async à la place", name, name
+            )
+        
+        _loop_runner.run(coro)
+    
+    async def set_angle_async(
+        self, channel: int, angle: int, force: bool = False
+    ) -> None:
         """Définit l'angle d'un servo (version async).
         
         Routes channels 0-15 to pca_low and 16-31 to pca_high.
+        Aucune écriture I2C si l'angle commandé est déjà celui du canal.
         
         Args:
             channel: Numéro du canal (0-31)
             angle: Angle cible en degrés (0-180)
+            force: Écrit même si l'angle est inchangé (calibration)
             
         Raises:
             ValueError: Si channel ou angle hors limites
@@ -140,20 +233,18 @@ class PCA9685ServoController(IServoController):
         if not 0 <= angle <= 180:
             raise ValueError(f"Angle {angle} hors limites (0-180)")
         
+        current = self._current_angles
+        bit = 1 << channel
+        if not force and self._angle_set & bit and current[channel] == angle:
+            return
+        
         try:
-            pulse = self._angle_to_pulse(angle)
-            
-            # Routing logic
-            if channel < 16:
-                await self._pca_low.set_servo_pulse(channel, pulse)
-            else:
-                await self._pca_high.set_servo_pulse(channel - 16, pulse)
+            count = self._angle_count(angle)
+            await self._write_count_unchecked(channel, count)
                 
-            self._current_angles[channel] = angle
-            
-            self.logger.debug(
-                f"Servo {channel}: angle={angle}° (pulse={pulse}µs)"
-            )
+            self._remember_angle(channel, angle)
+            if self._current_pulses:
+                self._current_pulses.pop(channel, None)
             
         except Exception as e:
             self.logger.error(
@@ -161,37 +252,143 @@ class PCA9685ServoController(IServoController):
             )
             raise
     
-    def set_angles(self, angles: List[Tuple[int, int]]) -> None:
+    def set_angle_sync(self, channel: int, angle: int, force: bool = False) -> None:
+        """Définit l'angle d'un servo sans passer par asyncio.
+        
+        Appelle directement les écritures I2C (bloquantes) du driver : ni
+        boucle d'événements ni coroutine, pour une boucle de marche
+        synchrone. Mêmes validations et même cache que set_angle_async.
+        
+        Args:
+            channel: Numéro du canal (0-31)
+            angle: Angle cible en degrés (0-180)
+            force: Écrit même si l'angle est inchangé (calibration)
+            
+        Raises:
+            ValueError: Si channel ou angle hors limites
+            RuntimeError: Si PCA9685 non disponible
+        """
+        if not self.is_available():
+            raise RuntimeError("PCA9685 non disponible")
+        
+        if not 0 <= channel < 32:
+            raise ValueError(f"Canal {channel} hors limites (0-31)")
+        
+        if not 0 <= angle <= 180:
+            raise ValueError(f"Angle {angle} hors limites (0-180)")
+        
+        current = self._current_angles
+        bit = 1 << channel
+        if not force and self._angle_set & bit and current[channel] == angle:
+            return
+        
+        pca, local = self._routes[channel]
+        pca.set_pwm_sync(local, 0, self._angle_count(angle))
+        
+        self._remember_angle(channel, angle)
+        if self._current_pulses:
+            self._current_pulses.pop(channel, None)
+    
+    def set_angles(self, angles: List[Tuple[int, int]], force: bool = False) -> None:
         """Définit plusieurs angles de servos (méthode synchrone wrapper).
         
         Args:
             angles: Liste de tuples (channel, angle)
+            force: Écrit aussi les servos dont l'angle est inchangé
         """
-        import asyncio
-        
         try:
-            try:
-                loop = asyncio.get_running_loop()
-                self.logger.warning(
-                    "set_angles appelé depuis code async, utiliser set_angles_async"
-                )
-                asyncio.create_task(self.set_angles_async(angles))
-            except RuntimeError:
-                asyncio.run(self.set_angles_async(angles))
+            self._run_sync("set_angles", self.set_angles_async(angles, force))
         except Exception as e:
             self.logger.error(f"Erreur set_angles: {e}")
             raise
     
-    async def set_angles_async(self, angles: List[Tuple[int, int]]) -> None:
+    async def set_angles_async(
+        self, angles: List[Tuple[int, int]], force: bool = False
+    ) -> None:
         """Définit plusieurs angles de servos (version async).
         
+        Les commandes sont réparties par carte puis envoyées avec
+        set_pwm_bulk : une écriture bloc par suite de canaux contigus
+        au lieu d'une transaction par servo. Les servos déjà à l'angle
+        demandé sont ignorés.
+        
         Args:
             angles: Liste de tuples (channel, angle)
+            force: Écrit aussi les servos dont l'angle est inchangé
+            
+        Raises:
+            ValueError: Si un channel ou un angle est hors limites
+            RuntimeError: Si PCA9685 non disponible
         """
+        if not self.is_available():
+            raise RuntimeError("PCA9685 non disponible")
+        
+        # Validation de toute la liste avant la moindre écriture
+        for channel, angle in angles:
+            if not 0 <= channel < 32:
+                raise ValueError(f"Canal {channel} hors limites (0-31)")
+            if not 0 <= angle <= 180:
+                raise ValueError(f"Angle {angle} hors limites (0-180)")
+        
+        current = self._current_angles
+        angle_set = self._angle_set
+        lut = self._angle_to_count
+        low: List[Tuple[int, int, int]] = []
+        high: List[Tuple[int, int, int]] = []
+        for channel, angle in angles:
+            if not force and angle_set >> channel & 1 and current[channel] == angle:
+                continue
+            count = lut[angle] if type(angle) is int else self._angle_count(angle)
+            if channel < 16:
+                low.append((channel, 0, count))
+            else:
+                high.append((channel - 16, 0, count))
+        
+        # Les deux cartes partagent le même bus I2C : écritures séquentielles
+        try:
+            await self._write_board(self._pca_low, low)
+            await self._write_board(self._pca_high, high)
+        except Exception as e:
+            self.logger.error(f"Échec set_angles_async: {e}")
+            raise
+        
         for channel, angle in angles:
-            await self.set_angle_async(channel, angle)
+            self._remember_angle(channel, angle)
+        if self._current_pulses:
+            for channel, _ in angles:
+                self._current_pulses.pop(channel, None)
+        
+        if _DEBUG and self._debug:
+            self.logger.debug("Configuré %d servos", len(angles))
+    
+    def _remember_angle(self, channel: int, angle: int) -> None:
+        """Met à jour le cache d'angle d'un canal après une écriture.
+        
+        Un angle non entier ne tient pas dans l'octet du cache : le canal
+        est marqué non commandé pour que la commande suivante soit écrite
+        et que get_angle ne renvoie pas une valeur tronquée.
+        """
+        int_angle = int(angle)
+        self._current_angles[channel] = int_angle
+        if int_angle == angle:
+            self._angle_set |= 1 << channel
+        else:
+            self._angle_set &= ~(1 << channel)
+    
+    async def _write_count_unchecked(self, channel: int, count: int) -> None:
+        """Écrit un compteur PWM déjà calculé sur la bonne carte.
         
-        self.logger.debug(f"Configuré {len(angles)} servos")
+        Aucune vérification : channel (0-31) et count doivent avoir été
+        validés par l'appelant.
+        """
+        pca, local = self._routes[channel]
+        await pca.set_pwm_count(local, count)
+    
+    @staticmethod
+    async def _write_board(pca: PCA9685, values: List[Tuple[int, int, int]]) -> None:
+        """Envoie les (channel, on, off) d'une carte, rien si la liste est vide."""
+        if values:
+            await pca.set_pwm_bulk(values)
     
     def get_angle(self, channel: int) -> Optional[int]:
         """Récupère le dernier angle défini pour un servo.
@@ -205,38 +402,40 @@ class PCA9685ServoController(IServoController):
         Returns:
             Dernier angle commandé ou None si jamais défini
         """
-        return self._current_angles.get(channel)
+        if 0 <= channel < 32 and self._angle_set >> channel & 1:
+            return self._current_angles[channel]
+        pulse = self._current_pulses.get(channel)
+        if pulse is not None:
+            # Impulsion brute (set_pwm) : angle estimé
+            return self._pulse_to_angle(pulse)
+        return None
     
-    def set_pwm(self, channel: int, pulse_width: int) -> None:
+    def set_pwm(self, channel: int, pulse_width: int, force: bool = False) -> None:
         """Définit la largeur d'impulsion PWM brute (méthode synchrone wrapper).
         
         Args:
             channel: Numéro du canal
             pulse_width: Largeur d'impulsion en µs
+            force: Écrit même si la largeur d'impulsion est inchangée
         """
-        import asyncio
-        
         try:
-            try:
-                loop = asyncio.get_running_loop()
-                self.logger.warning(
-                    "set_pwm appelé depuis code async, utiliser set_pwm_async"
-                )
-                asyncio.create_task(self.set_pwm_async(channel, pulse_width))
-            except RuntimeError:
-                asyncio.run(self.set_pwm_async(channel, pulse_width))
+            self._run_sync("set_pwm", self.set_pwm_async(channel, pulse_width, force))
         except Exception as e:
             self.logger.error(f"Erreur set_pwm: {e}")
             raise
     
-    async def set_pwm_async(self, channel: int, pulse_width: int) -> None:
+    async def set_pwm_async(
+        self, channel: int, pulse_width: int, force: bool = False
+    ) -> None:
         """Définit la largeur d'impulsion PWM brute (version async).
         
-        Méthode avancée pour un contrôle fin.
+        Méthode avancée pour un contrôle fin. Aucune écriture I2C si la
+        même largeur d'impulsion a déjà été écrite sur ce canal.
         
         Args:
             channel: Numéro du canal (0-31)
             pulse_width: Largeur d'impulsion en µs
+            force: Écrit même si la largeur d'impulsion est inchangée
             
         Raises:
             ValueError: Si valeurs hors limites
@@ -254,19 +453,17 @@ class PCA9685ServoController(IServoController):
                 f"({self._min_pulse}-{self._max_pulse})"
             )
         
+        if not force and self._current_pulses.get(channel) == pulse_width:
+            return
+        
         try:
-            if channel < 16:
-                await self._pca_low.set_servo_pulse(channel, pulse_width)
-            else:
-                await self._pca_high.set_servo_pulse(channel - 16, pulse_width)
-            
-            # Estimer l'angle pour le tracking
-            angle = self._pulse_to_angle(pulse_width)
-            self._current_angles[channel] = angle
+            await self._write_count_unchecked(channel, self._pulse_to_count(pulse_width))
             
-            self.logger.debug(
-                f"Servo {channel}: PWM={pulse_width}µs (angle≈{angle}°)"
-            )
+            # L'angle en cache ne correspond plus : le prochain set_angle
+            # écrit. L'angle estimé n'est dérivé de l'impulsion que pour
+            # get_angle/get_status.
+            self._angle_set &= ~(1 << channel)
+            self._current_pulses[channel] = pulse_width
             
         except Exception as e:
             self.logger.error(
@@ -274,13 +471,83 @@ class PCA9685ServoController(IServoController):
             )
             raise
     
+    def queue_angle(self, channel: int, angle: int) -> None:
+        """Enregistre une cible d'angle sans attendre l'écriture I2C.
+        
+        La tâche d'écriture (start_writer) envoie les cibles en attente en
+        un seul set_angles_async ; une cible remplacée avant l'envoi n'est
+        jamais écrite.
+        
+        Args:
+            channel: Numéro du canal (0-31)
+            angle: Angle cible en degrés (0-180), arrondi au degré près
+            
+        Raises:
+            ValueError: Si channel ou angle hors limites
+            RuntimeError: Si la tâche d'écriture n'est pas démarrée
+        """
+        if self._pending_event is None:
+            raise RuntimeError("Tâche d'écriture non démarrée, appeler start_writer()")
+        if not 0 <= channel < 32:
+            raise ValueError(f"Canal {channel} hors limites (0-31)")
+        if not 0 <= angle <= 180:
+            raise ValueError(f"Angle {angle} hors limites (0-180)")
+        
+        # Les cibles en attente tiennent sur un octet : un angle flottant
+        # est arrondi ici plutôt que de lever TypeError dans le bytearray
+        self._pending[channel] = round(angle)
+        self._pending_set |= 1 << channel
+        self._pending_event.set()
+    
+    def start_writer(self) -> None:
+        """Démarre la tâche d'écriture différée sur la boucle courante."""
+        if self._writer_task is not None and not self._writer_task.done():
+            return
+        event = asyncio.Event()
+        self._pending_event = event
+        self._writer_task = asyncio.get_running_loop().create_task(self._writer_loop(event))
+    
+    async def stop_writer(self) -> None:
+        """Arrête la tâche d'écriture après avoir envoyé les cibles en attente."""
+        task = self._writer_task
+        if task is None:
+            return
+        self._writer_task = None
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        await self.flush()
+        self._pending_event = None
+    
+    async def flush(self) -> None:
+        """Envoie immédiatement les cibles en attente (un seul lot)."""
+        pending_set = self._pending_set
+        if not pending_set:
+            return
+        self._pending_set = 0
+        pending = self._pending
+        await self.set_angles_async(
+            [(ch, pending[ch]) for ch in range(32) if pending_set >> ch & 1]
+        )
+    
+    async def _writer_loop(self, event: asyncio.Event) -> None:
+        while True:
+            await event.wait()
+            event.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                self.logger.error(f"Échec écriture différée: {e}")
+    
     async def cleanup(self) -> None:
         """Nettoyage du contrôleur (désactive les sorties)."""
         self.logger.info("Nettoyage PCA9685ServoController")
         
         try:
+            await self.stop_writer()
             await self.relax()
-            self._current_angles.clear()
             self.logger.info("PCA9685ServoController nettoyé")
             
         except Exception as e:
@@ -293,42 +560,68 @@ class PCA9685ServoController(IServoController):
         # Our set_all_pwm handles the register writing.
         await self._pca_low.set_all_pwm(0, 4096)
         await self._pca_high.set_all_pwm(0, 4096)
-        self._current_angles.clear()
+        self._pending_set = 0
+        self._angle_set = 0
+        self._current_pulses.clear()
     
     def reset(self) -> None:
         """Remet tous les servos en position neutre (90°)."""
-        import asyncio
-        
         try:
-            try:
-                loop = asyncio.get_running_loop()
-                asyncio.create_task(self.reset_async())
-            except RuntimeError:
-                asyncio.run(self.reset_async())
+            self._run_sync("reset", self.reset_async())
         except Exception as e:
             self.logger.error(f"Erreur reset: {e}")
             raise
     
     async def reset_async(self) -> None:
-        """Remet tous les servos en position neutre (90°) - version async."""
+        """Remet tous les servos en position neutre (90°) - version async.
+        
+        La cible étant la même pour les 32 canaux, chaque carte reçoit une
+        seule écriture ALL_LED ; en cas d'échec, repli canal par canal.
+        """
         self.logger.info("Reset de tous les servos à 90°")
         
+        count = self._angle_to_count[90]
+        try:
+            # Même bus I2C pour les deux cartes : écritures séquentielles
+            await self._pca_low.set_all_pwm(0, count)
+            await self._pca_high.set_all_pwm(0, count)
+        except Exception as e:
+            self.logger.warning(f"Échec reset ALL_LED, repli canal par canal: {e}")
+        else:
+            self._current_angles[:] = bytes([90]) * 32
+            self._angle_set = 0xFFFFFFFF
+            self._current_pulses.clear()
+            return
+        
         for channel in range(32):
             try:
-                await self.set_angle_async(channel, 90)
+                await self.set_angle_async(channel, 90, force=True)
             except Exception as e:
                 self.logger.warning(
                     f"Échec reset servo {channel}: {e}"
                 )
     
-    def get_status(self) -> Dict[str, Any]:
-        """Retourne le statut du contrôleur."""
-        return {
-            "type": "pca9685_servo_controller_dual",
+    def get_status(self, include_angles: bool = False) -> Dict[str, Any]:
+        """Retourne le statut du contrôleur.
+        
+        Args:
+            include_angles: Ajoute les angles commandés (canal -> angle),
+                construits à la demande ; omis par défaut pour les
+                interrogations fréquentes (télémétrie)
+        """
+        status = {
+            **self._static_status,
             "available": self.is_available(),
-            "min_pulse": self._min_pulse,
-            "max_pulse": self._max_pulse,
-            "current_angles": dict(self._current_angles),
             "pca_low_status": self._pca_low.get_status(),
             "pca_high_status": self._pca_high.get_status()
         }
+        if include_angles:
+            angles = {
+                i: self._current_angles[i]
+                for i in range(32)
+                if self._angle_set >> i & 1
+            }
+            for channel, pulse in self._current_pulses.items():
+                angles[channel] = self._pulse_to_angle(pulse)
+            status["current_angles"] = dict(sorted(angles.items()))
+        return status
@@ -1,12 +1,69 @@
 """Ultrasonic sensor driver using gpiozero."""
 import asyncio
-from typing import Dict, Any, Optional
+import importlib
+import os
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from functools import lru_cache
+from statistics import median
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 import structlog
-from gpiozero import DistanceSensor, BadPinFactory
+from gpiozero import DistanceSensor, GPIOZeroError
 from tachikoma.core.hardware.interfaces.base import IHardwareComponent, HardwareStatus
 
 logger = structlog.get_logger()
 
+# Pin factories to force when the default one fails, in order of preference
+_FACTORIES = (
+    ("lgpio", "gpiozero.pins.lgpio", "LGPIOFactory"),
+    ("rpigpio", "gpiozero.pins.rpigpio", "RPiGPIOFactory"),
+    ("pigpio", "gpiozero.pins.pigpio", "PiGPIOFactory"),
+)
+
+# Errors meaning "this pin factory can't drive the pins" (RPi.GPIO raises
+# RuntimeError on a Pi 5, /dev/gpiomem access raises OSError); anything else
+# is a bug and propagates
+_PIN_ERRORS = (GPIOZeroError, RuntimeError, OSError)
+
+
+@lru_cache(maxsize=None)
+def _available_factories() -> Tuple[Tuple[str, type], ...]:
+    """Import each factory module once per process, keeping the importable ones."""
+    available = []
+    for name, module_name, class_name in _FACTORIES:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            continue
+        available.append((name, getattr(module, class_name)))
+    return tuple(available)
+
+
+def _pigpiod_reachable(timeout: float = 0.2) -> bool:
+    """TCP probe of pigpiod, at the PIGPIO_ADDR/PIGPIO_PORT pigpio itself uses."""
+    host = os.environ.get("PIGPIO_ADDR") or "localhost"
+    port = int(os.environ.get("PIGPIO_PORT") or 8888)
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def _preferred_factories() -> Tuple[Tuple[str, type], ...]:
+    """Importable factories, pigpio first whenever its daemon is running.
+    
+    With pigpio the echo edges are timestamped by pigpiod (1 us ticks)
+    instead of by a Python thread, so GIL or scheduler latency no longer
+    shows up in the measured distance.
+    """
+    factories = _available_factories()
+    pigpio = tuple(f for f in factories if f[0] == "pigpio")
+    if pigpio and _pigpiod_reachable():
+        return pigpio + tuple(f for f in factories if f[0] != "pigpio")
+    return factories
+
 
 class UltrasonicSensor(IHardwareComponent):
     """Driver for HC-SR04 ultrasonic distance sensor.
@@ -33,6 +90,10 @@ class UltrasonicSensor(IHardwareComponent):
         self._max_dist = max_distance
         self._sensor: Optional[DistanceSensor] = None
         self._status = HardwareStatus.UNINITIALIZED
+        # Dedicated lane for blocking pin-factory work, so a slow GPIO setup
+        # never queues behind camera/network jobs on the default executor.
+        # Created on first initialize(), shut down by cleanup()
+        self._hw_exec: Optional[ThreadPoolExecutor] = None
     
     async def initialize(self) -> bool:
         """Initialize the sensor hardware."""
@@ -46,8 +107,10 @@ class UltrasonicSensor(IHardwareComponent):
             
             # Initialize gpiozero sensor
             # Run in executor to avoid blocking if pin factory is slow
+            if self._hw_exec is None:
+                self._hw_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hw-io")
             loop = asyncio.get_running_loop()
-            await loop.run_in_executor(None, self._init_device)
+            await loop.run_in_executor(self._hw_exec, self._init_device)
             
             self._status = HardwareStatus.READY
             return True
@@ -61,64 +124,79 @@ class UltrasonicSensor(IHardwareComponent):
             self._status = HardwareStatus.ERROR
             return False
 
+    def _make_sensor(self) -> DistanceSensor:
+        """Create the gpiozero sensor with the current pin factory.
+        
+        partial=True: gpiozero's background thread keeps pinging and
+        median-smoothing, but reading .distance no longer blocks until its
+        queue is full (~0.5s at 16Hz) - that wait used to land on the
+        event loop on the first get_distance().
+        """
+        return DistanceSensor(
+            echo=self._echo,
+            trigger=self._trigger,
+            max_distance=self._max_dist,
+            partial=True
+        )
+
     def _init_device(self):
-        """Internal synchronous initialization with factory fallback."""
-        try:
-            self._sensor = DistanceSensor(
-                echo=self._echo,
-                trigger=self._trigger,
-                max_distance=self._max_dist
-            )
-        except (BadPinFactory, Exception) as e:
-            logger.warning("ultrasonic.gpio_issue", error=str(e))
-            
-            # Try to force a factory if default fails
+        """Internal synchronous initialization with factory fallback.
+        
+        Unless a pin factory was chosen explicitly (GPIOZERO_PIN_FACTORY or
+        a previous Device.pin_factory), go straight to the preference list:
+        pigpio when pigpiod is reachable, then lgpio whenever it is
+        importable, instead of whatever gpiozero's own discovery order
+        picks first.
+        """
+        from gpiozero import Device
+        
+        if Device.pin_factory is not None or os.environ.get("GPIOZERO_PIN_FACTORY"):
             try:
-                from gpiozero import Device
-                # List of factories to try in order of preference
-                for factory_name in ['lgpio', 'rpigpio', 'pigpio', 'native']:
-                    try:
-                        if factory_name == 'lgpio':
-                            from gpiozero.pins.lgpio import LGPIOFactory
-                            Device.pin_factory = LGPIOFactory()
-                        elif factory_name == 'rpigpio':
-                            from gpiozero.pins.rpigpio import RPiGPIOFactory
-                            Device.pin_factory = RPiGPIOFactory()
-                        elif factory_name == 'pigpio':
-                            from gpiozero.pins.pigpio import PiGPIOFactory
-                            Device.pin_factory = PiGPIOFactory()
-                        
-                        logger.info("ultrasonic.factory_switch", factory=factory_name)
-                        self._sensor = DistanceSensor(
-                            echo=self._echo,
-                            trigger=self._trigger,
-                            max_distance=self._max_dist
-                        )
-                        return # Success
-                    except (ImportError, Exception):
-                        continue
-                
-                # Ultimate fallback to Mock
-                logger.warning(
-                    "ultrasonic.mock_fallback", 
-                    msg="All hardware factories failed. On Pi 4/5 with Python 3.13+, you MUST install 'lgpio' (e.g., sudo apt install python3-lgpio)."
-                )
-                from gpiozero.pins.mock import MockFactory
-                Device.pin_factory = MockFactory()
-                self._sensor = DistanceSensor(
-                    echo=self._echo,
-                    trigger=self._trigger,
-                    max_distance=self._max_dist
-                )
-            except Exception as final_e:
-                logger.error("ultrasonic.final_init_failed", error=str(final_e))
-                raise
+                self._sensor = self._make_sensor()
+                return
+            except _PIN_ERRORS as e:
+                logger.warning("ultrasonic.gpio_issue", error=str(e))
+        
+        # Force each importable factory in order of preference
+        for factory_name, factory_cls in _preferred_factories():
+            factory = None
+            try:
+                factory = factory_cls()
+                Device.pin_factory = factory
+                self._sensor = self._make_sensor()
+            except Exception as e:  # backend libraries raise their own types
+                logger.debug("ultrasonic.factory_failed", factory=factory_name, error=str(e))
+                if factory is not None:
+                    # Release the chip handle / daemon connection before the next backend
+                    with suppress(Exception):
+                        factory.close()
+                    Device.pin_factory = None
+                continue
+            logger.info("ultrasonic.factory_switch", factory=factory_name)
+            return
+        
+        # Ultimate fallback to Mock
+        logger.warning(
+            "ultrasonic.mock_fallback", 
+            msg=(
+                "All hardware factories failed. On Pi 4/5 with Python 3.13+, you MUST "
+                "install 'lgpio' (e.g., sudo apt install python3-lgpio)."
+            )
+        )
+        try:
+            from gpiozero.pins.mock import MockFactory
+            Device.pin_factory = MockFactory()
+            self._sensor = self._make_sensor()
+        except Exception as final_e:
+            logger.error("ultrasonic.final_init_failed", error=str(final_e))
+            raise
 
     async def get_distance(self) -> Optional[float]:
         """Get distance measurement in centimeters.
         
         Returns:
-            Distance in cm, or None if measurement failed
+            Distance in cm, or 0.0 if the sensor is not ready or the
+            measurement failed (unlike devices.ultrasonic, never None)
         """
         if not self.is_available() or not self._sensor:
             return 0.0
@@ -127,9 +205,9 @@ class UltrasonicSensor(IHardwareComponent):
             # We use a small retry for stability on "no echo"
             for _ in range(2):
                 try:
-                    # gpiozero property access is synchronous
-                    dist = self._sensor.distance * 100
-                    return round(float(dist), 1)
+                    # Non-blocking with partial=True: returns the median of
+                    # the pings gpiozero's thread has already collected
+                    return round(self._sensor.distance * 100, 1)
                 except Exception as e:
                     if "no echo" in str(e).lower():
                         await asyncio.sleep(0.01)
@@ -140,11 +218,115 @@ class UltrasonicSensor(IHardwareComponent):
             logger.warning("ultrasonic.read_failed", error=str(e))
             return 0.0
 
+    async def measure_distance(
+        self,
+        samples: int = 3,
+        interval: float = 0.06
+    ) -> Optional[float]:
+        """Median of several pings, with outlier rejection.
+        
+        Pings stay sequential (HC-SR04 needs ~60ms between them). Samples
+        further than 2 x MAD from the median (specular reflections, missed
+        echoes) are dropped before taking the final median.
+        
+        Args:
+            samples: Number of pings
+            interval: Delay between pings in seconds
+            
+        Returns:
+            Distance in cm, or None if no ping succeeded
+        """
+        readings: List[float] = []
+        for i in range(samples):
+            if i:
+                await asyncio.sleep(interval)
+            dist = await self.get_distance()
+            if dist:  # 0.0 means the read failed
+                readings.append(dist)
+        return _robust_median(readings)
+
+    async def is_obstacle_detected(
+        self,
+        threshold_cm: float,
+        samples: int = 3,
+        interval: float = 0.06
+    ) -> bool:
+        """Check for an obstacle closer than threshold_cm.
+        
+        Returns as soon as one ping is under half the threshold, without
+        waiting for the remaining samples; otherwise compares the robust
+        median to the threshold.
+        """
+        readings: List[float] = []
+        for i in range(samples):
+            if i:
+                await asyncio.sleep(interval)
+            dist = await self.get_distance()
+            if not dist:
+                continue
+            if dist < threshold_cm * 0.5:
+                return True
+            readings.append(dist)
+        
+        distance = _robust_median(readings)
+        return distance is not None and distance < threshold_cm
+
+    async def continuous_monitoring(
+        self,
+        callback: Callable[[float], Awaitable[Any]],
+        interval: float = 0.06,
+        samples: int = 1
+    ) -> None:
+        """Measure continuously and pass each distance to callback.
+        
+        Measuring and the callback run as a producer/consumer pair: the
+        next ping starts while the callback is still processing the last
+        one. If the callback falls behind, the oldest pending sample is
+        dropped so it always sees fresh distances. Runs until cancelled or
+        until the callback (or a measurement) raises.
+        
+        Args:
+            callback: Coroutine function called with each distance in cm
+            interval: Delay between measurements in seconds
+            samples: Pings per measurement (see measure_distance)
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+        
+        async def produce() -> None:
+            try:
+                while True:
+                    distance = await self.measure_distance(samples=samples)
+                    if distance is not None:
+                        if queue.full():
+                            queue.get_nowait()
+                        queue.put_nowait(distance)
+                    await asyncio.sleep(interval)
+            except Exception as e:
+                # Hand the failure to the consumer instead of dying silently
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(e)
+        
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                item = await queue.get()
+                if isinstance(item, Exception):
+                    raise item
+                await callback(item)
+        finally:
+            producer.cancel()
+            with suppress(asyncio.CancelledError):
+                await producer
+
     async def cleanup(self) -> None:
         """Release hardware resources."""
         if self._sensor:
             self._sensor.close()
             self._sensor = None
+        if self._hw_exec is not None:
+            self._hw_exec.shutdown(wait=False)
+            self._hw_exec = None
         self._status = HardwareStatus.UNINITIALIZED
 
     def is_available(self) -> bool:
@@ -164,4 +346,17 @@ class UltrasonicSensor(IHardwareComponent):
             "healthy": self._status == HardwareStatus.READY,
             "error": None if self._status == HardwareStatus.READY else "Sensor not ready",
             "connected": self._sensor is not None
-        }
\ No newline at end of file
+        }
+
+
+def _robust_median(readings: List[float]) -> Optional[float]:
+    """Median of readings after dropping samples beyond 2 x MAD."""
+    if not readings:
+        return None
+    if len(readings) < 3:
+        return round(median(readings), 1)
+    
+    mid = median(readings)
+    mad = median(abs(r - mid) for r in readings)
+    kept = [r for r in readings if abs(r - mid) <= 2 * mad] if mad else readings
+    return round(median(kept), 1)
@@ -1,21 +1,24 @@
 """Hardware factory for creating controller instances with HAL architecture."""
+from __future__ import annotations
+
+import asyncio
 import platform
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 import structlog
 
 from tachikoma.core.config import Settings
 from tachikoma.core.hardware.interfaces import IServoController
 from tachikoma.core.hardware.interfaces.i2c import I2CInterface, SMBusI2CInterface
-from tachikoma.core.hardware.drivers import (
-    PCA9685,
-    PCA9685ServoController,
-    MockServoController,
-    ADC,
-    MPU6050,
-    UltrasonicSensor,
-    CameraDriver,
-)
-from tachikoma.core.hardware.devices.led import LEDStrip
+
+if TYPE_CHECKING:
+    # Les drivers sont importés à la création : un composant jamais demandé
+    # ne charge pas ses dépendances (picamera2/OpenCV, numpy, gpiozero, spidev)
+    from tachikoma.core.hardware.drivers.adc import ADC
+    from tachikoma.core.hardware.drivers.camera import CameraDriver
+    from tachikoma.core.hardware.drivers.imu import MPU6050
+    from tachikoma.core.hardware.drivers.pca9685 import PCA9685
+    from tachikoma.core.hardware.drivers.ultrasonic import UltrasonicSensor
+    from tachikoma.core.hardware.devices.led import LEDStrip
 
 logger = structlog.get_logger()
 
@@ -45,7 +48,7 @@ class HardwareFactory:
         self._i2c: Optional[I2CInterface] = None
         
         # Drivers de base
-        self._pca9685: Optional[PCA9685] = None
+        self._pca_cache: Dict[Tuple[int, int], PCA9685] = {}
         self._adc: Optional[ADC] = None
         self._imu: Optional[MPU6050] = None
         self._ultrasonic: Optional[UltrasonicSensor] = None
@@ -67,7 +70,9 @@ class HardwareFactory:
         """
         if self._i2c is None:
             logger.info("hardware_factory.creating_i2c_interface")
-            self._i2c = SMBusI2CInterface(bus_number=1)
+            self._i2c = SMBusI2CInterface(
+                bus_number=1, i2c_frequency=self.settings.i2c_frequency
+            )
             await self._i2c.initialize()
         
         return self._i2c
@@ -82,12 +87,8 @@ class HardwareFactory:
         Returns:
             Driver PCA9685 initialisé
         """
-        # Initialize cache if needed (replaces single instance self._pca9685)
-        if not hasattr(self, "_pca_cache"):
-            self._pca_cache = {}
-            
-        # Check cache
-        cache_key = f"{address}_{frequency}"
+        # Une instance par (adresse, fréquence) : les deux cartes servo
+        cache_key = (address, frequency)
         if cache_key in self._pca_cache:
             return self._pca_cache[cache_key]
             
@@ -96,6 +97,8 @@ class HardwareFactory:
             address=hex(address),
             frequency=frequency
         )
+        from tachikoma.core.hardware.drivers.pca9685 import PCA9685
+
         i2c = await self.get_i2c_interface()
         pca = PCA9685(i2c=i2c, address=address, frequency=frequency)
         await pca.initialize()
@@ -117,6 +120,8 @@ class HardwareFactory:
                 "hardware_factory.creating_adc",
                 address=hex(address)
             )
+            from tachikoma.core.hardware.drivers.adc import ADC
+
             i2c = await self.get_i2c_interface()
             self._adc = ADC(i2c=i2c, address=address)
             await self._adc.initialize()
@@ -137,6 +142,8 @@ class HardwareFactory:
                 "hardware_factory.creating_imu",
                 address=hex(address)
             )
+            from tachikoma.core.hardware.drivers.imu import MPU6050
+
             i2c = await self.get_i2c_interface()
             self._imu = MPU6050(i2c=i2c, address=address)
             await self._imu.initialize()
@@ -163,6 +170,8 @@ class HardwareFactory:
                 trigger=trigger_pin,
                 echo=echo_pin
             )
+            from tachikoma.core.hardware.drivers.ultrasonic import UltrasonicSensor
+
             self._ultrasonic = UltrasonicSensor(
                 trigger_pin=trigger_pin,
                 echo_pin=echo_pin
@@ -192,6 +201,8 @@ class HardwareFactory:
                 "hardware_factory.creating_camera",
                 resolution=resolution
             )
+            from tachikoma.core.hardware.drivers.camera import CameraDriver
+
             self._camera = CameraDriver(
                 resolution=resolution,
                 hflip=hflip,
@@ -220,6 +231,8 @@ class HardwareFactory:
                 type="mock",
                 channels=32,
             )
+            from tachikoma.core.hardware.drivers.mock_servo import MockServoController
+
             self._servo_controller = MockServoController(channels=32)
             await self._servo_controller.initialize()
             return self._servo_controller
@@ -241,6 +254,8 @@ class HardwareFactory:
             pca_high = await self.get_pca9685(address=0x40, frequency=50)
             
             # Créer le contrôleur de servos avec les deux boards
+            from tachikoma.core.hardware.drivers.pca9685_servo import PCA9685ServoController
+
             self._servo_controller = PCA9685ServoController(
                 pca_low=pca_low,
                 pca_high=pca_high,
@@ -299,6 +314,8 @@ class HardwareFactory:
                 bus=bus,
                 device=device
             )
+            from tachikoma.core.hardware.devices.led import LEDStrip
+
             self._led_strip = LEDStrip(
                 led_count=led_count,
                 brightness=brightness,
@@ -309,82 +326,61 @@ class HardwareFactory:
         
         return self._led_strip
     
-    async def cleanup_all(self):
-        """Nettoyage de toutes les ressources hardware."""
-        logger.info("hardware_factory.cleanup_all")
-        
-        # Nettoyer les contrôleurs haut niveau
-        if self._servo_controller:
-            try:
-                await self._servo_controller.cleanup()
-                self._servo_controller = None
-            except Exception as e:
-                logger.error(
-                    "hardware_factory.servo_cleanup_failed",
-                    error=str(e)
-                )
-
-                # Nettoyer les devices
-        if self._led_strip:
-            try:
-                await self._led_strip.cleanup()
-                self._led_strip = None
-            except Exception as e:
-                logger.error(
-                    "hardware_factory.led_cleanup_failed",
-                    error=str(e)
-                )
-        
-        # Nettoyer les drivers de base
-        if self._imu:
-            try:
-                await self._imu.cleanup()
-                self._imu = None
-            except Exception as e:
-                logger.error(
-                    "hardware_factory.imu_cleanup_failed",
-                    error=str(e)
-                )
-
-        if self._ultrasonic:
-            try:
-                await self._ultrasonic.cleanup()
-                self._ultrasonic = None
-            except Exception as e:
-                logger.error(
-                    "hardware_factory.ultrasonic_cleanup_failed",
-                    error=str(e)
-                )
-        
-        if self._camera:
-            try:
-                await self._camera.cleanup()
-                self._camera = None
-            except Exception as e:
-                logger.error(
-                    "hardware_factory.camera_cleanup_failed",
-                    error=str(e)
-                )
+    async def __aenter__(self) -> HardwareFactory:
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        # Libère le matériel même si le bloc a levé une exception
+        await self.cleanup_all()
+    
+    async def _cleanup_parallel(self, components) -> None:
+        """Nettoie en parallèle des composants indépendants.
         
-        if self._adc:
-            try:
-                await self._adc.cleanup()
-                self._adc = None
-            except Exception as e:
+        Args:
+            components: Triplets (attribut à remettre à None si le nettoyage
+                réussit ou None, composant, contexte de log avec la clé
+                "component")
+        """
+        results = await asyncio.gather(
+            *(component.cleanup() for _, component, _ in components),
+            return_exceptions=True
+        )
+        for (reset_attr, _, context), result in zip(components, results):
+            if isinstance(result, BaseException):
                 logger.error(
-                    "hardware_factory.adc_cleanup_failed",
-                    error=str(e)
+                    "hardware_factory.cleanup_failed",
+                    error=str(result),
+                    **context
                 )
+            elif reset_attr is not None:
+                setattr(self, reset_attr, None)
+    
+    async def cleanup_all(self):
+        """Nettoyage de toutes les ressources hardware."""
+        logger.info("hardware_factory.cleanup_all")
         
-        if self._pca9685:
-            try:
-                await self._pca9685.cleanup()
-                self._pca9685 = None
-            except Exception as e:
-                logger.error(
-                    "hardware_factory.pca9685_cleanup_failed",
-                    error=str(e)
-                )
+        # Nettoyer les contrôleurs haut niveau et les devices, avant les
+        # drivers PCA9685 que le contrôleur de servos utilise encore
+        await self._cleanup_parallel([
+            (attr, getattr(self, attr), {"component": attr[1:]})
+            for attr in ("_servo_controller", "_led_strip")
+            if getattr(self, attr)
+        ])
+        
+        # Nettoyer les drivers de base, indépendants entre eux : la caméra
+        # et l'ultrason (hors bus I2C) s'arrêtent pendant les écritures I2C
+        drivers = [
+            (attr, getattr(self, attr), {"component": attr[1:]})
+            for attr in ("_imu", "_ultrasonic", "_camera", "_adc")
+            if getattr(self, attr)
+        ]
+        # Les PCA9685 vivent dans _pca_cache, vidé une fois tous nettoyés
+        drivers += [
+            (None, pca, {"component": "pca9685", "address": hex(address)})
+            for (address, _), pca in self._pca_cache.items()
+        ]
+        await self._cleanup_parallel(drivers)
+        self._pca_cache.clear()
         
         # Nettoyer l'interface I2C (en dernier)
         if self._i2c:
@@ -8,14 +8,62 @@ The MovementController calls it repeatedly for continuous movement.
 """
 import asyncio
 import math
-import copy
-from typing import List, Tuple, Callable, Awaitable
+from collections import OrderedDict
+from typing import List, Optional, Tuple, Callable, Awaitable
 from dataclasses import dataclass
+from functools import lru_cache
 from enum import Enum
+import numpy as np
 import structlog
 
 logger = structlog.get_logger()
 
+# Tripod groups as row slices of the (6, 3) points array (views, no copy)
+_EVEN = slice(0, 6, 2)  # Legs 0, 2, 4
+_ODD = slice(1, 6, 2)   # Legs 1, 3, 5
+
+# Per-phase multipliers of the tripod frame deltas (phases 0-6): even
+# legs' xy (of xy) and z (of z), then the odd legs'
+_TRIPOD_STEPS = (
+    np.array([-4, -4, 0, 8, 0, -4, -4], dtype=float),
+    np.array([0, 0, 8, 0, -8, 0, 0], dtype=float),
+    np.array([8, 0, -4, -4, -4, 0, 8], dtype=float),
+    np.array([0, -8, 0, 0, 0, 8, 0], dtype=float),
+)
+
+# Cycles cached per executor, up to ~24 KB each (slowest wave gait).
+# Keys are the exact parameters: the API and WebSocket handlers send whole
+# mm/degrees, so a held joystick direction hits; continuously varying
+# float inputs would only churn through the LRU without a hit.
+_TRAJECTORY_CACHE_SIZE = 64
+
+# Wave gait: one leg at a time, in the legacy order
+_WAVE_LEG_ORDER = (5, 2, 1, 0, 3, 4)
+
+
+@lru_cache(maxsize=None)
+def _tripod_frame_phases(F: int) -> Tuple[int, ...]:
+    """Phase (0-6) of every frame of an F-frame tripod cycle.
+
+    Index of the first boundary above j in the legacy ladder
+    (F/8, F/4, 3F/8, 5F/8, 3F/4, 7F/8); F only takes a handful of
+    values (one per speed), so each table is built once per process.
+    """
+    bounds = np.array([F / 8, F / 4, 3 * F / 8, 5 * F / 8, 3 * F / 4, 7 * F / 8])
+    return tuple(np.searchsorted(bounds, np.arange(F), side="right").tolist())
+
+
+@lru_cache(maxsize=None)
+def _batch_ends(frames: int, batch: int) -> Tuple[Tuple[int, int], ...]:
+    """(frame index, frames covered) of each frame sent to the servos.
+
+    Every `batch`-th frame is sent, and always the last one.
+    """
+    ends = list(range(batch - 1, frames, batch))
+    if frames and (not ends or ends[-1] != frames - 1):
+        ends.append(frames - 1)
+    return tuple(zip(ends, [e - p for e, p in zip(ends, [-1] + ends)]))
+
 
 class GaitType(Enum):
     """Available gait patterns."""
@@ -28,6 +76,26 @@ class GaitConfig:
     """Gait configuration parameters."""
     step_height: float = 70.0     # Height to lift legs (mm)
     delay: float = 0.005           # Delay between frames (seconds)
+    servo_period: float = 0.02     # PWM refresh period of the servo boards (seconds)
+
+    def __post_init__(self) -> None:
+        # Rejected when the executor is built, not in the middle of a walk
+        if self.step_height <= 0:
+            raise ValueError(f"step_height must be positive, got {self.step_height}")
+        if self.delay < 0 or self.servo_period < 0:
+            raise ValueError(
+                f"delay and servo_period must be >= 0, got {self.delay}, {self.servo_period}"
+            )
+
+    def frames_per_batch(self) -> int:
+        """Number of frames computed per servo update.
+
+        The PCA9685 only latches a new pulse once per PWM period, so frames
+        computed faster than that are folded into one update and one sleep.
+        """
+        if self.delay <= 0:
+            return 1
+        return max(1, int(self.servo_period / self.delay))
 
 
 class GaitExecutor:
@@ -52,13 +120,21 @@ class GaitExecutor:
             update_callback: Async function to call with new positions
             config: Gait configuration
         """
-        self.body_points = copy.deepcopy(body_points)
+        # (6, 3) float arrays: one row per leg, phase updates work on
+        # whole tripod groups at once (the setter also resets the caches)
+        self.body_points = body_points
         self.update_callback = update_callback
         self.config = config or GaitConfig()
         self._running = False
 
         # Working copy of points - persists across cycles for accumulation
-        self._points = copy.deepcopy(body_points)
+        self._points = self.body_points.copy()
+
+        # Build the tripod phase tables of every speed now rather than on
+        # the first cycle at each speed
+        for (_, gait_type), frames in self._FRAME_TABLE.items():
+            if gait_type == GaitType.TRIPOD:
+                _tripod_frame_phases(frames)
 
         # State for continuous movement
         self.x = 0.0
@@ -73,6 +149,26 @@ class GaitExecutor:
             delay=self.config.delay
         )
 
+    @property
+    def body_points(self) -> np.ndarray:
+        """Rest pose, shape (6, 3). Assign a new pose rather than mutating it."""
+        return self._body_points
+
+    @body_points.setter
+    def body_points(self, body_points: List[List[float]]) -> None:
+        self._body_points = np.array(body_points, dtype=np.float64)
+
+        # Everything below derives from the rest pose.
+        # Last leg offsets and their (x, y, angle, frames) key: a held
+        # joystick direction reuses them cycle after cycle
+        self._offsets_key: Optional[Tuple[float, float, float, int]] = None
+        self._offsets: Optional[np.ndarray] = None
+
+        # Full cycles started from the rest pose, shape (frames, 6, 3), keyed
+        # by (gait, x, y, angle, frames, step height); least recently used
+        # first, so commands the operator comes back to stay cached
+        self._trajectories: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+
     def update_params(self, x: float, y: float, speed: int, angle: float, duration: float = 2.0) -> None:
         """Update movement parameters on the fly."""
         self.x = max(-35, min(35, x))
@@ -82,27 +178,137 @@ class GaitExecutor:
         self.duration = duration
         logger.debug("gait.params_updated", x=self.x, y=self.y, speed=self.speed, angle=self.angle)
 
-    @staticmethod
-    def _map_speed_to_frames(speed: int, gait_type: GaitType) -> int:
+    # Frame count per (speed, gait): exactly legacy map_value(speed, 2, 10, high, low)
+    # Tripod: speed 2 -> 126 frames, speed 10 -> 22 frames
+    # Wave:   speed 2 -> 171 frames, speed 10 -> 45 frames
+    _FRAME_RANGES = {GaitType.TRIPOD: (126, 22), GaitType.WAVE: (171, 45)}
+    _FRAME_TABLE = {
+        (s, gait): round(high - (s - 2) * (high - low) / 8)
+        for gait, (high, low) in _FRAME_RANGES.items()
+        for s in range(2, 11)
+    }
+
+    @classmethod
+    def _map_speed_to_frames(cls, speed: int, gait_type: GaitType) -> int:
         """Map speed (2-10) to frame count.
 
         Exactly matches legacy: map_value(speed, 2, 10, high, low)
         Higher speed = fewer frames = faster movement.
         """
         speed = max(2, min(10, speed))
+        frames = cls._FRAME_TABLE.get((speed, gait_type))
+        if frames is None:
+            # Non-integer speed: interpolate like the table does
+            high, low = cls._FRAME_RANGES[gait_type]
+            frames = round(high - (speed - 2) * (high - low) / 8)
+        return frames
 
-        if gait_type == GaitType.TRIPOD:
-            # Speed 2 -> 126 frames, Speed 10 -> 22 frames
-            return round(126 - (speed - 2) * (126 - 22) / 8)
-        else:
-            # Speed 2 -> 171 frames, Speed 10 -> 45 frames
-            return round(171 - (speed - 2) * (171 - 45) / 8)
+    def _calculate_leg_offsets(self, x: float, y: float, angle: float, F: int) -> np.ndarray:
+        """Per-frame XY step of each leg, shape (6, 2): translation plus body rotation.
+
+        The result is cached for the next cycle and must not be modified.
+        """
+        key = (x, y, angle, F)
+        if key == self._offsets_key:
+            return self._offsets
+
+        angle_rad = math.radians(angle)
+        cos_a = math.cos(angle_rad)
+        sin_a = math.sin(angle_rad)
+        bx = self.body_points[:, 0]
+        by = self.body_points[:, 1]
+        xy = np.empty((6, 2))
+        xy[:, 0] = ((bx * cos_a + by * sin_a - bx) + x) / F
+        xy[:, 1] = ((-bx * sin_a + by * cos_a - by) + y) / F
+        self._offsets_key = key
+        self._offsets = xy
+        return xy
 
     def reset_points(self) -> None:
         """Reset working points to initial body points."""
-        logger.debug("gait.reset_points.before", points_snapshot=self._points[0])
-        self._points = copy.deepcopy(self.body_points)
-        logger.debug("gait.reset_points.after", points_snapshot=self._points[0])
+        logger.debug("gait.reset_points.before", points_snapshot=self._points[0].tolist())
+        # In place: same buffer, no allocation (was a deepcopy of nested lists)
+        np.copyto(self._points, self.body_points)
+        logger.debug("gait.reset_points.after", points_snapshot=self._points[0].tolist())
+
+    def _cycle_frames(
+        self, gait_type: GaitType, x: float, y: float, angle: float, F: int
+    ) -> np.ndarray:
+        """Every frame of one cycle from the current points, shape (frames, 6, 3).
+
+        A cycle started from the rest pose (run_continuous and the movement
+        loop reset the points before each one) only depends on its
+        parameters, so the last _TRAJECTORY_CACHE_SIZE trajectories are kept.
+        The cache only pays off when the same parameters repeat; they are
+        read once per cycle, as in the legacy loop, so building the whole
+        cycle up front does not delay a new command. The result must not
+        be modified.
+        """
+        key = (gait_type, x, y, angle, F, self.config.step_height)
+        from_rest = np.array_equal(self._points, self.body_points)
+        if from_rest and key in self._trajectories:
+            self._trajectories.move_to_end(key)
+            return self._trajectories[key]
+
+        xy = self._calculate_leg_offsets(x, y, angle, F)
+        Z = self.config.step_height
+        if gait_type == GaitType.TRIPOD:
+            frames = self._tripod_frames(self._points.copy(), xy, Z, F)
+        else:
+            frames = self._wave_frames(self._points.copy(), xy, Z, F)
+
+        if from_rest:
+            self._trajectories[key] = frames
+            if len(self._trajectories) > _TRAJECTORY_CACHE_SIZE:
+                self._trajectories.popitem(last=False)
+        return frames
+
+    def _tripod_frames(self, points: np.ndarray, xy: np.ndarray, Z: float, F: int) -> np.ndarray:
+        """Tripod cycle frames, accumulated from `points` exactly like legacy.
+
+        Each frame adds one delta per coordinate, picked by phase from
+        _TRIPOD_STEPS with no per-frame branch; the running sum is the
+        same sequence of additions as the legacy in-place loop.
+        """
+        phases = np.asarray(_tripod_frame_phases(F))
+        even_xy, even_z, odd_xy, odd_z = (c[phases] for c in _TRIPOD_STEPS)
+        z = Z / F
+
+        deltas = np.empty((F + 1, 6, 3))
+        deltas[0] = points
+        deltas[1:, _EVEN, :2] = even_xy[:, None, None] * xy[_EVEN]
+        deltas[1:, _EVEN, 2] = (even_z * z)[:, None]
+        deltas[1:, _ODD, :2] = odd_xy[:, None, None] * xy[_ODD]
+        deltas[1:, _ODD, 2] = (odd_z * z)[:, None]
+        # Phase 0 (first frames) sets the odd legs' lift height rather
+        # than adding to it: start their z sum from there
+        deltas[0, _ODD, 2] = Z + self.body_points[_ODD, 2]
+        return np.add.accumulate(deltas, axis=0)[1:]
+
+    @staticmethod
+    def _wave_frames(points: np.ndarray, xy: np.ndarray, Z: float, F: int) -> np.ndarray:
+        """Wave cycle frames, one leg after the other, exactly like legacy."""
+        # Same split for every leg: lift, swing, lower
+        frames_per_leg = F // 6
+        lift_end = frames_per_leg // 3
+        swing_end = 2 * frames_per_leg // 3
+        n = 6 * frames_per_leg
+        j = np.tile(np.arange(frames_per_leg), 6)
+        legs = np.repeat(_WAVE_LEG_ORDER, frames_per_leg)
+        frame = np.arange(1, n + 1)
+
+        # The five other legs push the body forward, the current leg
+        # lifts, swings and lowers: branchless masks over the frame index
+        deltas = np.empty((n + 1, 6, 3))
+        deltas[0] = points
+        deltas[1:, :, :2] = -2 * xy
+        deltas[1:, :, 2] = 0.0
+        swing = (j >= lift_end) & (j < swing_end)
+        deltas[frame, legs, :2] = swing[:, None] * (30 * xy[legs])
+        deltas[frame, legs, 2] = (
+            (j < lift_end).astype(float) - (j >= swing_end)
+        ) * (18 * (Z / F))
+        return np.add.accumulate(deltas, axis=0)[1:]
 
     async def execute_tripod_cycle(
         self,
@@ -127,91 +333,47 @@ class GaitExecutor:
         )
 
         F = self._map_speed_to_frames(speed, GaitType.TRIPOD)
-        Z = self.config.step_height
-        z = Z / F
         delay = self.config.delay
 
         logger.debug(
             "gait.tripod_cycle.params_calculated",
-            frames=F, step_height=Z, z_increment=z, delay=delay
+            frames=F, step_height=self.config.step_height, delay=delay
         )
 
         # Calculate per-leg XY offsets (exactly like legacy)
-        angle_rad = math.radians(angle)
-        xy = []
-        for i in range(6):
-            bp = self.body_points[i]
-            dx = (
-                (bp[0] * math.cos(angle_rad) + bp[1] * math.sin(angle_rad) - bp[0]) + x
-            ) / F
-            dy = (
-                (-bp[0] * math.sin(angle_rad) + bp[1] * math.cos(angle_rad) - bp[1]) + y
-            ) / F
-            xy.append([dx, dy])
-
-        logger.debug("gait.tripod_cycle.offsets_calculated", xy_offsets=xy[:2])
+        xy = self._calculate_leg_offsets(x, y, angle, F)
+
+        logger.debug("gait.tripod_cycle.offsets_calculated", xy_offsets=xy[:2].tolist())
 
         # If no movement, just update position
         if x == 0 and y == 0 and angle == 0:
             logger.info("gait.tripod_cycle.no_movement_detected")
-            await self.update_callback(self._points)
+            await self.update_callback(self._points.tolist())
             return
 
         logger.info("gait.tripod_cycle.starting_loop", total_frames=F)
 
-        # ONE gait cycle - exactly like legacy
-        for j in range(F):
+        # ONE gait cycle - exactly like legacy, frames computed up front
+        frames = self._cycle_frames(GaitType.TRIPOD, x, y, angle, F)
+        points = self._points
+        update = self.update_callback
+        sleep = asyncio.sleep
+        now = asyncio.get_running_loop().time
+        # Frames are paced on absolute deadlines: a late wake-up or a slow
+        # update shortens the next sleep instead of stretching the cycle
+        deadline = now()
+        for j, covered in _batch_ends(F, self.config.frames_per_batch()):
             # ✅ REMOVED: if not self._running: break
-            
-            if j % 10 == 0:  # Log every 10 frames
-                logger.debug("gait.tripod_cycle.frame", frame=j, total=F)
-
-            for i in range(3):
-                even = 2 * i      # Legs 0, 2, 4
-                odd = 2 * i + 1   # Legs 1, 3, 5
-
-                if j < (F / 8):
-                    self._points[even][0] -= 4 * xy[even][0]
-                    self._points[even][1] -= 4 * xy[even][1]
-                    self._points[odd][0] += 8 * xy[odd][0]
-                    self._points[odd][1] += 8 * xy[odd][1]
-                    self._points[odd][2] = Z + self.body_points[odd][2]
-
-                elif j < (F / 4):
-                    self._points[even][0] -= 4 * xy[even][0]
-                    self._points[even][1] -= 4 * xy[even][1]
-                    self._points[odd][2] -= z * 8
-
-                elif j < (3 * F / 8):
-                    self._points[even][2] += z * 8
-                    self._points[odd][0] -= 4 * xy[odd][0]
-                    self._points[odd][1] -= 4 * xy[odd][1]
-
-                elif j < (5 * F / 8):
-                    self._points[even][0] += 8 * xy[even][0]
-                    self._points[even][1] += 8 * xy[even][1]
-                    self._points[odd][0] -= 4 * xy[odd][0]
-                    self._points[odd][1] -= 4 * xy[odd][1]
-
-                elif j < (3 * F / 4):
-                    self._points[even][2] -= z * 8
-                    self._points[odd][0] -= 4 * xy[odd][0]
-                    self._points[odd][1] -= 4 * xy[odd][1]
-
-                elif j < (7 * F / 8):
-                    self._points[even][0] -= 4 * xy[even][0]
-                    self._points[even][1] -= 4 * xy[even][1]
-                    self._points[odd][2] += z * 8
-
-                else:  # j < F
-                    self._points[even][0] -= 4 * xy[even][0]
-                    self._points[even][1] -= 4 * xy[even][1]
-                    self._points[odd][0] += 8 * xy[odd][0]
-                    self._points[odd][1] += 8 * xy[odd][1]
-
-            # Update servos
+            deadline += delay * covered
+            # Behind schedule: drop this frame, the next one catches up
+            if delay and j < F - 1 and now() > deadline:
+                continue
+            frame = frames[j]
+            points[...] = frame
+
+            # Update servos with the last frame of the batch
             try:
-                await self.update_callback(self._points)
+                await update(frame.tolist())
             except Exception as e:
                 logger.error(
                     "gait.tripod_cycle.update_callback_failed",
@@ -221,7 +383,7 @@ class GaitExecutor:
                 )
                 raise
 
-            await asyncio.sleep(delay)
+            await sleep(max(0.0, deadline - now()))
 
         logger.info("gait.tripod_cycle.complete", total_frames=F)
 
@@ -246,43 +408,37 @@ class GaitExecutor:
         )
 
         F = self._map_speed_to_frames(speed, GaitType.WAVE)
-        Z = self.config.step_height
-        z = Z / F
         delay = self.config.delay
 
         logger.debug(
             "gait.wave_cycle.params_calculated",
-            frames=F, step_height=Z, z_increment=z, delay=delay
+            frames=F, step_height=self.config.step_height, delay=delay
         )
 
         # Calculate per-leg offsets
-        angle_rad = math.radians(angle)
-        xy = []
-        for i in range(6):
-            bp = self.body_points[i]
-            dx = (
-                (bp[0] * math.cos(angle_rad) + bp[1] * math.sin(angle_rad) - bp[0]) + x
-            ) / F
-            dy = (
-                (-bp[0] * math.sin(angle_rad) + bp[1] * math.cos(angle_rad) - bp[1]) + y
-            ) / F
-            xy.append([dx, dy])
-
-        logger.debug("gait.wave_cycle.offsets_calculated", xy_offsets=xy[:2])
+        xy = self._calculate_leg_offsets(x, y, angle, F)
+
+        logger.debug("gait.wave_cycle.offsets_calculated", xy_offsets=xy[:2].tolist())
 
         if x == 0 and y == 0 and angle == 0:
             logger.info("gait.wave_cycle.no_movement_detected")
-            await self.update_callback(self._points)
+            await self.update_callback(self._points.tolist())
             return
 
         # Wave sequence - exactly like legacy
-        leg_order = [5, 2, 1, 0, 3, 4]
+        leg_order = _WAVE_LEG_ORDER
         logger.info("gait.wave_cycle.starting_loop", leg_order=leg_order, total_frames=F)
 
+        frames = self._cycle_frames(GaitType.WAVE, x, y, angle, F)
+        frames_per_leg = F // 6
+        points = self._points
+        update = self.update_callback
+        sleep = asyncio.sleep
+        now = asyncio.get_running_loop().time
+        ends = _batch_ends(frames_per_leg, self.config.frames_per_batch())
+        deadline = now()
         for leg_index, current_leg in enumerate(leg_order):
             # ✅ REMOVED: if not self._running: break
-
-            frames_per_leg = int(F / 6)
             logger.debug(
                 "gait.wave_cycle.moving_leg",
                 leg=current_leg,
@@ -290,24 +446,17 @@ class GaitExecutor:
                 frames=frames_per_leg
             )
 
-            for j in range(frames_per_leg):
-                # ✅ REMOVED: if not self._running: break
-
-                for k in range(6):
-                    if k == current_leg:
-                        if j < int(frames_per_leg / 3):
-                            self._points[k][2] += 18 * z
-                        elif j < int(2 * frames_per_leg / 3):
-                            self._points[k][0] += 30 * xy[k][0]
-                            self._points[k][1] += 30 * xy[k][1]
-                        else:
-                            self._points[k][2] -= 18 * z
-                    else:
-                        self._points[k][0] -= 2 * xy[k][0]
-                        self._points[k][1] -= 2 * xy[k][1]
+            first = leg_index * frames_per_leg
+            for j, covered in ends:
+                deadline += delay * covered
+                # Behind schedule: drop this frame, the leg's last one is always sent
+                if delay and j < frames_per_leg - 1 and now() > deadline:
+                    continue
+                frame = frames[first + j]
+                points[...] = frame
 
                 try:
-                    await self.update_callback(self._points)
+                    await update(frame.tolist())
                 except Exception as e:
                     logger.error(
                         "gait.wave_cycle.update_callback_failed",
@@ -318,7 +467,7 @@ class GaitExecutor:
                     )
                     raise
 
-                await asyncio.sleep(delay)
+                await sleep(max(0.0, deadline - now()))
 
         logger.info("gait.wave_cycle.complete", total_frames=F)
 
@@ -343,14 +492,15 @@ class GaitExecutor:
         # Initial parameters
         self.update_params(x, y, speed, angle, duration)
 
-        start_time = asyncio.get_event_loop().time()
+        now = asyncio.get_running_loop().time
+        start_time = now()
         cycle_count = 0
 
         while self._running:
             cycle_count += 1
             
             # Check duration - use current self.duration which might have been updated
-            elapsed = asyncio.get_event_loop().time() - start_time
+            elapsed = now() - start_time
             if elapsed >= self.duration:
                 logger.info(
                     f"gait.{gait_type.name.lower()}.duration_reached",
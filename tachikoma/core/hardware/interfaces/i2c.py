@@ -1,6 +1,7 @@
 """I2C hardware interface abstraction"""
 from abc import ABC, abstractmethod
-from typing import Optional
+from pathlib import Path
+from typing import List, Optional
 import structlog
 try:
     import smbus2
@@ -33,6 +34,11 @@ class I2CInterface(ABC):
         """Write a single byte to the device"""
         pass
 
+    @abstractmethod
+    def write_i2c_block_data(self, address: int, register: int, data: List[int]) -> None:
+        """Write consecutive registers starting at `register` in a single transaction"""
+        pass
+
     @abstractmethod
     def read_byte(self, address: int) -> int:
         """Read a single byte from the device"""
@@ -48,15 +54,50 @@ class I2CInterface(ABC):
         """Read a word (2 bytes) from a specific register"""
         pass
 
+    @abstractmethod
+    def read_i2c_block_data(self, address: int, register: int, length: int) -> List[int]:
+        """Read `length` consecutive registers in a single transaction"""
+        pass
+
 
 class SMBusI2CInterface(I2CInterface):
     """I2C interface implementation using the smbus2 library"""
 
-    def __init__(self, bus_number: int = 1):
+    def __init__(self, bus_number: int = 1, i2c_frequency: int = 400_000):
+        """
+        Args:
+            bus_number: Linux I2C bus number (/dev/i2c-N)
+            i2c_frequency: Expected bus clock in Hz. smbus2 cannot change it;
+                the kernel clock is checked against it at initialize().
+        """
         self._bus_number = bus_number
+        self._i2c_frequency = i2c_frequency
         self._bus: Optional[smbus2.SMBus] = None
         logger.info("i2c.smbus.created", bus=bus_number)
 
+    def _read_bus_clock(self) -> Optional[int]:
+        """Read the bus clock (Hz) from the device tree, None if unknown"""
+        path = Path(f"/sys/class/i2c-adapter/i2c-{self._bus_number}/of_node/clock-frequency")
+        try:
+            return int.from_bytes(path.read_bytes()[:4], "big")
+        except (OSError, ValueError):
+            return None
+
+    def _check_bus_clock(self) -> None:
+        """Warn when the kernel runs the bus slower than expected"""
+        clock = self._read_bus_clock()
+        if clock is not None and clock < self._i2c_frequency:
+            logger.warning(
+                "i2c.smbus.slow_clock",
+                bus=self._bus_number,
+                clock_hz=clock,
+                expected_hz=self._i2c_frequency,
+                fix=(
+                    f"add dtparam=i2c_arm_baudrate={self._i2c_frequency} "
+                    "to /boot/firmware/config.txt and reboot"
+                ),
+            )
+
     async def initialize(self) -> None:
         if smbus2 is None:
             logger.warning("i2c.smbus.not_found", message="smbus2 library not found. Running in mock mode.")
@@ -65,6 +106,7 @@ class SMBusI2CInterface(I2CInterface):
         try:
             self._bus = smbus2.SMBus(self._bus_number)
             logger.info("i2c.smbus.initialized", bus=self._bus_number)
+            self._check_bus_clock()
         except Exception as e:
             logger.error("i2c.smbus.init_failed", error=str(e))
             self._bus = None
@@ -96,6 +138,15 @@ class SMBusI2CInterface(I2CInterface):
             logger.error("i2c.smbus.write_byte_failed", error=str(e))
             raise
 
+    def write_i2c_block_data(self, address: int, register: int, data: List[int]) -> None:
+        if not self._bus:
+            return
+        try:
+            self._bus.write_i2c_block_data(address, register, data)
+        except Exception as e:
+            logger.error("i2c.smbus.write_block_failed", error=str(e))
+            raise
+
     def read_byte(self, address: int) -> int:
         if not self._bus:
             return 0
@@ -124,3 +175,12 @@ class SMBusI2CInterface(I2CInterface):
         except Exception as e:
             logger.error("i2c.smbus.read_word_failed", error=str(e))
             raise
+
+    def read_i2c_block_data(self, address: int, register: int, length: int) -> List[int]:
+        if not self._bus:
+            return [0] * length
+        try:
+            return self._bus.read_i2c_block_data(address, register, length)
+        except Exception as e:
+            logger.error("i2c.smbus.read_block_failed", error=str(e))
+            raise
@@ -6,6 +6,7 @@ Cartesian foot positions and servo joint angles.
 import math
 from typing import List, Optional, Tuple
 
+import numpy as np
 import structlog
 
 from tachikoma.core.models.config import RobotDimensions
@@ -40,6 +41,16 @@ class HexapodKinematics:
         # Workspace limits
         self.max_reach = self.L1 + self.L2 + self.L3
         self.min_reach = max(0, abs(self.L2 - self.L3) - self.L1)
+        
+        # Link-length terms of the IK, computed once instead of on every
+        # call (same values and evaluation order as the inline expressions)
+        self._l23_max = self.L2 + self.L3
+        self._l23_min = abs(self.L2 - self.L3)
+        self._l2_sq = self.L2**2
+        self._l3_sq = self.L3**2
+        self._l2_sq_plus_l3_sq = self._l2_sq + self._l3_sq
+        self._two_l2 = 2 * self.L2
+        self._two_l3_l2 = 2 * self.L3 * self.L2
     
     @staticmethod
     def _clamp(value: float, min_val: float, max_val: float) -> float:
@@ -60,60 +71,59 @@ class HexapodKinematics:
             Tuple of (coxa_deg, femur_deg, tibia_deg) as integers,
             or None if position is unreachable.
         """
-        try:
-            # Coxa angle: rotation in the horizontal plane
-            # α = π/2 - atan2(z, y)
-            alpha = math.pi / 2 - math.atan2(z, y)
-            
-            # Position of coxa joint endpoint
-            x_3 = 0
-            x_4 = self.L1 * math.sin(alpha)
-            x_5 = self.L1 * math.cos(alpha)
-            
-            # Distance from coxa endpoint to foot
-            l23 = math.sqrt(
-                (z - x_5) ** 2 + 
-                (y - x_4) ** 2 + 
-                (x - x_3) ** 2
-            )
-            
-            # Check reachability
-            if l23 > (self.L2 + self.L3) or l23 < abs(self.L2 - self.L3):
-                logger.warning(
-                    "kinematics.unreachable",
-                    x=x, y=y, z=z,
-                    distance=l23,
-                    max_reach=self.L2 + self.L3
-                )
-                return None
-            
-            # Intermediate calculations with clamping for numerical stability
-            w = self._clamp((x - x_3) / l23, -1.0, 1.0)
-            v = self._clamp(
-                (self.L2**2 + l23**2 - self.L3**2) / (2 * self.L2 * l23),
-                -1.0, 1.0
-            )
-            u = self._clamp(
-                (self.L2**2 + self.L3**2 - l23**2) / (2 * self.L3 * self.L2),
-                -1.0, 1.0
-            )
-            
-            # Femur angle: β = asin(w) - acos(v)
-            beta = math.asin(round(w, 2)) - math.acos(round(v, 2))
-            
-            # Tibia angle: γ = π - acos(u)
-            gamma = math.pi - math.acos(round(u, 2))
-            
-            # Convert to degrees and return as integers
-            return (
-                round(math.degrees(alpha)),
-                round(math.degrees(beta)),
-                round(math.degrees(gamma))
+        # Coxa angle: rotation in the horizontal plane
+        # α = π/2 - atan2(z, y)
+        alpha = math.pi / 2 - math.atan2(z, y)
+        
+        # Position of coxa joint endpoint
+        x_3 = 0
+        x_4 = self.L1 * math.sin(alpha)
+        x_5 = self.L1 * math.cos(alpha)
+        
+        # Distance from coxa endpoint to foot
+        l23 = math.sqrt(
+            (z - x_5) ** 2 + 
+            (y - x_4) ** 2 + 
+            (x - x_3) ** 2
+        )
+        
+        # Check reachability (also rejects l23 == 0 and NaN/inf inputs,
+        # which used to surface as exceptions)
+        if not (self._l23_min <= l23 <= self._l23_max) or l23 == 0.0:
+            logger.warning(
+                "kinematics.unreachable",
+                x=x, y=y, z=z,
+                distance=l23,
+                max_reach=self._l23_max
             )
-            
-        except (ValueError, ZeroDivisionError) as e:
-            logger.error("kinematics.inverse_failed", x=x, y=y, z=z, error=str(e))
             return None
+        
+        # Intermediate calculations with clamping for numerical stability.
+        # l23 is finite and non-zero here and asin/acos get clamped inputs,
+        # so nothing below can raise: no try/except on this per-frame path
+        l23_sq = l23**2
+        w = self._clamp((x - x_3) / l23, -1.0, 1.0)
+        v = self._clamp(
+            (self._l2_sq + l23_sq - self._l3_sq) / (self._two_l2 * l23),
+            -1.0, 1.0
+        )
+        u = self._clamp(
+            (self._l2_sq_plus_l3_sq - l23_sq) / self._two_l3_l2,
+            -1.0, 1.0
+        )
+        
+        # Femur angle: β = asin(w) - acos(v)
+        beta = math.asin(round(w, 2)) - math.acos(round(v, 2))
+        
+        # Tibia angle: γ = π - acos(u)
+        gamma = math.pi - math.acos(round(u, 2))
+        
+        # Convert to degrees and return as integers
+        return (
+            round(math.degrees(alpha)),
+            round(math.degrees(beta)),
+            round(math.degrees(gamma))
+        )
 
     def calculate_ik(self, x: float, y: float, z: float) -> Optional[Tuple[int, int, int]]:
         """Inverse kinematics with servo-centered angles (90° neutral)."""
@@ -153,6 +163,39 @@ class HexapodKinematics:
         
         return (round(x, 2), round(y, 2), round(z, 2))
     
+    def forward_batch(self, angles) -> np.ndarray:
+        """Forward kinematics for many legs at once.
+        
+        Same formula as forward(), evaluated as array operations: one call
+        for all six legs, or for a whole sweep of poses.
+        
+        Args:
+            angles: Array-like of shape (n, 3), (coxa, femur, tibia) in degrees;
+                a single (3,) pose is treated as n = 1
+            
+        Returns:
+            Array of shape (n, 3) of (x, y, z) positions in mm
+        """
+        a, b, g = np.radians(np.atleast_2d(np.asarray(angles, dtype=np.float64))).T
+        sin_a = np.sin(a)
+        cos_a = np.cos(a)
+        cos_b = np.cos(b)
+        cos_bg = np.cos(b + g)
+        
+        positions = np.empty((a.shape[0], 3))
+        positions[:, 0] = self.L3 * np.sin(b + g) + self.L2 * np.sin(b)
+        positions[:, 1] = (
+            self.L3 * sin_a * cos_bg +
+            self.L2 * sin_a * cos_b +
+            self.L1 * sin_a
+        )
+        positions[:, 2] = (
+            self.L3 * cos_a * cos_bg +
+            self.L2 * cos_a * cos_b +
+            self.L1 * cos_a
+        )
+        return np.round(positions, 2)
+    
     def check_validity(self, positions: List[List[float]]) -> bool:
         """Check if all leg positions are within valid range.
         
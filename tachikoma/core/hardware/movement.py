@@ -149,6 +149,17 @@ class MovementController:
             for i, leg in enumerate(self._config.legs)
         ]
 
+        # Body-to-leg frame transform per leg: mount angles are fixed, so
+        # cos/sin are computed once instead of on every frame
+        self._leg_transforms = [
+            (
+                math.cos(math.radians(leg.mount_angle)),
+                math.sin(math.radians(leg.mount_angle)),
+                leg.offset,
+            )
+            for leg in self.legs
+        ]
+
         # Kinematics engine
         self.kinematics = HexapodKinematics(self._config.dimensions)
 
@@ -262,15 +273,13 @@ class MovementController:
         Args:
             points: List of 6 body-frame positions [[x, y, z], ...]
         """
-        for i, leg in enumerate(self.legs):
-            angle_rad = math.radians(leg.mount_angle)
-            cos_a = math.cos(angle_rad)
-            sin_a = math.sin(angle_rad)
+        for i, (cos_a, sin_a, offset) in enumerate(self._leg_transforms):
+            px, py, pz = points[i]
 
             # Rotate point to leg-local frame
-            x_local = points[i][0] * cos_a + points[i][1] * sin_a - leg.offset
-            y_local = -points[i][0] * sin_a + points[i][1] * cos_a
-            z_local = points[i][2] - 14  # Z offset for leg mounting height
+            x_local = px * cos_a + py * sin_a - offset
+            y_local = -px * sin_a + py * cos_a
+            z_local = pz - 14  # Z offset for leg mounting height
 
             self.leg_positions[i] = [x_local, y_local, z_local]
 
@@ -307,7 +316,15 @@ class MovementController:
                 await self._send_servo_angle(channel, transformed)
 
     async def _send_servo_angle(self, channel: int, angle: int) -> None:
-        """Send angle using async API when available."""
+        """Send angle, preferring the controller's synchronous write path.
+
+        The I2C writes block either way; set_angle_sync skips the coroutine
+        round trip for each of the 18 joints of every gait frame.
+        """
+        set_angle_sync = getattr(self._servo, "set_angle_sync", None)
+        if set_angle_sync is not None:
+            set_angle_sync(channel, angle)
+            return
         set_angle_async = getattr(self._servo, "set_angle_async", None)
         if set_angle_async is not None:
             await set_angle_async(channel, angle)
@@ -746,9 +763,16 @@ class MovementController:
         self._pid_roll.reset()
         self._pid_pitch.reset()
 
+        use_fifo = False
         try:
+            # Hardware-timed 100 Hz sampling; each cycle averages what queued
+            # up. IMUs without a FIFO fall back to single read_accel() calls.
+            enable_fifo = getattr(self._imu, "enable_fifo", None)
+            if enable_fifo is not None:
+                use_fifo = await enable_fifo(100)
+
             while self._balancing:
-                accel = await self._imu.read_accel()
+                accel = await self._read_balance_accel(use_fifo)
                 if accel:
                     # Simple roll/pitch from accel
                     # Match legacy orientation/mapping if needed
@@ -768,6 +792,18 @@ class MovementController:
         except Exception as e:
             logger.error("movement.balance_loop_error", error=str(e))
             self._balancing = False
+        finally:
+            if use_fifo:
+                await self._imu.disable_fifo()
+
+    async def _read_balance_accel(self, use_fifo: bool) -> Optional[List[float]]:
+        """Mean of the FIFO samples since the last cycle, else a single read."""
+        if use_fifo:
+            batch = await self._imu.read_fifo()
+            if batch is not None:
+                accel = batch[0]
+                return accel.mean(axis=0).tolist() if len(accel) else None
+        return await self._imu.read_accel()
 
 
     async def _set_attitude_internal(self, roll: float, pitch: float, yaw: float) -> None:
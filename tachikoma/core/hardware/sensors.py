@@ -1,4 +1,5 @@
 """Sensor abstraction"""
+import asyncio
 import structlog
 from datetime import datetime, timezone
 
@@ -27,17 +28,30 @@ class SensorController:
         
     async def _ensure_hardware(self):
         """Ensure drivers are initialized"""
-        if not self._adc:
-            self._adc = await self.factory.get_adc()
-            
-        if not self._imu:
-            self._imu = await self.factory.get_imu()
-            
-        if not self._ultrasonic:
-             try:
-                 self._ultrasonic = await self.factory.get_ultrasonic()
-             except Exception:
-                 logger.warning("sensor_controller.ultrasonic_not_found")
+        # Independent drivers: initialize the missing ones concurrently
+        pending = {
+            name: getter()
+            for name, getter in (
+                ("_adc", self.factory.get_adc),
+                ("_imu", self.factory.get_imu),
+                ("_ultrasonic", self.factory.get_ultrasonic),
+            )
+            if not getattr(self, name)
+        }
+        if not pending:
+            return
+
+        results = await asyncio.gather(*pending.values(), return_exceptions=True)
+        error = None
+        for name, result in zip(pending, results):
+            if not isinstance(result, Exception):
+                setattr(self, name, result)
+            elif name == "_ultrasonic":
+                logger.warning("sensor_controller.ultrasonic_not_found")
+            elif error is None:
+                error = result
+        if error is not None:
+            raise error
 
     async def read_battery(self) -> dict:
         """Read battery voltage"""
@@ -79,17 +93,17 @@ class SensorController:
             await self._ensure_hardware()
             
             if self._imu:
-                # IMU needs update first
-                # self._imu.update_imu_state() # HAL driver handles this internally usually
-                # Our HAL MPU6050 driver has read_accel and read_gyro methods
-                
-                accel_tuple = await self._imu.read_accel() # returns (x, y, z)
-                gyro_tuple = await self._imu.read_gyro()
-                temp_val = await self._imu.read_temperature()
+                # One 14-byte burst: accel + temperature + gyro
+                data = await self._imu.read_all()
                 
-                accel = list(accel_tuple) if accel_tuple else [0.0, 0.0, 0.0]
-                gyro = list(gyro_tuple) if gyro_tuple else [0.0, 0.0, 0.0]
-                temp = temp_val if temp_val else 25.5
+                if data:
+                    accel = list(data["accelerometer"])
+                    gyro = list(data["gyroscope"])
+                    temp = data["temperature"]
+                else:
+                    accel = [0.0, 0.0, 0.0]
+                    gyro = [0.0, 0.0, 0.0]
+                    temp = 25.5
                 
             else:
                 # Try to access IMU attributes (may vary)
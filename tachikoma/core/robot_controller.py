@@ -1,5 +1,6 @@
 """Unified robot controller (Singleton)"""
 
+import asyncio
 import structlog
 from typing import Optional
 
@@ -55,12 +56,25 @@ class RobotController:
             # Get hardware components from factory
             factory = get_hardware_factory()
 
-            # Initialize servos and inject into movement
-            servo = await factory.create_servo_controller()
+            # Servos and IMU are independent: the IMU reset delay
+            # overlaps with the PCA9685 boards setup. Both are awaited to
+            # the end even if one fails, then any failure is raised
+            servo, imu = await asyncio.gather(
+                factory.create_servo_controller(),
+                factory.get_imu(),
+                return_exceptions=True
+            )
+            if isinstance(servo, BaseException):
+                if isinstance(imu, BaseException):
+                    logger.error("robot_controller.imu_init_failed", error=str(imu))
+                raise servo
+            if isinstance(imu, BaseException):
+                raise imu
+
+            # Inject servos into movement
             self.movement.set_servo_controller(servo)
 
             # Inject IMU if available for balancing
-            imu = await factory.get_imu()
             self.movement._imu = imu
 
             # Final movement initialization
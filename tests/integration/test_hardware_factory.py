@@ -114,7 +114,7 @@ class TestHardwareFactoryIntegration:
         assert servo_controller.is_available()
         
         # Vérifier que le PCA9685 sous-jacent a été créé
-        assert factory._pca9685 is not None
+        assert factory._pca_cache
     
     @pytest.mark.asyncio
     @patch('core.hardware.factory.SMBusI2CInterface')
@@ -182,7 +182,7 @@ class TestHardwareFactoryIntegration:
         assert factory._servo_controller is None
         assert factory._imu is None
         assert factory._adc is None
-        assert factory._pca9685 is None
+        assert not factory._pca_cache
         assert factory._i2c is None
         
         # Vérifier que cleanup a été appelé sur l'I2C
@@ -214,9 +214,50 @@ class TestHardwareFactoryIntegration:
         assert factory._servo_controller is None
         assert factory._imu is None
         assert factory._adc is None
-        assert factory._pca9685 is None
+        assert not factory._pca_cache
         assert factory._i2c is None
     
+    @pytest.mark.asyncio
+    @patch('core.hardware.factory.SMBusI2CInterface')
+    async def test_async_context_manager_cleans_up_on_error(
+        self, mock_smbus_class, settings, mock_i2c
+    ):
+        """Test que `async with` libère le matériel même après une exception."""
+        mock_smbus_class.return_value = mock_i2c
+        
+        with pytest.raises(RuntimeError):
+            async with HardwareFactory(settings) as factory:
+                await factory.get_adc()
+                await factory.get_imu()
+                raise RuntimeError("boom")
+        
+        assert factory._adc is None
+        assert factory._imu is None
+        assert factory._i2c is None
+        mock_i2c.cleanup.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_cleanup_failure_is_logged_and_keeps_component(self, settings):
+        """Test qu'un nettoyage en échec est journalisé sans bloquer les autres."""
+        factory = HardwareFactory(settings)
+        factory._imu = Mock(cleanup=AsyncMock(side_effect=OSError("bus")))
+        factory._adc = Mock(cleanup=AsyncMock())
+        failing_pca = Mock(cleanup=AsyncMock(side_effect=OSError("nack")))
+        factory._pca_cache[(0x40, 50)] = failing_pca
+        
+        with patch('core.hardware.factory.logger') as mock_logger:
+            await factory.cleanup_all()
+        
+        assert factory._imu is not None
+        assert factory._adc is None
+        assert factory._pca_cache == {}
+        failures = [
+            c.kwargs for c in mock_logger.error.call_args_list
+            if c.args == ("hardware_factory.cleanup_failed",)
+        ]
+        assert {f["component"] for f in failures} == {"imu", "pca9685"}
+        assert any(f.get("address") == "0x40" for f in failures)
+    
     @pytest.mark.asyncio
     @patch('core.hardware.factory.SMBusI2CInterface')
     async def test_error_handling_in_driver_creation(self, mock_smbus_class, factory):
@@ -14,7 +14,7 @@ class TestADC:
         """Crée un mock I2CInterface."""
         mock = Mock()
         mock.write_byte_data = AsyncMock()
-        mock.read_byte_data = AsyncMock()
+        mock.read_byte_data = Mock(return_value=0x00)  # HAL I2C synchrone
         mock.write_i2c_block_data = AsyncMock()
         mock.read_i2c_block_data = AsyncMock(return_value=[0x00, 0x00])
         return mock
@@ -161,3 +161,35 @@ class TestADC:
         # Devrait échouer ou retourner None car non initialisé
         with pytest.raises(RuntimeError):
             await adc.read_channel(0)
+    
+    @pytest.mark.asyncio
+    async def test_read_battery_voltage_uses_lookup_table(self, adc):
+        """Test de la conversion brute -> tension par table précalculée."""
+        # Arrange
+        adc.read_channel = AsyncMock(side_effect=[255, None])
+        
+        # Act
+        v1, v2 = await adc.read_battery_voltage()
+        
+        # Assert
+        assert v1 == 15.0  # 255 -> 5V de référence x 3 (diviseur)
+        assert v2 == 0.0
+        assert adc._voltage_lut[51] == (51 / 255.0) * 5.0 * 3.0
+    
+    @pytest.mark.asyncio
+    async def test_read_channel_combined_transactions(self, adc, mock_i2c):
+        """Test que chaque conversion est une écriture commande + lecture combinées."""
+        # Arrange
+        mock_i2c.read_byte_data = Mock(return_value=0x80)
+        await adc.initialize()
+        mock_i2c.read_byte_data.reset_mock()
+        
+        # Act
+        value = await adc.read_channel(4)
+        
+        # Assert
+        assert value == 0x80
+        command = ADC.ADS7830_COMMAND | ((((4 << 2) | (4 >> 1)) & 0x07) << 4)
+        assert mock_i2c.read_byte_data.call_count == 2
+        mock_i2c.read_byte_data.assert_called_with(0x48, command)
+        mock_i2c.write_byte.assert_not_called()
@@ -0,0 +1,106 @@
+"""Unit tests for the process-wide shared camera handle."""
+from unittest.mock import Mock
+
+from core.hardware.drivers import camera as camera_driver
+
+
+def _picamera():
+    cam = Mock(name="Picamera2")
+    cam.started = False
+    cam.start.side_effect = lambda: setattr(cam, "started", True)
+    cam.stop.side_effect = lambda: setattr(cam, "started", False)
+    return cam
+
+
+def test_shared_picamera_configured_once_with_lores():
+    cam = _picamera()
+    first = camera_driver.acquire_shared_camera("picamera2", lambda: cam)
+    second = camera_driver.acquire_shared_camera("picamera2", Mock())
+    try:
+        assert first is second is cam
+        assert camera_driver.start_shared_picamera(cam, (640, 480), (320, 240))
+        cam.stop()
+        # A later user restarts the stopped camera without reconfiguring it
+        assert not camera_driver.start_shared_picamera(cam, (1280, 720), (640, 360))
+        cam.configure.assert_called_once()
+        assert cam.started
+        kwargs = cam.create_preview_configuration.call_args.kwargs
+        assert kwargs["lores"] == {"size": (320, 240), "format": "YUV420"}
+    finally:
+        camera_driver.release_shared_camera("picamera2", Mock())
+        camera_driver.release_shared_camera("picamera2", Mock())
+    cam.close.assert_not_called()
+
+
+def test_shared_camera_stopped_only_by_last_user():
+    cam = _picamera()
+    closer = Mock()
+    camera_driver.acquire_shared_camera("picamera2", lambda: cam)
+    camera_driver.acquire_shared_camera("picamera2", lambda: cam)
+    camera_driver.start_shared_picamera(cam, (640, 480), (320, 240))
+
+    assert not camera_driver.stop_shared_camera("picamera2", lambda c: c.stop())
+    assert cam.started
+
+    camera_driver.release_shared_camera("picamera2", closer)
+    assert camera_driver.stop_shared_camera("picamera2", lambda c: c.stop())
+    assert not cam.started
+
+    camera_driver.release_shared_camera("picamera2", closer)
+    closer.assert_called_once_with(cam)
+
+
+def test_opencv_handles_are_keyed_by_index():
+    cap0 = camera_driver.acquire_shared_camera("opencv:0", lambda: Mock(name="cap0"))
+    cap1 = camera_driver.acquire_shared_camera("opencv:1", lambda: Mock(name="cap1"))
+    try:
+        assert cap0 is not cap1
+    finally:
+        camera_driver.release_shared_camera("opencv:0", Mock())
+        camera_driver.release_shared_camera("opencv:1", Mock())
+
+
+async def test_capture_gray_returns_none_when_camera_stopped(mocker):
+    driver = camera_driver.CameraDriver()
+    mocker.patch.object(camera_driver, "HAS_PICAMERA", True)
+    cam = _picamera()
+    driver._camera = cam
+
+    assert await driver.capture_gray() is None
+    cam.capture_request.assert_not_called()
+
+
+def test_shared_recording_stopped_by_last_streaming_user():
+    cam = _picamera()
+    camera_driver.acquire_shared_camera("picamera2", lambda: cam)
+    first, second = camera_driver.StreamingOutput(), camera_driver.StreamingOutput()
+    encoders = []
+    try:
+        assert camera_driver.start_shared_recording("picamera2", first, encoders.append)
+        assert not camera_driver.start_shared_recording("picamera2", second, encoders.append)
+        assert len(encoders) == 1
+
+        # Every streaming user receives each encoded frame
+        encoders[0].write(b"jpeg")
+        assert first.frame == second.frame == b"jpeg"
+
+        assert not camera_driver.stop_shared_recording("picamera2", first, cam.stop_recording)
+        cam.stop_recording.assert_not_called()
+        encoders[0].write(b"next")
+        assert first.frame == b"jpeg"
+        assert second.frame == b"next"
+
+        assert camera_driver.stop_shared_recording("picamera2", second, cam.stop_recording)
+        cam.stop_recording.assert_called_once_with()
+    finally:
+        camera_driver.release_shared_camera("picamera2", Mock())
+
+
+def test_shared_picamera_pins_buffer_count():
+    cam = _picamera()
+    camera_driver.acquire_shared_camera("picamera2", lambda: cam)
+    try:
+        camera_driver.start_shared_picamera(cam, (640, 480), (320, 240))
+        assert cam.create_preview_configuration.call_args.kwargs["buffer_count"] == 4
+    finally:
+        camera_driver.release_shared_camera("picamera2", Mock())
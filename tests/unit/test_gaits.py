@@ -0,0 +1,134 @@
+"""Tests for the precomputed gait cycle frames."""
+import math
+import numpy as np
+import pytest
+from core.hardware.gaits import GaitExecutor, GaitType
+
+BODY_POINTS = [
+    [137.1, 189.4, -25.0], [225.0, 0.0, -25.0], [137.1, -189.4, -25.0],
+    [-137.1, -189.4, -25.0], [-225.0, 0.0, -25.0], [-137.1, 189.4, -25.0],
+]
+
+CASES = [
+    # x, y, angle, speed
+    (20, 0, 0, 5),
+    (0, -15, 0, 2),
+    (-35, 10, 0, 10),
+    (0, 0, 12, 7),
+    (12.5, -7.5, -20, 3),
+]
+
+
+async def _noop(points):
+    pass
+
+
+def _leg_offsets(x, y, angle, F):
+    """Per-leg XY step, written as in the legacy code."""
+    a = math.radians(angle)
+    xy = []
+    for bx, by, _ in BODY_POINTS:
+        xy.append([
+            ((bx * math.cos(a) + by * math.sin(a) - bx) + x) / F,
+            ((-bx * math.sin(a) + by * math.cos(a) - by) + y) / F,
+        ])
+    return xy
+
+
+def _legacy_tripod(x, y, angle, F, Z):
+    """Frame-by-frame tripod cycle, the legacy in-place loop."""
+    points = [list(p) for p in BODY_POINTS]
+    xy = _leg_offsets(x, y, angle, F)
+    z = Z / F
+    frames = []
+    for j in range(F):
+        for i in range(3):
+            even, odd = 2 * i, 2 * i + 1
+            if j < F / 8:
+                points[even][0] -= 4 * xy[even][0]
+                points[even][1] -= 4 * xy[even][1]
+                points[odd][0] += 8 * xy[odd][0]
+                points[odd][1] += 8 * xy[odd][1]
+                points[odd][2] = Z + BODY_POINTS[odd][2]
+            elif j < F / 4:
+                points[even][0] -= 4 * xy[even][0]
+                points[even][1] -= 4 * xy[even][1]
+                points[odd][2] -= z * 8
+            elif j < 3 * F / 8:
+                points[even][2] += z * 8
+                points[odd][0] -= 4 * xy[odd][0]
+                points[odd][1] -= 4 * xy[odd][1]
+            elif j < 5 * F / 8:
+                points[even][0] += 8 * xy[even][0]
+                points[even][1] += 8 * xy[even][1]
+                points[odd][0] -= 4 * xy[odd][0]
+                points[odd][1] -= 4 * xy[odd][1]
+            elif j < 3 * F / 4:
+                points[even][2] -= z * 8
+                points[odd][0] -= 4 * xy[odd][0]
+                points[odd][1] -= 4 * xy[odd][1]
+            elif j < 7 * F / 8:
+                points[even][0] -= 4 * xy[even][0]
+                points[even][1] -= 4 * xy[even][1]
+                points[odd][2] += z * 8
+            else:
+                points[even][0] -= 4 * xy[even][0]
+                points[even][1] -= 4 * xy[even][1]
+                points[odd][0] += 8 * xy[odd][0]
+                points[odd][1] += 8 * xy[odd][1]
+        frames.append([list(p) for p in points])
+    return frames
+
+
+def _legacy_wave(x, y, angle, F, Z):
+    """Frame-by-frame wave cycle, the legacy in-place loop."""
+    points = [list(p) for p in BODY_POINTS]
+    xy = _leg_offsets(x, y, angle, F)
+    z = Z / F
+    frames_per_leg = int(F / 6)
+    frames = []
+    for current_leg in [5, 2, 1, 0, 3, 4]:
+        for j in range(frames_per_leg):
+            for k in range(6):
+                if k == current_leg:
+                    if j < int(frames_per_leg / 3):
+                        points[k][2] += 18 * z
+                    elif j < int(2 * frames_per_leg / 3):
+                        points[k][0] += 30 * xy[k][0]
+                        points[k][1] += 30 * xy[k][1]
+                    else:
+                        points[k][2] -= 18 * z
+                else:
+                    points[k][0] -= 2 * xy[k][0]
+                    points[k][1] -= 2 * xy[k][1]
+            frames.append([list(p) for p in points])
+    return frames
+
+
+@pytest.mark.parametrize("gait_type, legacy", [
+    (GaitType.TRIPOD, _legacy_tripod),
+    (GaitType.WAVE, _legacy_wave),
+])
+@pytest.mark.parametrize("x, y, angle, speed", CASES)
+def test_cycle_frames_match_legacy_loop(gait_type, legacy, x, y, angle, speed):
+    executor = GaitExecutor(BODY_POINTS, _noop)
+    F = executor._map_speed_to_frames(speed, gait_type)
+
+    frames = executor._cycle_frames(gait_type, x, y, angle, F)
+    expected = legacy(x, y, angle, F, executor.config.step_height)
+
+    assert frames.shape == (len(expected), 6, 3)
+    assert np.allclose(frames, np.array(expected), rtol=0, atol=1e-9)
+
+
+def test_cached_cycle_is_reused_from_rest():
+    executor = GaitExecutor(BODY_POINTS, _noop)
+    F = executor._map_speed_to_frames(5, GaitType.TRIPOD)
+
+    first = executor._cycle_frames(GaitType.TRIPOD, 20, 0, 0, F)
+    assert executor._cycle_frames(GaitType.TRIPOD, 20, 0, 0, F) is first
+
+    # Away from rest the cycle is recomputed from the current points
+    executor._points[0, 0] += 1.0
+    moved = executor._cycle_frames(GaitType.TRIPOD, 20, 0, 0, F)
+    assert moved is not first
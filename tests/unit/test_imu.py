@@ -223,3 +223,67 @@ class TestMPU6050:
         # Assert
         # Avec les mêmes données mock, les résultats doivent être identiques
         assert accel1 == accel2
+    
+    @pytest.mark.asyncio
+    async def test_read_accel_single_block_read(self, mpu6050, mock_i2c):
+        """Test que read_accel lit les 3 axes en un seul bloc et les met à l'échelle."""
+        # Arrange
+        await mpu6050.initialize()
+        # X = 16384 (1g), Y = -16384 (-1g), Z = 8192 (0.5g)
+        mock_i2c.read_i2c_block_data = Mock(return_value=[0x40, 0x00, 0xC0, 0x00, 0x20, 0x00])
+        
+        # Act
+        accel = await mpu6050.read_accel()
+        
+        # Assert
+        mock_i2c.read_i2c_block_data.assert_called_once_with(0x68, MPU6050.ACCEL_XOUT_H, 6)
+        assert accel == (1.0, -1.0, 0.5)
+        assert all(isinstance(v, float) for v in accel)
+    
+    @pytest.mark.asyncio
+    async def test_read_all_single_burst(self, mpu6050, mock_i2c):
+        """Test que read_all lit accéléromètre, température et gyroscope en un bloc de 14 octets."""
+        # Arrange
+        await mpu6050.initialize()
+        # Accel (1g, 0, -1g), temp brute 0 (36.53°C), gyro (131, 0, -131) = (1, 0, -1)°/s
+        mock_i2c.read_i2c_block_data = Mock(return_value=[
+            0x40, 0x00, 0x00, 0x00, 0xC0, 0x00,
+            0x00, 0x00,
+            0x00, 0x83, 0x00, 0x00, 0xFF, 0x7D,
+        ])
+        
+        # Act
+        data = await mpu6050.read_all()
+        
+        # Assert
+        mock_i2c.read_i2c_block_data.assert_called_once_with(0x68, MPU6050.ACCEL_XOUT_H, 14)
+        assert data["accelerometer"] == (1.0, 0.0, -1.0)
+        assert data["gyroscope"] == (1.0, 0.0, -1.0)
+        assert data["temperature"] == 36.53
+    
+    @pytest.mark.asyncio
+    async def test_read_fifo_drains_whole_packets(self, mpu6050, mock_i2c):
+        """Test que read_fifo lit les paquets complets de 14 octets en blocs de 28."""
+        # Arrange
+        await mpu6050.initialize()
+        mock_i2c.write_byte_data = Mock()
+        packet = [0x40, 0x00, 0x00, 0x00, 0xC0, 0x00, 0x00, 0x00,
+                  0x00, 0x83, 0x00, 0x00, 0xFF, 0x7D]
+        
+        def read_block(address, reg, length):
+            if reg == MPU6050.FIFO_COUNT_H:
+                return [0x00, 3 * 14 + 5]  # 3 paquets + un paquet incomplet
+            return (packet * 2)[:length]
+        
+        mock_i2c.read_i2c_block_data = Mock(side_effect=read_block)
+        assert await mpu6050.enable_fifo(100) is True
+        
+        # Act
+        accel, gyro = await mpu6050.read_fifo()
+        
+        # Assert
+        fifo_reads = [c.args[2] for c in mock_i2c.read_i2c_block_data.call_args_list
+                      if c.args[1] == MPU6050.FIFO_R_W]
+        assert fifo_reads == [28, 14]
+        assert accel.tolist() == [[1.0, 0.0, -1.0]] * 3
+        assert gyro.tolist() == [[1.0, 0.0, -1.0]] * 3
@@ -0,0 +1,46 @@
+"""Unit tests for hexapod leg kinematics."""
+import itertools
+
+import numpy as np
+import pytest
+from core.hardware.kinematics import HexapodKinematics
+from core.models.config import RobotDimensions
+from numpy.testing import assert_allclose
+
+
+@pytest.fixture
+def kinematics():
+    return HexapodKinematics(RobotDimensions(l1=33, l2=90, l3=110))
+
+
+def test_forward_batch_matches_forward_over_grid(kinematics):
+    steps = range(-180, 181, 45)
+    poses = list(itertools.product(steps, steps, steps))
+
+    batch = kinematics.forward_batch(poses)
+
+    expected = np.array([kinematics.forward(*pose) for pose in poses])
+    assert batch.shape == (len(poses), 3)
+    assert_allclose(batch, expected, atol=0.01)
+
+
+def test_forward_batch_accepts_single_pose(kinematics):
+    batch = kinematics.forward_batch((10, -20, 30))
+
+    assert batch.shape == (1, 3)
+    assert_allclose(batch[0], kinematics.forward(10, -20, 30), atol=0.01)
+
+
+def test_forward_batch_singular_poses():
+    # L2 == L3: a fully folded tibia puts the foot back on the coxa endpoint,
+    # the l23 == 0 case inverse() rejects
+    kinematics = HexapodKinematics(RobotDimensions(l1=33, l2=100, l3=100))
+    poses = [(0, 0, 0), (30, 0, 180), (-90, 45, 180)]
+
+    batch = kinematics.forward_batch(poses)
+
+    expected = np.array([kinematics.forward(*pose) for pose in poses])
+    assert_allclose(batch, expected, atol=0.01)
+    assert np.all(np.isfinite(batch))
+    coxa_end = (0.0, 33 * np.sin(np.radians(30)), 33 * np.cos(np.radians(30)))
+    assert_allclose(batch[1], coxa_end, atol=0.01)
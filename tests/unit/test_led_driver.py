@@ -60,16 +60,19 @@ def test_set_color_with_brightness_scaling(mock_spidev):
         assert abs(controller._led_color[controller._blue_offset] - 25) <= 1
 
 def test_set_all(mock_spidev):
-    """Test set_all calls set_color for all LEDs and show."""
+    """Test set_all fills every LED in one pass and calls show once."""
     with patch('core.hardware.drivers.led.SPI_AVAILABLE', True):
-        controller = LEDController(led_count=4)
-        with patch.object(controller, 'set_color') as mock_set_color, \
-             patch.object(controller, 'show') as mock_show:
+        controller = LEDController(led_count=4, brightness=128)
+        with patch.object(controller, 'show') as mock_show:
 
             controller.set_all(255, 0, 0)
 
-            assert mock_set_color.call_count == 4
-            mock_set_color.assert_called_with(255, 0, 0, 3) # Check last call
+            for i in range(4):
+                base = i * 3
+                assert controller._led_original_color[base + controller._red_offset] == 255
+                assert controller._led_color[base + controller._red_offset] == 128
+                assert controller._led_color[base + controller._green_offset] == 0
+                assert controller._led_color[base + controller._blue_offset] == 0
             mock_show.assert_called_once()
 
 def test_set_brightness_reapplies_colors(mock_spidev):
@@ -119,6 +122,19 @@ def test_encode_ws2812_8bit():
         assert encoded_data[6] == 0x78 # 1
         assert encoded_data[7] == 0x80 # 0
 
+def test_encode_ws2812_8bit_keeps_low_byte_of_out_of_range_values():
+    """Values outside 0-255 are masked to their low byte, not rejected."""
+    with patch('core.hardware.drivers.led.SPI_AVAILABLE', True), \
+         patch('core.hardware.drivers.led.np', mock_numpy_module):
+
+        controller = LEDController(led_count=1)
+        controller._led_color = [256 + 0b10101010, -1, 0]
+
+        encoded_data = controller._encode_ws2812_8bit()
+
+        controller._led_color = [0b10101010, 0xFF, 0]
+        assert encoded_data == controller._encode_ws2812_8bit()
+
 def test_wheel_utility():
     """Test the wheel color generation utility."""
     controller = LEDController()
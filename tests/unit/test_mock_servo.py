@@ -202,3 +202,52 @@ class TestMockServoErrorSimulation:
         
         assert not mock_servo.is_initialized
         assert not mock_servo.is_running
+
+
+class TestMockServoHistoryLimit:
+    """Test MockServoController bounded command history"""
+    
+    @pytest.mark.asyncio
+    async def test_history_keeps_most_recent_commands(self):
+        """Test history is a ring buffer bounded by history_limit"""
+        servo = MockServoController(channels=16, history_limit=3)
+        await servo.initialize()
+        
+        for angle in (10, 20, 30, 40, 50):
+            servo.set_angle(0, angle)
+        
+        history = servo.get_command_history()
+        assert [entry[1] for entry in history] == [30, 40, 50]
+        assert isinstance(history, list)
+        # Monotonic ns timestamps never go backwards
+        assert history[0][2] <= history[1][2] <= history[2][2]
+        assert servo.get_angle(0) == 50
+        
+        await servo.cleanup()
+    
+    @pytest.mark.asyncio
+    async def test_deduplicate_skips_unchanged_angles(self):
+        """Test deduplicate drops commands that don't move the servo"""
+        servo = MockServoController(channels=16, deduplicate=True)
+        await servo.initialize()
+        
+        servo.set_angle(0, 45)
+        servo.set_angle(0, 45)
+        servo.set_angle(0, 90)
+        
+        assert servo.get_command_count(channel=0) == 2
+        
+        await servo.cleanup()
+    
+    @pytest.mark.asyncio
+    async def test_record_history_disabled(self):
+        """Test record_history=False skips history but still tracks angles"""
+        servo = MockServoController(channels=16, record_history=False)
+        await servo.initialize()
+        
+        servo.set_angle(2, 120)
+        
+        assert servo.get_command_count() == 0
+        assert servo.get_angle(2) == 120
+        
+        await servo.cleanup()
@@ -0,0 +1,93 @@
+"""Unit tests for the PCA9685 PWM driver."""
+import pytest
+from unittest.mock import Mock
+
+from core.hardware.drivers.pca9685 import PCA9685
+
+
+@pytest.fixture
+def mock_i2c():
+    mock = Mock()
+    mock.read_byte_data.return_value = PCA9685.AI
+    return mock
+
+
+@pytest.mark.asyncio
+async def test_set_pwm_single_block_write(mock_i2c):
+    pca = PCA9685(i2c=mock_i2c, address=0x40)
+
+    await pca.set_pwm(2, 0, 0x123)
+
+    mock_i2c.write_i2c_block_data.assert_called_once_with(
+        0x40, PCA9685.LED0_ON_L + 8, [0x00, 0x00, 0x23, 0x01]
+    )
+    mock_i2c.write_byte_data.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_set_pwm_bulk_groups_contiguous_channels(mock_i2c):
+    pca = PCA9685(i2c=mock_i2c, address=0x40)
+
+    # 0-1 contiguous, 3 isolated (given out of order)
+    await pca.set_pwm_bulk([(3, 0, 300), (0, 0, 100), (1, 0, 200)])
+
+    calls = mock_i2c.write_i2c_block_data.call_args_list
+    assert len(calls) == 2
+    assert calls[0].args == (0x40, PCA9685.LED0_ON_L, [0, 0, 100, 0, 0, 0, 200, 0])
+    assert calls[1].args == (0x40, PCA9685.LED0_ON_L + 12, [0, 0, 44, 1])
+
+
+@pytest.mark.asyncio
+async def test_set_pwm_bulk_keeps_last_value_per_channel(mock_i2c):
+    pca = PCA9685(i2c=mock_i2c, address=0x40)
+
+    # Channel 0 given twice: the later value wins even though it sorts first
+    await pca.set_pwm_bulk([(0, 0, 500), (1, 0, 200), (0, 0, 100)])
+
+    calls = mock_i2c.write_i2c_block_data.call_args_list
+    assert len(calls) == 1
+    assert calls[0].args == (0x40, PCA9685.LED0_ON_L, [0, 0, 100, 0, 0, 0, 200, 0])
+
+
+@pytest.mark.asyncio
+async def test_set_pwm_bulk_validates_before_writing(mock_i2c):
+    pca = PCA9685(i2c=mock_i2c, address=0x40)
+
+    # Channel 16 sorts last: the valid block must not go out before the error
+    with pytest.raises(ValueError):
+        await pca.set_pwm_bulk([(0, 0, 307), (1, 0, 307), (16, 0, 307)])
+
+    mock_i2c.write_i2c_block_data.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_set_pwm_bulk_respects_smbus_block_limit(mock_i2c):
+    pca = PCA9685(i2c=mock_i2c, address=0x40)
+
+    await pca.set_pwm_bulk([(ch, 0, 307) for ch in range(16)])
+
+    calls = mock_i2c.write_i2c_block_data.call_args_list
+    assert len(calls) == 2
+    assert all(len(call.args[2]) <= 32 for call in calls)
+    assert calls[1].args[1] == PCA9685.LED0_ON_L + 4 * PCA9685.MAX_BLOCK_CHANNELS
+
+
+@pytest.mark.asyncio
+async def test_initialize_enables_auto_increment(mock_i2c):
+    pca = PCA9685(i2c=mock_i2c, address=0x40)
+
+    assert await pca.initialize() is True
+
+    first_write = mock_i2c.write_byte_data.call_args_list[0]
+    assert first_write.args == (0x40, PCA9685.MODE1, PCA9685.AI)
+
+
+@pytest.mark.asyncio
+async def test_set_all_pwm_keeps_full_off_bit(mock_i2c):
+    pca = PCA9685(i2c=mock_i2c, address=0x40)
+
+    await pca.set_all_pwm(0, 4096)
+
+    mock_i2c.write_i2c_block_data.assert_called_once_with(
+        0x40, PCA9685.ALL_LED_ON_L, [0x00, 0x00, 0x00, 0x10]
+    )
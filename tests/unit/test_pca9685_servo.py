@@ -1,4 +1,5 @@
 """Unit tests for PCA9685ServoController with Dual Board support."""
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from core.hardware.drivers.pca9685_servo import PCA9685ServoController
@@ -27,10 +28,11 @@ async def test_channel_routing():
     # Test Low Channel (0-15) -> Board 1 (pca_low)
     # Channel 2 -> pca_low channel 2
     await controller.set_angle_async(2, 90)
-    pca_low.set_servo_pulse.assert_called_once()
-    args, _ = pca_low.set_servo_pulse.call_args
+    pca_low.set_pwm_count.assert_called_once()
+    args, _ = pca_low.set_pwm_count.call_args
     assert args[0] == 2
-    pca_high.set_servo_pulse.assert_not_called()
+    assert args[1] == 307
+    pca_high.set_pwm_count.assert_not_called()
     
     # Reset mocks
     pca_low.reset_mock()
@@ -39,10 +41,10 @@ async def test_channel_routing():
     # Test High Channel (16-31) -> Board 0 (pca_high)
     # Channel 18 -> pca_high channel 2 (18-16=2)
     await controller.set_angle_async(18, 90)
-    pca_high.set_servo_pulse.assert_called_once()
-    args, _ = pca_high.set_servo_pulse.call_args
+    pca_high.set_pwm_count.assert_called_once()
+    args, _ = pca_high.set_pwm_count.call_args
     assert args[0] == 2  # 18 - 16 = 2
-    pca_low.set_servo_pulse.assert_not_called()
+    pca_low.set_pwm_count.assert_not_called()
 
 @pytest.mark.asyncio
 async def test_invalid_channels():
@@ -55,3 +57,225 @@ async def test_invalid_channels():
         
     with pytest.raises(ValueError, match="hors limites"):
         await controller.set_angle_async(-1, 90)
+
+@pytest.mark.asyncio
+async def test_set_angles_groups_writes_by_board():
+    pca_low = AsyncMock()
+    pca_high = AsyncMock()
+    pca_low.is_available = MagicMock(return_value=True)
+    pca_high.is_available = MagicMock(return_value=True)
+    
+    controller = PCA9685ServoController(pca_low, pca_high)
+    
+    await controller.set_angles_async([(0, 90), (1, 0), (17, 180)])
+    
+    # 90° -> 1500µs -> 307, 0° -> 500µs -> 102, 180° -> 2500µs -> 512
+    pca_low.set_pwm_bulk.assert_awaited_once_with([(0, 0, 307), (1, 0, 102)])
+    pca_high.set_pwm_bulk.assert_awaited_once_with([(1, 0, 512)])
+    assert controller.get_angle(0) == 90
+    assert controller.get_angle(17) == 180
+
+@pytest.mark.asyncio
+async def test_set_angles_validates_before_writing():
+    pca_low = AsyncMock()
+    pca_high = AsyncMock()
+    pca_low.is_available = MagicMock(return_value=True)
+    pca_high.is_available = MagicMock(return_value=True)
+    
+    controller = PCA9685ServoController(pca_low, pca_high)
+    
+    with pytest.raises(ValueError, match="hors limites"):
+        await controller.set_angles_async([(0, 90), (1, 200)])
+    
+    pca_low.set_pwm_bulk.assert_not_called()
+    assert controller.get_angle(0) is None
+
+def test_sync_wrappers_share_one_event_loop():
+    pca_low = AsyncMock()
+    pca_high = AsyncMock()
+    pca_low.is_available = MagicMock(return_value=True)
+    pca_high.is_available = MagicMock(return_value=True)
+    
+    controller = PCA9685ServoController(pca_low, pca_high)
+    loops = set()
+    
+    async def record_loop(*args):
+        loops.add(asyncio.get_running_loop())
+    
+    pca_low.set_pwm_count.side_effect = record_loop
+    
+    controller.set_angle(0, 45)
+    controller.set_angle(1, 135)
+    
+    assert pca_low.set_pwm_count.await_count == 2
+    assert len(loops) == 1
+    assert controller.get_angle(1) == 135
+
+def test_sync_wrapper_propagates_errors():
+    pca_low = AsyncMock()
+    pca_high = AsyncMock()
+    pca_low.is_available = MagicMock(return_value=True)
+    pca_high.is_available = MagicMock(return_value=True)
+    
+    controller = PCA9685ServoController(pca_low, pca_high)
+    
+    with pytest.raises(ValueError, match="hors limites"):
+        controller.set_angle(40, 90)
+
+def test_angle_lookup_table_matches_float_conversion():
+    controller = PCA9685ServoController(AsyncMock(), AsyncMock())
+    
+    assert len(controller._angle_to_count) == 181
+    for angle in (0, 1, 45, 90, 179, 180):
+        expected = int(controller._angle_to_pulse(angle) * (4096 / 20000.0))
+        assert controller._angle_to_count[angle] == expected
+
+@pytest.mark.asyncio
+async def test_unchanged_angle_skips_write():
+    pca_low = AsyncMock()
+    pca_high = AsyncMock()
+    pca_low.is_available = MagicMock(return_value=True)
+    pca_high.is_available = MagicMock(return_value=True)
+    
+    controller = PCA9685ServoController(pca_low, pca_high)
+    
+    await controller.set_angle_async(3, 60)
+    await controller.set_angle_async(3, 60)
+    assert pca_low.set_pwm_count.await_count == 1
+    
+    await controller.set_angle_async(3, 60, force=True)
+    assert pca_low.set_pwm_count.await_count == 2
+    
+    await controller.set_angles_async([(3, 60), (4, 120)])
+    pca_low.set_pwm_bulk.assert_awaited_once_with([(4, 0, controller._angle_to_count[120])])
+    
+    await controller.relax()
+    await controller.set_angle_async(3, 60)
+    assert pca_low.set_pwm_count.await_count == 3
+    
+    # Un angle non entier n'est jamais confondu avec sa troncature en cache
+    await controller.set_angle_async(5, 45.7)
+    await controller.set_angle_async(5, 45)
+    assert pca_low.set_pwm_count.await_count == 5
+    await controller.set_angles_async([(6, 30.5)])
+    await controller.set_angles_async([(6, 30)])
+    assert pca_low.set_pwm_bulk.await_count == 3
+    assert controller.get_angle(5) == 45
+    assert controller.get_angle(6) == 30
+
+@pytest.mark.asyncio
+async def test_current_angles_track_only_commanded_channels():
+    pca_low = AsyncMock()
+    pca_high = AsyncMock()
+    pca_low.is_available = MagicMock(return_value=True)
+    pca_high.is_available = MagicMock(return_value=True)
+    pca_low.get_status = MagicMock(return_value={})
+    pca_high.get_status = MagicMock(return_value={})
+    
+    controller = PCA9685ServoController(pca_low, pca_high)
+    
+    assert controller.get_angle(0) is None
+    await controller.set_angle_async(0, 0)
+    await controller.set_angles_async([(31, 180)])
+    
+    assert controller.get_angle(0) == 0
+    assert controller.get_angle(31) == 180
+    assert controller.get_angle(40) is None
+    assert controller.get_status(include_angles=True)["current_angles"] == {0: 0, 31: 180}
+
+@pytest.mark.asyncio
+async def test_raw_pwm_invalidates_cached_angle():
+    pca_low = AsyncMock()
+    pca_high = AsyncMock()
+    pca_low.is_available = MagicMock(return_value=True)
+    pca_high.is_available = MagicMock(return_value=True)
+    pca_low.get_status = MagicMock(return_value={})
+    pca_high.get_status = MagicMock(return_value={})
+    
+    controller = PCA9685ServoController(pca_low, pca_high)
+    
+    pulse = controller._angle_to_pulse(90)
+    await controller.set_pwm_async(2, pulse)
+    # Angle estimé pour le statut uniquement
+    assert controller.get_angle(2) == controller._pulse_to_angle(pulse)
+    assert controller.get_status(include_angles=True)["current_angles"] == {
+        2: controller._pulse_to_angle(pulse)
+    }
+    
+    # Le set_angle suivant écrit malgré l'estimation identique
+    await controller.set_angle_async(2, controller._pulse_to_angle(pulse))
+    assert pca_low.set_pwm_count.await_count == 2
+    
+    await controller.relax()
+    assert controller.get_angle(0) is None
+    assert controller.get_status(include_angles=True)["current_angles"] == {}
+
+@pytest.mark.asyncio
+async def test_reset_uses_all_led_broadcast():
+    pca_low = AsyncMock()
+    pca_high = AsyncMock()
+    pca_low.is_available = MagicMock(return_value=True)
+    pca_high.is_available = MagicMock(return_value=True)
+    
+    controller = PCA9685ServoController(pca_low, pca_high)
+    
+    await controller.reset_async()
+    
+    pca_low.set_all_pwm.assert_awaited_once_with(0, 307)
+    pca_high.set_all_pwm.assert_awaited_once_with(0, 307)
+    pca_low.set_pwm_count.assert_not_called()
+    assert controller.get_angle(0) == 90
+    assert controller.get_angle(31) == 90
+
+def test_set_angle_sync_writes_without_event_loop():
+    pca_low = MagicMock()
+    pca_high = MagicMock()
+    pca_low.is_available.return_value = True
+    pca_high.is_available.return_value = True
+    
+    controller = PCA9685ServoController(pca_low, pca_high)
+    
+    controller.set_angle_sync(20, 180)
+    controller.set_angle_sync(20, 180)
+    
+    pca_high.set_pwm_sync.assert_called_once_with(4, 0, 512)
+    pca_low.set_pwm_sync.assert_not_called()
+    assert controller.get_angle(20) == 180
+
+@pytest.mark.asyncio
+async def test_queued_angles_are_coalesced_into_one_batch():
+    pca_low = AsyncMock()
+    pca_high = AsyncMock()
+    pca_low.is_available = MagicMock(return_value=True)
+    pca_high.is_available = MagicMock(return_value=True)
+    
+    controller = PCA9685ServoController(pca_low, pca_high)
+    controller.start_writer()
+    
+    controller.queue_angle(0, 10)
+    controller.queue_angle(0, 90)  # overwrites the first target
+    controller.queue_angle(1, 0)
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    
+    pca_low.set_pwm_bulk.assert_awaited_once_with([(0, 0, 307), (1, 0, 102)])
+    assert controller.get_angle(0) == 90
+    
+    await controller.stop_writer()
+
+@pytest.mark.asyncio
+async def test_queue_angle_rounds_float_targets():
+    pca_low = AsyncMock()
+    pca_high = AsyncMock()
+    controller = PCA9685ServoController(pca_low, pca_high)
+    controller.start_writer()
+    
+    controller.queue_angle(0, 89.6)
+    with pytest.raises(ValueError):
+        controller.queue_angle(1, 180.5)
+    await controller.flush()
+    
+    pca_low.set_pwm_bulk.assert_awaited_once_with([(0, 0, 307)])
+    assert controller.get_angle(0) == 90
+    
+    await controller.stop_writer()
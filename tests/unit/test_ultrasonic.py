@@ -1,6 +1,7 @@
 """Tests for ultrasonic sensor."""
 import pytest
 import asyncio
+import itertools
 from unittest.mock import Mock, patch, AsyncMock
 
 @pytest.fixture
@@ -117,3 +118,155 @@ async def test_continuous_monitoring(sensor):
             pass
 
     assert results == [10.0, 11.0]
+
+async def test_measure_distance_rejects_outliers():
+    """The median drops a spurious reflection among the samples."""
+    from core.hardware.drivers.ultrasonic import UltrasonicSensor
+    s = UltrasonicSensor()
+    with patch.object(s, 'get_distance', new=AsyncMock(side_effect=[20.0, 21.0, 19.0, 80.0, 0.0])):
+        assert await s.measure_distance(samples=5, interval=0) == 20.0
+
+async def test_obstacle_detection_exits_early_on_close_ping():
+    """A ping under half the threshold short-circuits the remaining samples."""
+    from core.hardware.drivers.ultrasonic import UltrasonicSensor
+    s = UltrasonicSensor()
+    with patch.object(s, 'get_distance', new=AsyncMock(side_effect=[5.0, 50.0, 50.0])) as mock_read:
+        assert await s.is_obstacle_detected(threshold_cm=20.0, interval=0) is True
+        assert mock_read.call_count == 1
+
+async def test_continuous_monitoring_overlaps_measure_and_callback():
+    """The next measurement runs while the callback is still busy."""
+    from core.hardware.drivers.ultrasonic import UltrasonicSensor
+    s = UltrasonicSensor()
+    results = []
+    measured = asyncio.Event()
+    values = itertools.count(10.0)
+
+    async def measure(samples=1):
+        value = next(values)
+        if value == 11.0:
+            measured.set()
+        return value
+
+    async def callback(distance):
+        results.append(distance)
+        if len(results) == 1:
+            # Second sample is taken before this callback returns
+            await asyncio.wait_for(measured.wait(), timeout=1)
+        if len(results) >= 2:
+            raise asyncio.CancelledError
+
+    with patch.object(s, 'measure_distance', new=measure):
+        with pytest.raises(asyncio.CancelledError):
+            await s.continuous_monitoring(callback, interval=0)
+
+    # The callback only ever sees fresh samples (older ones are dropped)
+    assert results[0] == 10.0
+    assert results[1] > 10.0
+
+def test_init_device_prefers_first_available_factory(mocker, monkeypatch):
+    """Without an explicit pin factory, the preferred one is forced first."""
+    from gpiozero import Device
+    from core.hardware.drivers import ultrasonic
+    monkeypatch.delenv("GPIOZERO_PIN_FACTORY", raising=False)
+    monkeypatch.setattr(Device, "pin_factory", None)
+    preferred = Mock(name="LGPIOFactory")
+    mocker.patch.object(ultrasonic, "_available_factories", return_value=(("lgpio", preferred),))
+    s = ultrasonic.UltrasonicSensor()
+    mocker.patch.object(s, "_make_sensor", return_value=Mock())
+
+    s._init_device()
+
+    assert Device.pin_factory is preferred.return_value
+    s._make_sensor.assert_called_once()
+
+def test_init_device_closes_factory_that_fails(mocker, monkeypatch):
+    """A factory whose sensor can't be created is closed before the next one."""
+    from gpiozero import Device
+    from core.hardware.drivers import ultrasonic
+    monkeypatch.delenv("GPIOZERO_PIN_FACTORY", raising=False)
+    monkeypatch.setattr(Device, "pin_factory", None)
+    lgpio, rpigpio = Mock(name="LGPIOFactory"), Mock(name="RPiGPIOFactory")
+    mocker.patch.object(
+        ultrasonic, "_preferred_factories",
+        return_value=(("lgpio", lgpio), ("rpigpio", rpigpio)),
+    )
+    s = ultrasonic.UltrasonicSensor()
+    mocker.patch.object(s, "_make_sensor", side_effect=[OSError("busy"), Mock()])
+
+    s._init_device()
+
+    lgpio.return_value.close.assert_called_once()
+    rpigpio.return_value.close.assert_not_called()
+    assert Device.pin_factory is rpigpio.return_value
+
+def test_init_device_prefers_pigpio_when_daemon_reachable(mocker, monkeypatch):
+    """pigpio jumps ahead of lgpio only while pigpiod answers."""
+    from gpiozero import Device
+    from core.hardware.drivers import ultrasonic
+    monkeypatch.delenv("GPIOZERO_PIN_FACTORY", raising=False)
+    monkeypatch.setattr(Device, "pin_factory", None)
+    lgpio, pigpio = Mock(name="LGPIOFactory"), Mock(name="PiGPIOFactory")
+    mocker.patch.object(
+        ultrasonic, "_available_factories",
+        return_value=(("lgpio", lgpio), ("pigpio", pigpio)),
+    )
+    reachable = mocker.patch.object(ultrasonic, "_pigpiod_reachable", return_value=True)
+    s = ultrasonic.UltrasonicSensor()
+    mocker.patch.object(s, "_make_sensor", return_value=Mock())
+
+    s._init_device()
+    assert Device.pin_factory is pigpio.return_value
+
+    reachable.return_value = False
+    Device.pin_factory = None
+    s._init_device()
+    assert Device.pin_factory is lgpio.return_value
+
+
+async def test_device_sensor_returns_none_without_echo(mocker):
+    """The RPi.GPIO device driver reports a missing echo as None, not 0 cm."""
+    from core.hardware.devices import ultrasonic
+    gpio = mocker.patch.object(ultrasonic, "GPIO", create=True)
+    mocker.patch.object(ultrasonic, "GPIO_AVAILABLE", True)
+    s = ultrasonic.UltrasonicSensor(trigger_pin=16, echo_pin=18, use_pigpio=False)
+    mocker.patch.object(ultrasonic.time, "sleep")
+    assert await s.initialize()
+
+    assert s.get_distance(timeout=0.01) is None
+    assert s.get_status()["backend"] == "RPi.GPIO"
+    gpio.add_event_detect.assert_called_once_with(18, gpio.BOTH, callback=s._on_gpio_edge)
+    gpio.output.assert_any_call(16, gpio.HIGH)
+    gpio.output.assert_called_with(16, gpio.LOW)
+
+    await s.cleanup()
+    gpio.remove_event_detect.assert_called_once_with(18)
+
+
+async def test_device_sensor_times_echo_at_the_edges(mocker):
+    """Both echo edges are timestamped in the callback, not after a wait returns."""
+    from core.hardware.devices import ultrasonic
+    gpio = mocker.patch.object(ultrasonic, "GPIO", create=True)
+    mocker.patch.object(ultrasonic, "GPIO_AVAILABLE", True)
+    mocker.patch.object(ultrasonic.time, "sleep")
+    clock = [0]
+
+    def monotonic_ns():
+        clock[0] += 5_000
+        return clock[0]
+
+    mocker.patch.object(ultrasonic.time, "monotonic_ns", side_effect=monotonic_ns)
+    s = ultrasonic.UltrasonicSensor(trigger_pin=16, echo_pin=18, use_pigpio=False)
+    assert await s.initialize()
+
+    def output(pin, level):
+        # Echo of ~583 µs (10 cm) once the trigger pulse ends
+        if level is gpio.LOW:
+            s._on_gpio_edge(18)
+            clock[0] += 578_000
+            s._on_gpio_edge(18)
+
+    gpio.output.side_effect = output
+    distance = s.get_distance(timeout=0.01)
+    assert abs(distance - 10.0) < 0.01
+    assert s.get_status()["last_distance"] == distance